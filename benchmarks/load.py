@@ -0,0 +1,195 @@
+"""
+Load tests for :class:`pyvainglory.client.Client` and :class:`pyvainglory.asyncclient.AsyncClient`
+against :class:`benchmarks.server.MockServer`, run from the repository root with::
+
+    python -m benchmarks.load --requests 1000 --concurrency 16 --latency 0.02
+    python -m benchmarks.load match players --clients async --rate-limit 600 --output load.json
+
+Every scenario reports requests per second, p50/p99 latency per call and failures by exception class.
+"""
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import platform
+import datetime
+import statistics
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pyvainglory.client import Client
+from pyvainglory.asyncclient import AsyncClient
+from pyvainglory.retry import RetryPolicy
+from pyvainglory.ratelimit import RateLimiter
+
+from .server import MockServer
+
+_time_format = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _scenarios(server, rng):
+    """
+    Scenario name -> function building the (method name, args, kwargs) of a random call.
+    """
+    match_ids = [data['id'] for _, data, _ in server.matches]
+    player_ids = list(server.players)
+    start = server.matches[0][0]
+    span = (server.matches[-1][0] - start).total_seconds()
+
+    def matches():
+        after = start + datetime.timedelta(seconds=rng.uniform(0, span))
+        return 'get_matches', (), {'region': 'na', 'limit': 50, 'after': after.strftime(_time_format),
+                                   'before': (after + datetime.timedelta(hours=6)).strftime(_time_format)}
+    return {
+        'status': lambda: ('get_status', (), {}),
+        'match': lambda: ('match_by_id', (rng.choice(match_ids), 'na'), {}),
+        'matches': matches,
+        'players': lambda: ('get_players', ('na',), {'playerids': rng.sample(player_ids, 6)}),
+    }
+
+
+def _summary(latencies, failures, elapsed):
+    latencies = sorted(latencies)
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else None
+    return {
+        'requests': len(latencies) + sum(failures.values()),
+        'succeeded': len(latencies),
+        'failures': failures,
+        'seconds': elapsed,
+        'rps': (len(latencies) + sum(failures.values())) / elapsed,
+        'mean': statistics.mean(latencies) if latencies else None,
+        'p50': percentile(0.50),
+        'p99': percentile(0.99)
+    }
+
+
+def _client_kwargs(args):
+    kwargs = {}
+    if args.retry:
+        kwargs['retry_policy'] = RetryPolicy(max_attempts=args.retry, backoff=0.05, max_backoff=1.0)
+    if args.rate_limit:
+        kwargs['rate_limiter'] = RateLimiter(limit=args.rate_limit)
+    return kwargs
+
+
+def run_sync(server, scenario, args):
+    """
+    Send `args.requests` calls from `args.concurrency` threads sharing one :class:`pyvainglory.client.Client`.
+    """
+    client = server.configure(Client('load-test', **_client_kwargs(args)))
+    calls = _scenarios(server, random.Random(args.seed))[scenario]
+    latencies, failures = [], {}
+
+    def call(_):
+        name, call_args, call_kwargs = calls()
+        started = time.perf_counter()
+        try:
+            getattr(client, name)(*call_args, **call_kwargs)
+        except Exception as exc:
+            failures[type(exc).__name__] = failures.get(type(exc).__name__, 0) + 1
+        else:
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        list(pool.map(call, range(args.requests)))
+    elapsed = time.perf_counter() - started
+    client.session.close()
+    return _summary(latencies, failures, elapsed)
+
+
+async def run_async(server, scenario, args):
+    """
+    Send `args.requests` calls from `args.concurrency` tasks sharing one
+    :class:`pyvainglory.asyncclient.AsyncClient`.
+    """
+    client = server.configure(AsyncClient('load-test', coalesce=False, **_client_kwargs(args)))
+    calls = _scenarios(server, random.Random(args.seed))[scenario]
+    latencies, failures = [], {}
+    remaining = iter(range(args.requests))
+
+    async def worker():
+        for _ in remaining:
+            name, call_args, call_kwargs = calls()
+            started = time.perf_counter()
+            try:
+                await getattr(client, name)(*call_args, **call_kwargs)
+            except Exception as exc:
+                failures[type(exc).__name__] = failures.get(type(exc).__name__, 0) + 1
+            else:
+                latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    await client.session.close()
+    return _summary(latencies, failures, elapsed)
+
+
+def _server(args):
+    return MockServer(matches=args.matches, latency=args.latency, jitter=args.jitter, rate_limit=args.rate_limit,
+                      error_rate=args.error_rate, seed=args.seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('scenarios', nargs='*', metavar='scenario',
+                        help="Scenarios to run, all of them if none are given: status, match, matches, players.")
+    parser.add_argument('--clients', choices=['sync', 'async', 'both'], default='both')
+    parser.add_argument('--requests', type=int, default=500, help="Calls per scenario and client.")
+    parser.add_argument('--concurrency', type=int, default=16, help="Threads or tasks sending calls.")
+    parser.add_argument('--matches', type=int, default=500, help="Matches the server has.")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds the server waits before answering.")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Up to this many more seconds, at random.")
+    parser.add_argument('--rate-limit', type=int, help="Requests per minute the server allows, and clients "
+                                                       "use a rate limiter for.")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with a 503.")
+    parser.add_argument('--retry', type=int, default=0, help="Attempts per call, no retries if not provided.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="File to write the results to, as JSON.")
+    args = parser.parse_args(argv)
+    scenarios = args.scenarios or ['status', 'match', 'matches', 'players']
+    for scenario in scenarios:
+        if scenario not in ('status', 'match', 'matches', 'players'):
+            parser.error("unknown scenario '{}'".format(scenario))
+
+    results = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': datetime.datetime.utcnow().strftime(_time_format),
+        'parameters': {name: getattr(args, name) for name in ('requests', 'concurrency', 'matches', 'latency',
+                                                               'jitter', 'rate_limit', 'error_rate', 'retry')},
+        'results': {}
+    }
+    if args.clients in ('sync', 'both'):
+        server = _server(args).start_in_thread()
+        results['results']['sync'] = {scenario: run_sync(server, scenario, args) for scenario in scenarios}
+        server.stop_thread()
+    if args.clients in ('async', 'both'):
+        async def run():
+            server = await _server(args).start()
+            try:
+                return {scenario: await run_async(server, scenario, args) for scenario in scenarios}
+            finally:
+                await server.close()
+        results['results']['async'] = asyncio.run(run())
+
+    for client, scenario_results in results['results'].items():
+        for scenario, summary in scenario_results.items():
+            print("{:<5} {:<8} {:>8.1f} rps  p50 {:>8.2f}ms  p99 {:>8.2f}ms  failures {}".format(
+                client, scenario, summary['rps'], (summary['p50'] or 0) * 1000, (summary['p99'] or 0) * 1000,
+                summary['failures'] or 0), file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
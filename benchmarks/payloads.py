@@ -0,0 +1,262 @@
+"""
+Synthetic Gamelocker API payloads, shaped like real /matches, /players and telemetry responses.
+
+Every generator takes a `seed`, so the same arguments always give the same payload.
+"""
+import uuid
+import random
+import datetime
+
+from pyvainglory import const
+
+actors = ['*Adagio*', '*Alpha*', '*Ardan*', '*Baptiste*', '*Baron*', '*Blackfeather*', '*Catherine*', '*Celeste*',
+          '*Flicker*', '*Fortress*', '*Glaive*', '*Grumpjaw*', '*Gwen*', '*Idris*', '*Joule*', '*Kestrel*',
+          '*Koshka*', '*Krul*', '*Lance*', '*Lyra*', '*Ozo*', '*Petal*', '*Phinn*', '*Reim*', '*Ringo*', '*Rona*',
+          '*Saw*', '*Samuel*', '*Skaarf*', '*Skye*', '*Taka*', '*Vox*']
+
+end_reasons = ['victory', 'surrender']
+
+sides = [('left/blue', 'true'), ('right/red', 'false')]
+
+telemetry_types = ['BuyItem', 'SellItem', 'LearnAbility', 'UseAbility', 'UseItemAbility', 'DealDamage', 'KillActor',
+                   'NPCkillNPC', 'EarnXP', 'GoldFromTowerKill', 'HeroSkinSelect', 'PlayerFirstSpawn']
+
+_time_format = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _uuid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128)))
+
+
+def _item_counts(rng, count, starred=0.5):
+    keys = rng.sample(sorted(const.items), count)
+    return {'*{}*'.format(key) if rng.random() < starred else key: rng.randint(1, 3) for key in keys}
+
+
+def participant(rng, region='na', items=8, player_id=None):
+    """
+    A participant's entry in a match response's 'included', `items` is how many distinct items it bought.
+    """
+    skin_keys = sorted(const.skins)
+    return {
+        'type': 'participant',
+        'id': _uuid(rng),
+        'attributes': {
+            'actor': rng.choice(actors),
+            'shardId': region,
+            'stats': {
+                'assists': rng.randint(0, 20),
+                'crystalMineCaptures': rng.randint(0, 3),
+                'deaths': rng.randint(0, 12),
+                'farm': rng.random() * 150,
+                'firstAfkTime': -1 if rng.random() < 0.95 else 1,
+                'gold': rng.randint(1000, 20000),
+                'goldMineCaptures': rng.randint(0, 3),
+                'itemGrants': _item_counts(rng, items),
+                'itemSells': _item_counts(rng, max(1, items // 4)),
+                'itemUses': _item_counts(rng, max(1, items // 4)),
+                'items': [const.items[key] for key in rng.sample(sorted(const.items), 6)],
+                'jungleKills': rng.randint(0, 60),
+                'kills': rng.randint(0, 15),
+                'krakenCaptures': rng.randint(0, 2),
+                'minionKills': rng.randint(0, 250),
+                'nonJungleMinionKills': rng.randint(0, 250),
+                'skillTier': rng.randint(0, 29),
+                'skinKey': rng.choice(skin_keys),
+                'turretCaptures': rng.randint(0, 5),
+                'wentAfk': False,
+                'winner': True
+            }
+        },
+        'relationships': {
+            'player': {'data': {'type': 'player', 'id': player_id or _uuid(rng)}}
+        }
+    }
+
+
+def match(rng, region='na', participants=3, items=8, created_at=None, players=None):
+    """
+    A match and everything it references, as (match, included).
+
+    Parameters
+    ----------
+    participants : int
+        Participants per roster.
+    items : int
+        Distinct items bought per participant.
+    created_at : Optional[datetime.datetime]
+    players : Optional[list(str)]
+        Player IDs to draw participants' players from, so players repeat across matches.
+    """
+    included = []
+    rosters = []
+    for side, won in sides:
+        members = [participant(rng, region, items, rng.choice(players) if players else None)
+                   for _ in range(participants)]
+        roster_id = _uuid(rng)
+        included.extend(members)
+        included.append({
+            'type': 'roster',
+            'id': roster_id,
+            'attributes': {
+                'shardId': region,
+                'won': won,
+                'stats': {
+                    'acesEarned': rng.randint(0, 3),
+                    'gold': rng.randint(20000, 60000),
+                    'heroKills': rng.randint(0, 40),
+                    'krakenCaptures': rng.randint(0, 2),
+                    'side': side,
+                    'turretKills': rng.randint(0, 5),
+                    'turretsRemaining': rng.randint(0, 5)
+                }
+            },
+            'relationships': {
+                'participants': {'data': [{'type': 'participant', 'id': member['id']} for member in members]},
+                'team': {'data': None}
+            }
+        })
+        rosters.append({'type': 'roster', 'id': roster_id})
+    asset_id = _uuid(rng)
+    included.append({
+        'type': 'asset',
+        'id': asset_id,
+        'attributes': {
+            'URL': 'https://gl-prod-us-east-1.s3.amazonaws.com/assets/semc-vainglory/{}/telemetry.json'.format(
+                asset_id),
+            'contentType': 'application/json',
+            'name': 'telemetry'
+        }
+    })
+    created_at = created_at or datetime.datetime(2018, 1, 1) + datetime.timedelta(seconds=rng.randint(0, 86400 * 30))
+    data = {
+        'type': 'match',
+        'id': _uuid(rng),
+        'attributes': {
+            'createdAt': created_at.strftime(_time_format),
+            'duration': rng.randint(900, 2400),
+            'gameMode': rng.choice(['ranked', 'casual', 'blitz_pvp_ranked']),
+            'patchVersion': rng.choice(['2.10', '2.11', '2.12']),
+            'shardId': region,
+            'stats': {'endGameReason': rng.choice(end_reasons), 'queue': 'ranked'}
+        },
+        'relationships': {
+            'assets': {'data': [{'type': 'asset', 'id': asset_id}]},
+            'rosters': {'data': rosters},
+            'spectators': {'data': []}
+        }
+    }
+    return data, included
+
+
+def match_response(region='na', participants=3, items=8, seed=0):
+    """
+    A /matches/{id} response.
+    """
+    data, included = match(random.Random(seed), region, participants, items)
+    return {'data': data, 'included': included, 'links': {'self': 'https://api.dc01.gamelockerapp.com/shards/{}/'
+                                                                  'matches/{}'.format(region, data['id'])}}
+
+
+def matches_page(matches=50, region='na', participants=3, items=8, players=None, offset=0, seed=0,
+                 base_url='https://api.dc01.gamelockerapp.com/shards/{}/matches'):
+    """
+    A /matches response, with `links` to the previous and next pages.
+
+    Parameters
+    ----------
+    matches : int
+        Matches on the page.
+    players : Optional[int]
+        Size of the pool of players participants are drawn from, every participant is a new player if not provided.
+    """
+    rng = random.Random(seed)
+    pool = [_uuid(rng) for _ in range(players)] if players else None
+    data, included = [], []
+    for _ in range(matches):
+        match_data, match_included = match(rng, region, participants, items, players=pool)
+        data.append(match_data)
+        included.extend(match_included)
+    url = base_url.format(region)
+    links = {
+        'self': '{}?page[offset]={}&page[limit]={}'.format(url, offset, matches),
+        'first': '{}?page[offset]=0&page[limit]={}'.format(url, matches),
+        'next': '{}?page[offset]={}&page[limit]={}'.format(url, offset + matches, matches)
+    }
+    if offset:
+        links['prev'] = '{}?page[offset]={}&page[limit]={}'.format(url, max(0, offset - matches), matches)
+    return {'data': data, 'included': included, 'links': links, 'meta': {}}
+
+
+def player(rng, region='na', name=None, player_id=None):
+    """
+    A player from a /players response.
+    """
+    stats = {'elo_earned_season_{}'.format(season): rng.random() * 2000 for season in range(4, 10)}
+    stats.update({
+        'gamesPlayed': {'aral': rng.randint(0, 500), 'blitz': rng.randint(0, 500), 'blitz_rounds': rng.randint(0, 50),
+                        'casual': rng.randint(0, 2000), 'ranked': rng.randint(0, 2000)},
+        'guildTag': '',
+        'karmaLevel': rng.randint(0, 2),
+        'level': rng.randint(1, 50),
+        'lifetimeGold': rng.random() * 1e6,
+        'lossStreak': rng.randint(0, 5),
+        'rankPoints': {'blitz': rng.random() * 3000, 'ranked': rng.random() * 3000},
+        'skillTier': rng.randint(0, 29),
+        'winStreak': rng.randint(0, 5),
+        'wins': rng.randint(0, 3000),
+        'xp': rng.randint(0, 500000)
+    })
+    return {
+        'type': 'player',
+        'id': player_id or _uuid(rng),
+        'attributes': {
+            'name': name or 'player{}'.format(rng.randint(0, 10 ** 6)),
+            'patchVersion': '2.11',
+            'shardId': region,
+            'stats': stats,
+            'titleId': 'semc-vainglory'
+        }
+    }
+
+
+def players_response(players=6, region='na', seed=0):
+    """
+    A /players response.
+    """
+    rng = random.Random(seed)
+    return {'data': [player(rng, region) for _ in range(players)],
+            'links': {'self': 'https://api.dc01.gamelockerapp.com/shards/{}/players'.format(region)}}
+
+
+def telemetry(events=20000, seed=0):
+    """
+    A telemetry file's events, one second apart at most, mostly damage and ability events like real matches.
+    """
+    rng = random.Random(seed)
+    start = datetime.datetime(2018, 1, 1)
+    weights = [4, 1, 3, 10, 2, 30, 4, 8, 6, 1, 1, 1]
+    teams = ['Left', 'Right']
+    out = []
+    elapsed = 0.0
+    for event_type in rng.choices(telemetry_types, weights, k=events):
+        elapsed += rng.random()
+        payload = {
+            'Team': rng.choice(teams),
+            'Actor': rng.choice(actors),
+            'Position': [round(rng.uniform(-90, 90), 2), round(rng.uniform(0, 5), 2), round(rng.uniform(-40, 40), 2)]
+        }
+        if event_type in ('BuyItem', 'SellItem'):
+            payload.update(Item=rng.choice(sorted(const.items.values())), Cost=rng.randint(50, 3000),
+                           RemainingGold=rng.randint(0, 5000))
+        elif event_type in ('DealDamage', 'KillActor', 'NPCkillNPC'):
+            payload.update(Target=rng.choice(actors), Damage=rng.randint(1, 800), Dealt=rng.randint(1, 800),
+                           IsHero=rng.randint(0, 1), TargetIsHero=rng.randint(0, 1))
+        elif event_type in ('LearnAbility', 'UseAbility', 'UseItemAbility'):
+            payload.update(Ability='HERO_ABILITY_{}_{}'.format(rng.choice(actors).strip('*').upper(),
+                                                               rng.choice('ABC')), Level=rng.randint(1, 5))
+        else:
+            payload.update(Amount=rng.randint(1, 300))
+        out.append({'time': (start + datetime.timedelta(seconds=elapsed)).strftime("%Y-%m-%dT%H:%M:%S+0000"),
+                    'type': event_type, 'payload': payload})
+    return out
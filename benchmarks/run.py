@@ -0,0 +1,298 @@
+"""
+Offline benchmarks for pyvainglory, run from the repository root with::
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare results.json
+
+Nothing is requested from the API, every payload comes from :mod:`benchmarks.payloads`.
+Results are written as JSON, and comparing against an earlier run prints how much each timing moved.
+"""
+import sys
+import gc
+import json
+import time
+import timeit
+import argparse
+import platform
+import datetime
+import statistics
+import subprocess
+import tracemalloc
+
+from pyvainglory import decoder
+from pyvainglory.client import Client
+from pyvainglory.identity import IdentityMap
+from pyvainglory.models import _index_included, _get_object, Match, MatchPaginator
+from pyvainglory.telemetry import TelemetryParser, Telemetry
+
+from . import payloads
+
+
+def _time(func, number, repeat=5):
+    """
+    Seconds per call, best and median of `repeat` rounds of `number` calls.
+    """
+    times = timeit.repeat(func, number=number, repeat=repeat)
+    return {'seconds': min(times) / number, 'median': statistics.median(times) / number, 'number': number}
+
+
+def _retained(func):
+    """
+    Bytes allocated by `func` that are still alive after it returns, and the peak while it ran,
+    along with what it returned, so it stays alive while measured.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current, peak, result
+
+
+def _decoders():
+    loads = {}
+    for name in ('json', 'ujson', 'orjson'):
+        try:
+            loads[name] = decoder.get_loads(name)
+        except ValueError:
+            pass
+    return loads
+
+
+def _hydration(matches, args, number):
+    page = payloads.matches_page(matches, participants=args.participants, items=args.items)
+    results = {}
+    for lazy in (False, True):
+        def hydrate():
+            included = _index_included(page['included'])
+            return [Match(data, None, included, lazy) for data in page['data']]
+        timing = _time(hydrate, number)
+        timing['per_match'] = timing['seconds'] / matches
+        results['lazy' if lazy else 'eager'] = timing
+
+    # Resolving every included object once, as hydration does, by index and by the old linear scan of the list
+    ids = [item['id'] for item in page['included']]
+
+    def indexed():
+        included = _index_included(page['included'])
+        return [_get_object(included, _id) for _id in ids]
+
+    def linear():
+        return [_get_object(page['included'], _id) for _id in ids]
+    for name, lookup in (('indexed_lookups', indexed), ('linear_lookups', linear)):
+        timing = _time(lookup, number)
+        timing['per_match'] = timing['seconds'] / matches
+        results[name] = timing
+    return results
+
+
+def bench_hydration(args):
+    results = _hydration(args.matches, args, args.number)
+    # The time per match should stay flat as pages grow, if it climbs, hydration scales worse than linearly
+    results['page_sizes'] = {str(size): _hydration(size, args, max(1, args.number * args.matches // size))
+                             for size in args.page_sizes}
+    return results
+
+
+def bench_page_parsing(args):
+    raw = json.dumps(payloads.matches_page(args.matches, participants=args.participants,
+                                           items=args.items)).encode()
+
+    def parse():
+        data = decoder.loads(raw)
+        included = _index_included(data['included'])
+        return MatchPaginator([Match(match, None, included) for match in data['data']], data['links'], None)
+    results = {'page': _time(parse, args.number), 'bytes': len(raw)}
+
+    links = payloads.matches_page(1, offset=50)['links']
+    results['links'] = _time(lambda: MatchPaginator([], links, None), args.number * 1000)
+    return results
+
+
+def bench_match_params(args):
+    client = Client('benchmark')
+    after, before = datetime.datetime(2018, 1, 1), datetime.datetime(2018, 1, 2)
+    names = ['player{}'.format(i) for i in range(6)]
+    return {
+        'datetimes': _time(lambda: client.prepare_match_params(0, 50, after, before, None, names, None),
+                           args.number * 1000),
+        'strings': _time(lambda: client.prepare_match_params(0, 50, '2018-01-01T00:00:00Z', '2018-01-02T00:00:00Z',
+                                                             None, names, None), args.number * 1000)
+    }
+
+
+def bench_decoding(args):
+    page = json.dumps(payloads.matches_page(args.matches, participants=args.participants,
+                                            items=args.items)).encode()
+    players = json.dumps(payloads.players_response()).encode()
+    telemetry = json.dumps(payloads.telemetry(args.events)).encode()
+    results = {'bytes': {'page': len(page), 'players': len(players), 'telemetry': len(telemetry)}}
+    for name, loads in _decoders().items():
+        results[name] = {
+            'page': _time(lambda: loads(page), args.number),
+            'players': _time(lambda: loads(players), args.number * 100),
+            'telemetry': _time(lambda: loads(telemetry), max(1, args.number // 5))
+        }
+    return results
+
+
+def bench_telemetry(args):
+    raw = json.dumps(payloads.telemetry(args.events)).encode()
+    events = decoder.loads(raw)
+    chunk = 65536
+
+    def stream():
+        parser = TelemetryParser()
+        count = 0
+        for start in range(0, len(raw), chunk):
+            count += len(parser.feed(raw[start:start + chunk]))
+        return count + len(parser.close())
+    number = max(1, args.number // 5)
+    return {'events': len(events), 'streamed': _time(stream, number),
+            'tables': _time(lambda: Telemetry(events), number)}
+
+
+def _pages(args, pages=5):
+    return [json.dumps(payloads.matches_page(args.matches, participants=args.participants, items=args.items,
+                                             players=args.matches, seed=seed)).encode() for seed in range(pages)]
+
+
+def _crawl(raws, lazy=False, client=None, keep=None):
+    """
+    Decode and build every page's matches, keeping `keep` of each page's matches, all of them if not provided.
+    """
+    matches = []
+    for raw in raws:
+        data = decoder.loads(raw)
+        included = _index_included(data['included'])
+        matches += [Match(match, None, included, lazy, client) for match in data['data']][:keep]
+    return matches
+
+
+def bench_allocations(args):
+    raws = _pages(args)
+    count = args.matches * len(raws)
+    # Warm up lazily loaded catalogs and caches, so they aren't counted as part of the first match
+    _crawl(raws[:1])
+    results = {}
+    # keep is how many of every page's matches the crawl keeps, like a crawler dropping matches after a dedup check
+    for name, lazy, identity, keep in (('eager', False, False, None), ('lazy', True, False, None),
+                                       ('identity_map', False, True, None), ('keep_1_eager', False, False, 1),
+                                       ('keep_1_lazy', True, False, 1)):
+        client = Client('benchmark', identity_map=IdentityMap() if identity else None)
+        current, peak, matches = _retained(lambda: _crawl(raws, lazy, client, keep))
+        results[name] = {'retained_per_match': current / len(matches), 'peak_per_match': peak / count}
+        del matches
+    return results
+
+
+def bench_import(args):
+    results = {}
+    for name, statement in (('package', 'import pyvainglory'), ('client', 'from pyvainglory import Client'),
+                            ('async_client', 'from pyvainglory import AsyncClient')):
+        code = "import time; t = time.perf_counter(); {}; print(time.perf_counter() - t)".format(statement)
+        times = [float(subprocess.check_output([sys.executable, '-c', code])) for _ in range(args.import_runs)]
+        results[name] = {'seconds': min(times), 'median': statistics.median(times), 'number': len(times)}
+    results['budget'] = args.import_budget
+    results['within_budget'] = results['package']['seconds'] <= args.import_budget
+    return results
+
+
+benchmarks = {
+    'hydration': bench_hydration,
+    'page_parsing': bench_page_parsing,
+    'match_params': bench_match_params,
+    'decoding': bench_decoding,
+    'telemetry': bench_telemetry,
+    'allocations': bench_allocations,
+    'import': bench_import
+}
+
+
+def _flatten(results, prefix=''):
+    """
+    Every timing in a results `dict`, keyed by its dotted path.
+    """
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            if 'seconds' in value:
+                flat[prefix + key] = value['seconds']
+                if 'per_match' in value:
+                    flat[prefix + key + '.per_match'] = value['per_match']
+            else:
+                flat.update(_flatten(value, '{}{}.'.format(prefix, key)))
+        elif key.endswith('_per_match'):
+            flat[prefix + key] = value
+    return flat
+
+
+def compare(baseline, results):
+    """
+    Print how every timing and allocation moved from `baseline`, ratios above 1 are regressions.
+    """
+    old, new = _flatten(baseline['results']), _flatten(results['results'])
+    width = max(map(len, new), default=0)
+    for key in sorted(new):
+        if key in old and old[key]:
+            print("{0:<{1}}  {2:>12.6g}  {3:>12.6g}  {4:>6.2f}x".format(key, width, old[key], new[key],
+                                                                       new[key] / old[key]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help="Benchmarks to run, all of them if none are given: {}.".format(', '.join(benchmarks)))
+    parser.add_argument('--matches', type=int, default=50, help="Matches per page.")
+    parser.add_argument('--page-sizes', type=int, nargs='+', default=[10, 50, 200],
+                        help="Matches per page to time hydration with, to see how the time per match scales.")
+    parser.add_argument('--participants', type=int, default=3, help="Participants per roster.")
+    parser.add_argument('--items', type=int, default=8, help="Distinct items bought per participant.")
+    parser.add_argument('--events', type=int, default=20000, help="Events per telemetry file.")
+    parser.add_argument('--number', type=int, default=20, help="Calls per timing round.")
+    parser.add_argument('--import-runs', type=int, default=5)
+    parser.add_argument('--import-budget', type=float, default=0.05,
+                        help="Most seconds 'import pyvainglory' may take, the run fails if it takes longer.")
+    parser.add_argument('--output', help="File to write the results to, as JSON.")
+    parser.add_argument('--compare', help="Results file from an earlier run to compare against.")
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name not in benchmarks:
+            parser.error("unknown benchmark '{}'".format(name))
+
+    results = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'decoder': decoder.name,
+        'date': datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        'parameters': {name: getattr(args, name) for name in ('matches', 'page_sizes', 'participants', 'items',
+                                                               'events', 'number')},
+        'results': {}
+    }
+    for name in args.names or benchmarks:
+        started = time.perf_counter()
+        results['results'][name] = benchmarks[name](args)
+        print("{} done in {:.1f}s".format(name, time.perf_counter() - started), file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=2)
+    if args.compare:
+        with open(args.compare) as fp:
+            compare(json.load(fp), results)
+    elif not args.output:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if 'import' in results['results'] and not results['results']['import']['within_budget']:
+        print("'import pyvainglory' took {:.3f}s, over the {:.3f}s budget".format(
+            results['results']['import']['package']['seconds'], args.import_budget), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""
+An in-process stand-in for the Gamelocker API, built on aiohttp's test server, for end-to-end and load tests.
+
+It serves '/status', '/shards/{region}/matches', '/shards/{region}/matches/{id}', '/shards/{region}/players',
+'/shards/{region}/players/{id}' and telemetry files, from payloads generated by :mod:`benchmarks.payloads`.
+Clients are pointed at it through their `base_url` and `status_url`::
+
+    server = MockServer(latency=0.02, rate_limit=100)
+    server.start_in_thread()
+    client = server.configure(Client('key'))
+"""
+import json
+import time
+import random
+import asyncio
+import datetime
+import threading
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from . import payloads
+
+_time_format = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class MockServer:
+    """
+    A fake Gamelocker API.
+
+    Parameters
+    ----------
+    matches : int
+        Matches to serve, spread over `days` days starting on 2018-01-01.
+    days : int
+    players : int
+        Size of the pool of players participants are drawn from.
+    participants : int
+        Participants per roster.
+    telemetry_events : int
+        Events in the telemetry file every match points to.
+    latency : float
+        Seconds every response is delayed by.
+    jitter : float
+        Up to this many more seconds are added to `latency`, at random.
+    rate_limit : Optional[int]
+        Requests allowed per `period`, answered with 429 past that, every response carries 'X-RateLimit-*' headers.
+        Unlimited if not provided.
+    period : float
+    error_rate : float
+        Share of requests answered with `error_status` instead, at random.
+    error_status : int
+    seed : int
+
+    Attributes
+    ----------
+    requests : dict
+        Route name -> requests received.
+    statuses : dict
+        Status code -> responses sent.
+    """
+    def __init__(self, matches: int=500, days: int=7, players: int=200, participants: int=3,
+                 telemetry_events: int=2000, latency: float=0.0, jitter: float=0.0, rate_limit: int=None,
+                 period: float=60.0, error_rate: float=0.0, error_status: int=503, seed: int=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.period = period
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = {}
+        self.statuses = {}
+        self._rng = random.Random(seed)
+        self._failures = []
+        self._tokens = rate_limit
+        self._window = time.monotonic()
+        self._server = None
+        self._loop = None
+        self._thread = None
+
+        rng = random.Random(seed)
+        pool = [payloads.player(rng) for _ in range(players)]
+        self.players = {player['id']: player for player in pool}
+        self._names = {player['attributes']['name'].lower(): player for player in pool}
+        start = datetime.datetime(2018, 1, 1)
+        self.matches = []
+        self._by_id = {}
+        for _ in range(matches):
+            created_at = start + datetime.timedelta(seconds=rng.randint(0, 86400 * days - 1))
+            data, included = payloads.match(rng, participants=participants, created_at=created_at,
+                                            players=list(self.players))
+            self.matches.append((created_at, data, included))
+            self._by_id[data['id']] = data, included
+        self.matches.sort(key=lambda match: match[0])
+        self._telemetry = json.dumps(payloads.telemetry(telemetry_events, seed)).encode()
+
+    def __repr__(self):
+        return "<MockServer: url={0} matches={1}>".format(self.url, len(self.matches))
+
+    @property
+    def url(self):
+        return str(self._server.make_url('')).rstrip('/') if self._server is not None else None
+
+    @property
+    def base_url(self):
+        return self.url + '/shards/{}/'
+
+    @property
+    def status_url(self):
+        return self.url + '/status'
+
+    def configure(self, client):
+        """
+        Point a client at this server, returns the client.
+        """
+        client.base_url = self.base_url
+        client.status_url = self.status_url
+        return client
+
+    def fail_next(self, count: int=1, status: int=503):
+        """
+        Answer the next `count` requests with `status`, ex: 429 or 500.
+        """
+        self._failures += [status] * count
+
+    def _app(self):
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get('/status', self._status, name='status')
+        app.router.add_get('/shards/{region}/matches', self._matches, name='matches')
+        app.router.add_get('/shards/{region}/matches/{id}', self._match, name='match')
+        app.router.add_get('/shards/{region}/players', self._players, name='players')
+        app.router.add_get('/shards/{region}/players/{id}', self._player, name='player')
+        app.router.add_get('/telemetry/{id}.json', self._telemetry_file, name='telemetry')
+        return app
+
+    async def start(self):
+        """
+        Start serving on a random local port, from the running event loop.
+        """
+        self._server = TestServer(self._app())
+        await self._server.start_server()
+        return self
+
+    async def close(self):
+        await self._server.close()
+
+    def start_in_thread(self):
+        """
+        Start serving from an event loop in a background thread, for synchronous clients.
+        """
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def serve():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.start())
+            ready.set()
+            self._loop.run_forever()
+        self._thread = threading.Thread(target=serve, name='pyvainglory-mock-server', daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def stop_thread(self):
+        """
+        Stop a server started with :meth:`start_in_thread`.
+        """
+        asyncio.run_coroutine_threadsafe(self.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _rate_limit_headers(self):
+        if self.rate_limit is None:
+            return {}, False
+        now = time.monotonic()
+        if now - self._window >= self.period:
+            self._window, self._tokens = now, self.rate_limit
+        limited = self._tokens <= 0
+        self._tokens = max(self._tokens - 1, 0)
+        reset = self.period - (now - self._window)
+        headers = {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': str(self._tokens),
+            # Nanoseconds until the window resets, like the live API
+            'X-RateLimit-Reset': str(int(reset * 1e9))
+        }
+        if limited:
+            headers['Retry-After'] = str(max(1, int(reset + 0.5)))
+        return headers, limited
+
+    @web.middleware
+    async def _middleware(self, request, handler):
+        route = request.match_info.route.name
+        self.requests[route] = self.requests.get(route, 0) + 1
+        delay = self.latency + (self._rng.random() * self.jitter if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        headers, limited = self._rate_limit_headers() if route != 'telemetry' else ({}, False)
+        if self._failures:
+            status = self._failures.pop(0)
+        elif limited:
+            status = 429
+        elif self.error_rate and self._rng.random() < self.error_rate:
+            status = self.error_status
+        else:
+            status = None
+        if status is not None:
+            response = _error(status, 'Injected error' if status != 429 else 'Too Many Requests')
+        else:
+            response = await handler(request)
+        response.headers.update(headers)
+        self.statuses[response.status] = self.statuses.get(response.status, 0) + 1
+        return response
+
+    def _asset(self, included):
+        # Telemetry URLs point back at this server
+        out = []
+        for item in included:
+            if item['type'] == 'asset':
+                item = dict(item, attributes=dict(item['attributes'], URL='{}/telemetry/{}.json'.format(
+                    self.url, item['id'])))
+            out.append(item)
+        return out
+
+    async def _status(self, request):
+        return web.json_response({'data': {'type': 'info', 'id': 'gamelocker',
+                                           'attributes': {'releasedAt': '2018-01-01T00:00:00Z',
+                                                          'version': 'mock'}}})
+
+    async def _matches(self, request):
+        query = request.query
+        try:
+            offset = int(query.get('page[offset]', 0))
+            limit = int(query.get('page[limit]', 5))
+            after = datetime.datetime.strptime(query['filter[createdAt-start]'], _time_format) \
+                if 'filter[createdAt-start]' in query else datetime.datetime.min
+            before = datetime.datetime.strptime(query['filter[createdAt-end]'], _time_format) \
+                if 'filter[createdAt-end]' in query else datetime.datetime.max
+        except ValueError:
+            return _error(400, 'Bad Request')
+        players = set(query.get('filter[playerIds]', '').split(',')) - {''}
+        for name in query.get('filter[playerNames]', '').split(','):
+            if name.lower() in self._names:
+                players.add(self._names[name.lower()]['id'])
+        modes = set(query.get('filter[gameModes]', '').split(',')) - {''}
+
+        selected = [match for match in self.matches if after <= match[0] <= before]
+        if modes:
+            selected = [match for match in selected if match[1]['attributes']['gameMode'] in modes]
+        if players:
+            selected = [match for match in selected if players & {item['relationships']['player']['data']['id']
+                                                                   for item in match[2]
+                                                                   if item['type'] == 'participant'}]
+        if query.get('sort') == '-createdAt':
+            selected.reverse()
+        page = selected[offset:offset + limit]
+        if not page:
+            return _error(404, 'Not Found')
+
+        included = []
+        for _, _, match_included in page:
+            included += self._asset(match_included)
+        links = {
+            'self': str(request.url),
+            'first': str(request.url.update_query({'page[offset]': '0'}))
+        }
+        if offset + limit < len(selected):
+            links['next'] = str(request.url.update_query({'page[offset]': str(offset + limit)}))
+        if offset:
+            links['prev'] = str(request.url.update_query({'page[offset]': str(max(0, offset - limit))}))
+        return web.json_response({'data': [data for _, data, _ in page], 'included': included, 'links': links,
+                                  'meta': {}})
+
+    async def _match(self, request):
+        match = self._by_id.get(request.match_info['id'])
+        if match is None:
+            return _error(404, 'Not Found')
+        data, included = match
+        return web.json_response({'data': data, 'included': self._asset(included),
+                                  'links': {'self': str(request.url)}})
+
+    async def _players(self, request):
+        query = request.query
+        found = [self.players[_id] for _id in query.get('filter[playerIds]', '').split(',') if _id in self.players]
+        found += [self._names[name.lower()] for name in query.get('filter[playerNames]', '').split(',')
+                  if name.lower() in self._names]
+        if not found:
+            return _error(404, 'Not Found')
+        return web.json_response({'data': found, 'links': {'self': str(request.url)}})
+
+    async def _player(self, request):
+        player = self.players.get(request.match_info['id'])
+        if player is None:
+            return _error(404, 'Not Found')
+        return web.json_response({'data': player, 'links': {'self': str(request.url)}})
+
+    async def _telemetry_file(self, request):
+        return web.Response(body=self._telemetry, content_type='application/json')
+
+
+def _error(status, title):
+    return web.json_response({'errors': [{'title': title}]}, status=status)
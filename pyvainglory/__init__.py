@@ -1,2 +1,21 @@
-from .asyncclient import AsyncClient
-from .client import Client
+__all__ = ['AsyncClient', 'Client']
+
+# The clients are imported on first use, so that using one doesn't mean importing the other's
+# HTTP library, aiohttp or requests, along with it
+_clients = {
+    'AsyncClient': '.asyncclient',
+    'Client': '.client'
+}
+
+
+def __getattr__(name):
+    if name in _clients:
+        import importlib
+
+        value = globals()[name] = getattr(importlib.import_module(_clients[name], __name__), name)
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,11 +1,19 @@
+import copy
 import asyncio
 import aiohttp
+import datetime
 
+from . import decoder
 from .clientbase import ClientBase
-from .models import Player, AsyncMatch, AsyncMatchPaginator
+from .models import _index_included, _shared_player, _shared_match, AsyncMatch, AsyncMatchPaginator
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .identity import IdentityMap
+from .metrics import MetricsRegistry
 from .errors import VGRequestException
 from .errors import NotFoundException
 from .errors import VGServerException
+from .errors import RateLimitException
 from .errors import EmptyResponseException
 
 
@@ -20,9 +28,46 @@ class AsyncClient(ClientBase):
     key : str
         The official Vainglory API key.
     session : Optional[requests.Session_]
+    telemetry_cache : Optional[:class:`pyvainglory.cache.TelemetryCache`]
+        An on-disk cache for the telemetry of matches requested through this client.
+    cache : Optional[:class:`pyvainglory.cache.ResponseCache`]
+        A cache for API responses, ex: a :class:`pyvainglory.cache.MemoryCache`.
+    rate_limiter : Optional[:class:`pyvainglory.ratelimit.RateLimiter` or bool]
+        A rate limiter to make requests wait for, `True` to use the one shared by every client using `key`.
+    retry_policy : Optional[:class:`pyvainglory.retry.RetryPolicy` or bool]
+        Decides which failed requests are sent again, `True` to use a default :class:`pyvainglory.retry.RetryPolicy`.
+    coalesce : Optional[bool]
+        Share one request between callers asking for the same URL and parameters, with the same session,
+        while it is still in flight, defaults to `True`. Every caller gets its own copy of the response.
+    json_loads : Optional[callable]
+        The function responses and telemetry are decoded with, ex: `orjson.loads`,
+        defaults to the fastest decoder installed, see :mod:`pyvainglory.decoder`.
+    identity_map : Optional[:class:`pyvainglory.identity.IdentityMap` or bool]
+        Share one object per player and per match between everything requested through this client,
+        `True` to use a default :class:`pyvainglory.identity.IdentityMap`.
+    hooks : Optional[list]
+        Objects notified of every HTTP request, through their `before_request` and `after_request` methods,
+        which are passed a :class:`pyvainglory.metrics.RequestEvent`.
+    metrics : Optional[:class:`pyvainglory.metrics.MetricsRegistry` or bool]
+        A registry recording request latency, sizes, errors, rate limit headroom and match hydration time,
+        `True` to use a new :class:`pyvainglory.metrics.MetricsRegistry`.
     """
-    def __init__(self, key, session: aiohttp.ClientSession=None):
+    def __init__(self, key, session: aiohttp.ClientSession=None, telemetry_cache=None, cache=None,
+                 rate_limiter=None, retry_policy=None, coalesce: bool=True, json_loads=None,
+                 identity_map=None, hooks=None, metrics=None):
         self.session = session or aiohttp.ClientSession()
+        self.telemetry_cache = telemetry_cache
+        self.cache = cache
+        self.rate_limiter = RateLimiter.for_key(key) if rate_limiter is True else rate_limiter
+        self.retry_policy = RetryPolicy() if retry_policy is True else retry_policy
+        self.coalesce = coalesce
+        self.json_loads = json_loads or decoder.loads
+        self.identity_map = IdentityMap() if identity_map is True else identity_map
+        self.metrics = MetricsRegistry() if metrics is True else metrics
+        self.hooks = list(hooks or ())
+        if self.metrics is not None:
+            self.hooks.append(self.metrics)
+        self._inflight = {}
         self.base_url = "https://api.dc01.gamelockerapp.com/shards/{}/"
         self.status_url = "https://api.dc01.gamelockerapp.com/status"
         self.headers = {
@@ -30,24 +75,113 @@ class AsyncClient(ClientBase):
             'Accept': 'application/json'
         }
 
-    async def gen_req(self, url, params=None, session=None):
+    async def gen_req(self, url, params=None, session=None, raw: bool=False):
+        """
+        Request an API URL and decode the response.
+
+        Parameters
+        ----------
+        url : str
+        params : Optional[dict]
+            Query parameters.
+        session : Optional[aiohttp.ClientSession_]
+            Session to send the request with instead of the client's.
+        raw : Optional[bool]
+            Return the response body as undecoded `bytes`, these are not cached.
+
+        Returns
+        -------
+        `dict` or `bytes`
+        """
+        if self.cache is not None and not raw:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                return cached
+
         sess = session or self.session
-        async with sess.get(url, headers=self.headers,
-                            params=params) as req:
+        if not self.coalesce:
+            return await self._send(url, params, sess, raw)
+
+        key = url, tuple(sorted(params.items())) if params else (), raw, sess
+        task = self._inflight.get(key)
+        # Shielded so one caller being cancelled doesn't cancel the request for everyone else waiting on it
+        if task is not None:
+            resp = await asyncio.shield(task)
+            # The caller that sent the request gets the response itself, everyone else a copy they're free to change
+            return resp if raw else copy.deepcopy(resp)
+
+        task = asyncio.ensure_future(self._send(url, params, sess, raw))
+        self._inflight[key] = task
+
+        def _done(_):
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+            # Keep asyncio from warning about an unretrieved exception if every caller was cancelled
+            if not task.cancelled():
+                task.exception()
+        task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _send(self, url, params, sess, raw=False):
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                resp = await req.json()
-            except (asyncio.TimeoutError, aiohttp.ClientResponseError):
-                raise VGRequestException(req, {})
-
+                return await self._request(url, params, sess, attempt, raw)
+            except Exception as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+                if delay:
+                    await asyncio.sleep(delay)
+
+    async def _request(self, url, params, sess, attempt=1, raw=False):
+        delay = self._reserve(attempt)
+        if delay:
+            await asyncio.sleep(delay)
+        event = self._before_request(url, params)
+        try:
+            async with sess.get(url, headers=self.headers,
+                                params=params) as req:
+                if event is not None:
+                    event._response(req.status, req.headers, len(await req.read()))
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(req.headers, req.status)
+                resp = await self._handle_response(req, url, params, raw)
+        except Exception as exc:
+            if event is not None:
+                self._after_request(event, exc)
+            raise
+        if event is not None:
+            self._after_request(event)
+        return resp
+
+    async def _handle_response(self, req, url, params, raw=False):
+        if raw and 300 > req.status >= 200:
+            return await req.read()
+
+        try:
+            body = await req.read()
+            resp = self.json_loads(body)
+        except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
+            # Error pages, ex: from a proxy in front of the API, aren't always json
+            resp = {}
             if 300 > req.status >= 200:
-                return resp
-            elif req.status == 404:
-                raise NotFoundException(req, resp)
-            elif req.status > 500:
-                raise VGServerException(req, resp)
-            else:
                 raise VGRequestException(req, resp)
 
+        if 300 > req.status >= 200:
+            if self.cache is not None:
+                self.cache.set(url, params, resp, len(body))
+            return resp
+        elif req.status == 404:
+            raise NotFoundException(req, resp)
+        elif req.status == 429:
+            raise RateLimitException(req, resp)
+        elif req.status >= 500:
+            raise VGServerException(req, resp)
+        else:
+            raise VGRequestException(req, resp)
+
     async def get_status(self):
         """
         Check if the API is up and running
@@ -59,7 +193,7 @@ class AsyncClient(ClientBase):
         data = await self.gen_req(self.status_url)
         return data['data']['attributes']['releasedAt'], data['data']['attributes']['version']
 
-    async def match_by_id(self, match_id, region: str=None):
+    async def match_by_id(self, match_id, region: str=None, lazy: bool=False):
         """
         Get a Match by its ID.
 
@@ -68,6 +202,8 @@ class AsyncClient(ClientBase):
         match_id : str
         region : str
             The region to look for this match in.
+        lazy : Optional[bool]
+            Only build the match's rosters and spectators when they are first accessed.
 
         Returns
         -------
@@ -76,10 +212,92 @@ class AsyncClient(ClientBase):
         """
         self._region_check(region)
         data = await self.gen_req("{0}matches/{1}".format(self.base_url.format(region), match_id))
-        return AsyncMatch(data, self.session)
+        return _shared_match(AsyncMatch, data, self.session, lazy=lazy, client=self)
+
+    async def _fetch_matches(self, match_ids, region, concurrency, lazy):
+        """
+        Internal async generator yielding (index, match_id, match or exception) as the matches are fetched,
+        by at most `concurrency` requests at a time.
+        """
+        self._region_check(region)
+        ids = enumerate(match_ids)
+        done = object()
+        queue = asyncio.Queue()
+
+        async def worker():
+            try:
+                # Workers share one iterator, so each ID is only handed to one of them
+                for index, match_id in ids:
+                    try:
+                        result = await self.match_by_id(match_id, region, lazy)
+                    except Exception as exc:
+                        result = exc
+                    await queue.put((index, match_id, result))
+            finally:
+                await queue.put(done)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max(1, concurrency))]
+        running = len(workers)
+        try:
+            while running:
+                item = await queue.get()
+                if item is done:
+                    running -= 1
+                else:
+                    yield item
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def iter_matches_by_ids(self, match_ids, region: str=None, concurrency: int=10, lazy: bool=False):
+        """
+        Fetch many matches by their IDs concurrently, yielding each one as soon as it arrives.
+
+        Parameters
+        ----------
+        match_ids : iterable(str)
+        region : str
+            The region to look for these matches in.
+        concurrency : Optional[int]
+            The most requests to have in flight at once.
+        lazy : Optional[bool]
+            Only build each match's rosters and spectators when they are first accessed.
+
+        Yields
+        ------
+        tuple(match_id: str, result: :class:`pyvainglory.models.AsyncMatch` or Exception)
+            In the order the requests complete, failed requests yield the exception they raised.
+        """
+        async for _, match_id, result in self._fetch_matches(match_ids, region, concurrency, lazy):
+            yield match_id, result
+
+    async def matches_by_ids(self, match_ids, region: str=None, concurrency: int=10, lazy: bool=False):
+        """
+        Fetch many matches by their IDs concurrently.
+
+        Parameters
+        ----------
+        match_ids : iterable(str)
+        region : str
+            The region to look for these matches in.
+        concurrency : Optional[int]
+            The most requests to have in flight at once.
+        lazy : Optional[bool]
+            Only build each match's rosters and spectators when they are first accessed.
+
+        Returns
+        -------
+        list
+            A :class:`pyvainglory.models.AsyncMatch` for each ID, in the same order as `match_ids`,
+            or the exception raised while fetching it, so one failure doesn't fail the whole batch.
+        """
+        results = {}
+        async for index, _, result in self._fetch_matches(match_ids, region, concurrency, lazy):
+            results[index] = result
+        return [results[index] for index in range(len(results))]
 
     async def get_matches(self, offset: int=None, limit: int=None, after=None, before=None, playerids: list=None,
-                          playernames: list=None, gamemodes: list=None, region: str=None):
+                          playernames: list=None, gamemodes: list=None, region: str=None, lazy: bool=False):
         """
         Access the /matches endpoint and grab a list of matches
 
@@ -103,6 +321,9 @@ class AsyncClient(ClientBase):
             Filter to to return only matches that match with the gamemodes in the provided list.
         region : str
             The region to look for matches in.
+        lazy : Optional[bool]
+            Only build each match's rosters and spectators when they are first accessed, for when most matches
+            on a page are only checked by their `id`, `created_at` or `game_mode`.
 
         Returns
         -------
@@ -115,10 +336,158 @@ class AsyncClient(ClientBase):
         params = self.prepare_match_params(offset, limit, after, before, playerids, playernames, gamemodes)
 
         data = await self.gen_req("{}matches".format(self.base_url.format(region)), params=params)
+        included = _index_included(data['included'])
         matches = []
         for match in data['data']:
-            matches.append(AsyncMatch(match, self.session, data['included']))
-        return AsyncMatchPaginator(matches, data['links'], self)
+            matches.append(_shared_match(AsyncMatch, match, self.session, included, lazy, self))
+        return AsyncMatchPaginator(matches, data['links'], self, lazy)
+
+    async def iter_matches(self, offset: int=None, limit: int=None, after=None, before=None, playerids: list=None,
+                           playernames: list=None, gamemodes: list=None, region: str=None, lazy: bool=False,
+                           prefetch: int=1, max_buffered: int=None):
+        """
+        Iterate over every match a /matches request returns, across all of its pages, with ``async for``.
+        The next pages are requested in the background while the current one is being iterated over.
+
+        Parameters
+        ----------
+        prefetch : Optional[int]
+            The most pages to have requested ahead of the one being iterated over.
+        max_buffered : Optional[int]
+            Stop requesting pages ahead while at least this many matches are waiting to be iterated over.
+
+        The other parameters are the same as :meth:`get_matches`.
+
+        Yields
+        ------
+        :class:`pyvainglory.models.AsyncMatch`
+        """
+        paginator = await self.get_matches(offset, limit, after, before, playerids, playernames, gamemodes, region,
+                                           lazy)
+        async for match in paginator.iter_all(prefetch, max_buffered):
+            yield match
+
+    async def _crawl_window(self, start, end, region, playerids, playernames, gamemodes, limit, min_window, lazy):
+        try:
+            paginator = await self.get_matches(limit=limit, after=start, before=end, playerids=playerids,
+                                               playernames=playernames, gamemodes=gamemodes, region=region,
+                                               lazy=lazy)
+        except NotFoundException:
+            # No matches in this window
+            return [], []
+        splits = self._crawl_splits(start, end, paginator.matches, min_window) if paginator.next_url else None
+        if splits is not None:
+            # The window holds more than a page, keep this one and split the rest instead of going deeper into it
+            return paginator.matches, splits
+        # Windows that are short enough, or too short to split on whole seconds, are paged through instead
+        return [match async for match in paginator.iter_all()], []
+
+    async def crawl_matches(self, after, before, region: str, playerids: list=None, playernames: list=None,
+                            gamemodes: list=None, windows: int=8, concurrency: int=8, limit: int=50,
+                            min_window: datetime.timedelta=datetime.timedelta(minutes=1), lazy: bool=False):
+        """
+        Get every match in a time range, by splitting it into windows that are requested concurrently.
+
+        A window with more than one page of matches keeps its first page and has the rest of it, after the page's
+        last match, split in half again, until it is as short as `min_window`, after which its pages are
+        gone through one by one.
+
+        Parameters
+        ----------
+        after : str or datetime.datetime_
+            Start of the time range, if an str is provided it should follow the **iso8601** format.
+        before : str or datetime.datetime_
+            End of the time range, if an str is provided it should follow the **iso8601** format.
+        region : str
+            The region to look for matches in.
+        playerids : list(str)
+            Filter to only return matches with provided players in them by looking for their player IDs.
+        playernames : list(str)
+            Filter to only return matches with provided players in them by looking for their playernames.
+        gamemodes : list(str)
+            Filter to to return only matches that match with the gamemodes in the provided list.
+        windows : Optional[int]
+            Number of windows to split the time range into to begin with.
+        concurrency : Optional[int]
+            The most windows to be requesting at once.
+        limit : Optional[int]
+            Number of matches to request per page.
+        min_window : Optional[datetime.timedelta]
+            The shortest a window is split down to.
+        lazy : Optional[bool]
+            Only build each match's rosters and spectators when they are first accessed.
+
+        Returns
+        -------
+        list
+            A list of :class:`pyvainglory.models.AsyncMatch`, without duplicates, sorted by `created_at`.
+        """
+        self._region_check(region)
+        start, end = self._crawl_range(after, before, playerids, playernames, gamemodes)
+        found = {}
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        args = region, playerids, playernames, gamemodes, limit, min_window, lazy
+
+        async def crawl(a, b):
+            async with semaphore:
+                matches, splits = await self._crawl_window(a, b, *args)
+            self._merge_crawl(found, matches)
+            await asyncio.gather(*[crawl(a, b) for a, b in splits])
+
+        await asyncio.gather(*[crawl(a, b) for a, b in self._split_window(start, end, windows)])
+        return sorted(found.values(), key=lambda match: match.created_at)
+
+    async def sync_matches(self, store, region: str, playerids: list=None, playernames: list=None,
+                           gamemodes: list=None, since=None, key: str=None, limit: int=50, lazy: bool=False):
+        """
+        Get only the matches created since the last time the same query was synced.
+
+        The newest `created_at` seen, and the IDs of the matches created at that time, are kept in `store`
+        for each query, so only newer matches are requested and a sync costs as much as the new activity.
+
+        Parameters
+        ----------
+        store : :class:`pyvainglory.watermark.WatermarkStore`
+            Where watermarks are kept, ex: a :class:`pyvainglory.watermark.FileWatermarkStore`.
+        region : str
+            The region to look for matches in.
+        playerids : list(str)
+            Filter to only return matches with provided players in them by looking for their player IDs.
+        playernames : list(str)
+            Filter to only return matches with provided players in them by looking for their playernames.
+        gamemodes : list(str)
+            Filter to to return only matches that match with the gamemodes in the provided list.
+        since : Optional[str or datetime.datetime_]
+            Where to start from the first time a query is synced, defaults to the API's own default.
+        key : Optional[str]
+            Name to store this query's watermark under, defaults to one built from the filters.
+        limit : Optional[int]
+            Number of matches to request per page.
+        lazy : Optional[bool]
+            Only build each match's rosters and spectators when they are first accessed.
+
+        Returns
+        -------
+        list
+            A list of :class:`pyvainglory.models.AsyncMatch` that weren't returned by a previous sync.
+        """
+        self._region_check(region)
+        key = key or self._sync_key(region, playerids, playernames, gamemodes)
+        mark = store.get(key)
+        after = mark['created_at'] if mark else since
+        seen = set(mark['seen']) if mark else set()
+        matches = []
+        try:
+            async for match in self.iter_matches(limit=limit, after=after, playerids=playerids, playernames=playernames,
+                                                 gamemodes=gamemodes, region=region, lazy=lazy):
+                if match.id not in seen:
+                    matches.append(match)
+        except NotFoundException:
+            # Nothing new
+            pass
+        if matches:
+            store.set(key, self._advance_watermark(mark, matches))
+        return matches
 
     async def player_by_id(self, player_id: int, region: str):
         """
@@ -137,7 +506,7 @@ class AsyncClient(ClientBase):
         """
         self._region_check(region)
         data = await self.gen_req("{0}players/{1}".format(self.base_url.format(region), player_id))
-        return Player(data['data'])
+        return _shared_player(data['data'], self.identity_map)
 
     async def _players(self, playerids, usernames, region, single=False):
         self._region_check(region)
@@ -147,9 +516,9 @@ class AsyncClient(ClientBase):
         if len(data['data']) == 0:
             raise EmptyResponseException("No Players with the specified criteria were found.")
         if single:
-            return Player(data['data'][0])
+            return _shared_player(data['data'][0], self.identity_map)
         else:
-            return [Player(player) for player in data['data']]
+            return [_shared_player(player, self.identity_map) for player in data['data']]
 
     async def get_players(self, region: str, playerids: list=None, usernames: list=None):
         """
@@ -175,6 +544,42 @@ class AsyncClient(ClientBase):
         """
         return await self._players(playerids, usernames, region)
 
+    async def _players_batch(self, playerids, usernames, region, semaphore):
+        async with semaphore:
+            try:
+                return await self._players(playerids, usernames, region)
+            except (EmptyResponseException, NotFoundException):
+                return []
+
+    async def get_players_bulk(self, region: str, playerids: list=None, usernames: list=None,
+                               concurrency: int=4):
+        """
+        Get any number of players' info, split into as many requests as needed.
+
+        Parameters
+        ----------
+        region : str
+            The region to look for players in.
+        playerids : list(str)
+            A list of playerids, either a `list` of strs or a `list` of ints.
+        usernames : list(str)
+            A list of usernames, a `list` of strings.
+        concurrency : Optional[int]
+            The most requests to have in flight at once.
+
+        Returns
+        -------
+        tuple(players: list, missing: list)
+            A list of :class:`pyvainglory.models.Player` and a list of the requested IDs and names
+            that weren't found.
+        """
+        self._region_check(region)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        batches = [self._players_batch(ids, None, region, semaphore) for ids in self._chunks(playerids)]
+        batches += [self._players_batch(None, names, region, semaphore) for names in self._chunks(usernames)]
+        results = await asyncio.gather(*batches)
+        return self._merge_players(results, playerids, usernames)
+
     async def player_by_name(self, username: str, region: str):
         """
         Get a player's info by their ingame name.
@@ -0,0 +1,431 @@
+import os
+import re
+import abc
+import gzip
+import time
+import zlib
+import hashlib
+import tempfile
+import threading
+
+from collections import OrderedDict
+
+
+class TelemetryCache:
+    """
+    An opt-in, on-disk cache for match telemetry files, keyed by telemetry URL.
+
+    Telemetry for a finished match never changes, so once downloaded it's kept gzip compressed in `path`.
+    Files are written to a temporary name and atomically moved into place, so several processes can share
+    the same directory, and once the directory grows past `max_size` the least recently used files are removed.
+    Temporary files count towards `max_size` too, and ones left behind by writers that crashed are removed
+    once they are `stale_after` seconds old.
+
+    The directory is only scanned when a commit takes the running size total past `max_size`, or once every
+    `rescan_every` commits, to notice files written by other processes and stale temporary files.
+
+    Parameters
+    ----------
+    path : str
+        Directory to store cached telemetry in, it is created if it doesn't exist.
+    max_size : Optional[int]
+        Maximum total size in bytes of the compressed files, defaults to 1GiB.
+    compresslevel : Optional[int]
+        gzip compression level, 1 through 9.
+    stale_after : Optional[float]
+        Seconds after which an uncommitted temporary file is assumed to be abandoned, defaults to an hour.
+    rescan_every : Optional[int]
+        Number of commits after which the directory is scanned even if the size total is within `max_size`.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that were found in the cache.
+    misses : int
+        Number of lookups that weren't.
+    """
+    __slots__ = ['path', 'max_size', 'compresslevel', 'stale_after', 'rescan_every', 'hits', 'misses', '_size',
+                 '_writes', '_lock']
+
+    suffix = '.json.gz'
+    tmp_suffix = '.tmp'
+    # What reading a corrupt or truncated file raises
+    read_errors = (OSError, EOFError, zlib.error)
+
+    def __init__(self, path, max_size: int=1 << 30, compresslevel: int=6, stale_after: float=3600,
+                 rescan_every: int=100):
+        self.path = path
+        self.max_size = max_size
+        self.compresslevel = compresslevel
+        self.stale_after = stale_after
+        self.rescan_every = rescan_every
+        self.hits = 0
+        self.misses = 0
+        # Running total of the directory's size, None until it has been scanned
+        self._size = None
+        self._writes = 0
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    def __repr__(self):
+        return "<TelemetryCache: path={0.path} hits={0.hits} misses={0.misses}>".format(self)
+
+    def _file(self, url):
+        return os.path.join(self.path, hashlib.sha1(url.encode()).hexdigest() + self.suffix)
+
+    def open(self, url):
+        """
+        Open a cached telemetry file for reading.
+
+        Parameters
+        ----------
+        url : str
+            The match's telemetry URL.
+
+        Returns
+        -------
+        gzip.GzipFile or None
+            A binary file object yielding the decompressed telemetry, or `None` if it isn't cached.
+        """
+        file = self._file(url)
+        try:
+            # Mark it as recently used for eviction
+            os.utime(file)
+            fp = gzip.open(file, 'rb')
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return fp
+
+    def get(self, url):
+        """
+        Get a cached telemetry file's contents.
+
+        Parameters
+        ----------
+        url : str
+            The match's telemetry URL.
+
+        Returns
+        -------
+        bytes or None
+            The decompressed telemetry file, or `None` if it isn't cached.
+        """
+        fp = self.open(url)
+        if fp is None:
+            return None
+        try:
+            with fp:
+                return fp.read()
+        except self.read_errors:
+            self.corrupt(url)
+            return None
+
+    def set(self, url, data: bytes):
+        """
+        Store a telemetry file.
+
+        Parameters
+        ----------
+        url : str
+            The match's telemetry URL.
+        data : bytes
+            The raw telemetry file.
+        """
+        writer = self.writer(url)
+        try:
+            writer.write(data)
+            writer.commit()
+        except BaseException:
+            writer.discard()
+            raise
+
+    def writer(self, url):
+        """
+        Get a :class:`CacheWriter` to store a telemetry file chunk by chunk, as it is being downloaded.
+
+        Parameters
+        ----------
+        url : str
+            The match's telemetry URL.
+
+        Returns
+        -------
+        :class:`CacheWriter`
+        """
+        return CacheWriter(self, self._file(url))
+
+    def discard(self, url):
+        """
+        Remove a telemetry file from the cache, if it is in it.
+        """
+        try:
+            os.remove(self._file(url))
+        except FileNotFoundError:
+            pass
+
+    def corrupt(self, url):
+        """
+        Remove a cached file that turned out to be corrupt or truncated when read, counting its lookup as a miss.
+        """
+        self.discard(url)
+        with self._lock:
+            self.hits -= 1
+            self.misses += 1
+
+    def committed(self, size: int):
+        """
+        Add a newly committed file to the running size total, evicting if it went past `max_size`
+        or the directory is due to be rescanned.
+
+        Parameters
+        ----------
+        size : int
+            Size in bytes of the compressed file.
+        """
+        with self._lock:
+            self._writes += 1
+            if self._size is not None:
+                # Overcounts files that replaced an existing one, which only makes the next scan come sooner
+                self._size += size
+                if self._size <= self.max_size and self._writes < self.rescan_every:
+                    return
+        self.evict()
+
+    def evict(self):
+        """
+        Remove stale temporary files, then the least recently used files until the cache is within `max_size`.
+
+        This scans the whole directory and resets the running size total.
+        """
+        entries = []
+        total = 0
+        now = time.time()
+        with os.scandir(self.path) as it:
+            for entry in it:
+                tmp = entry.name.endswith(self.tmp_suffix)
+                if not tmp and not entry.name.endswith(self.suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if tmp:
+                    if now - stat.st_mtime > self.stale_after:
+                        # Left behind by a writer that crashed before committing or discarding it
+                        try:
+                            os.remove(entry.path)
+                        except FileNotFoundError:
+                            pass
+                    else:
+                        # Still being written, it counts towards the size but can't be evicted
+                        total += stat.st_size
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total > self.max_size:
+            entries.sort()
+            for _, size, file in entries:
+                try:
+                    os.remove(file)
+                except FileNotFoundError:
+                    # Another process got to it first
+                    pass
+                total -= size
+                if total <= self.max_size:
+                    break
+        with self._lock:
+            self._size = total
+            self._writes = 0
+
+
+class CacheWriter:
+    """
+    Writes one telemetry file into a :class:`TelemetryCache`, returned by :meth:`TelemetryCache.writer`.
+
+    Nothing is visible in the cache until :meth:`commit` is called, :meth:`discard` throws the data away.
+    """
+    __slots__ = ['cache', 'file', '_tmp', '_fp']
+
+    def __init__(self, cache, file):
+        self.cache = cache
+        self.file = file
+        fd, self._tmp = tempfile.mkstemp(dir=cache.path, suffix=cache.tmp_suffix)
+        self._fp = gzip.GzipFile(fileobj=os.fdopen(fd, 'wb'), mode='wb', compresslevel=cache.compresslevel)
+
+    def write(self, chunk: bytes):
+        self._fp.write(chunk)
+
+    def commit(self):
+        """
+        Move the written file into place and evict old files if the cache grew too large.
+        """
+        fileobj = self._fp.fileobj
+        self._fp.close()
+        size = fileobj.tell()
+        fileobj.close()
+        os.replace(self._tmp, self.file)
+        self.cache.committed(size)
+
+    def discard(self):
+        fileobj = self._fp.fileobj
+        self._fp.close()
+        fileobj.close()
+        try:
+            os.remove(self._tmp)
+        except FileNotFoundError:
+            pass
+
+
+class ResponseCache(abc.ABC):
+    """
+    Base class for caches of decoded API responses, consulted by the clients' `gen_req` before making a request.
+
+    How long a response is kept for depends on the endpoint it came from, a finished match never changes so
+    /matches/{id} is kept forever, player data is fine to be a little stale so /players is kept for `players_ttl`
+    seconds, and anything else, like /matches listings and /status, isn't cached at all.
+    Subclasses provide the storage by implementing :meth:`load` and :meth:`save`.
+
+    Parameters
+    ----------
+    players_ttl : Optional[float]
+        Seconds to keep /players responses for, defaults to 5 minutes.
+    ttls : Optional[list(tuple(pattern: str, ttl: float))]
+        Extra rules checked before the defaults, the first pattern found in a request URL decides its ttl,
+        `None` meaning forever and 0 not to cache it.
+
+    Attributes
+    ----------
+    hits : int
+        Number of requests answered from the cache.
+    misses : int
+        Number of cacheable requests that had to go to the API.
+    """
+    def __init__(self, players_ttl: float=300, ttls: list=None):
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls or ()]
+        self.ttls.append((re.compile(r'/matches/[^/]+$'), None))
+        self.ttls.append((re.compile(r'/players(/[^/]+)?$'), players_ttl))
+        self.hits = 0
+        self.misses = 0
+
+    def ttl(self, url):
+        for pattern, ttl in self.ttls:
+            if pattern.search(url):
+                return ttl
+        return 0
+
+    @staticmethod
+    def key(url, params=None):
+        return url, tuple(sorted(params.items())) if params else ()
+
+    def get(self, url, params=None):
+        """
+        Look up a response.
+
+        Returns
+        -------
+        dict or None
+            The cached response, `None` if it isn't cached, has expired or the endpoint isn't cacheable.
+        """
+        if self.ttl(url) == 0:
+            return None
+        entry = self.load(self.key(url, params))
+        if entry is not None:
+            data, expires = entry
+            if expires is None or expires > time.monotonic():
+                self.hits += 1
+                return data
+        self.misses += 1
+        return None
+
+    def set(self, url, params, data, size: int):
+        """
+        Store a response, if its endpoint is cacheable.
+
+        Parameters
+        ----------
+        url : str
+        params : dict or None
+        data : dict
+            The decoded response.
+        size : int
+            Size of the raw response in bytes.
+        """
+        ttl = self.ttl(url)
+        if ttl == 0:
+            return
+        expires = None if ttl is None else time.monotonic() + ttl
+        self.save(self.key(url, params), data, size, expires)
+
+    @abc.abstractmethod
+    def load(self, key):
+        """
+        Get a stored entry, as a tuple(data, expires), or `None`.
+        """
+
+    @abc.abstractmethod
+    def save(self, key, data, size, expires):
+        """
+        Store an entry, `expires` is a :func:`time.monotonic` time or `None`.
+        """
+
+
+class MemoryCache(ResponseCache):
+    """
+    An in-memory, least recently used :class:`ResponseCache`, limited by the total size of the cached responses.
+
+    Parameters
+    ----------
+    max_size : Optional[int]
+        Maximum total size in bytes of cached responses, as sent by the API, defaults to 64MiB.
+    players_ttl : Optional[float]
+        Seconds to keep /players responses for, defaults to 5 minutes.
+    ttls : Optional[list(tuple(pattern: str, ttl: float))]
+        Extra rules checked before the defaults, see :class:`ResponseCache`.
+    """
+    def __init__(self, max_size: int=64 << 20, players_ttl: float=300, ttls: list=None):
+        super().__init__(players_ttl, ttls)
+        self.max_size = max_size
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return "<MemoryCache: entries={0} size={1.size} hits={1.hits} misses={1.misses}>".format(len(self), self)
+
+    def load(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            data, size, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                self.size -= size
+                return None
+            self._entries.move_to_end(key)
+            return data, expires
+
+    def save(self, key, data, size, expires):
+        if size > self.max_size:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            self._entries[key] = data, size, expires
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, old_size, _) = self._entries.popitem(last=False)
+                self.size -= old_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -1,10 +1,20 @@
+import time
+import datetime
 import requests
 
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from . import decoder
 from .clientbase import ClientBase
-from .models import Player, Match, MatchPaginator
+from .models import _index_included, _shared_player, _shared_match, Match, MatchPaginator
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .identity import IdentityMap
+from .metrics import MetricsRegistry
 from .errors import VGRequestException
 from .errors import NotFoundException
 from .errors import VGServerException
+from .errors import RateLimitException
 from .errors import EmptyResponseException
 
 
@@ -19,9 +29,41 @@ class Client(ClientBase):
     key : str
         The official Vainglory API key.
     session : Optional[requests.Session_]
+    telemetry_cache : Optional[:class:`pyvainglory.cache.TelemetryCache`]
+        An on-disk cache for the telemetry of matches requested through this client.
+    cache : Optional[:class:`pyvainglory.cache.ResponseCache`]
+        A cache for API responses, ex: a :class:`pyvainglory.cache.MemoryCache`.
+    rate_limiter : Optional[:class:`pyvainglory.ratelimit.RateLimiter` or bool]
+        A rate limiter to make requests wait for, `True` to use the one shared by every client using `key`.
+    retry_policy : Optional[:class:`pyvainglory.retry.RetryPolicy` or bool]
+        Decides which failed requests are sent again, `True` to use a default :class:`pyvainglory.retry.RetryPolicy`.
+    json_loads : Optional[callable]
+        The function responses and telemetry are decoded with, ex: `orjson.loads`,
+        defaults to the fastest decoder installed, see :mod:`pyvainglory.decoder`.
+    identity_map : Optional[:class:`pyvainglory.identity.IdentityMap` or bool]
+        Share one object per player and per match between everything requested through this client,
+        `True` to use a default :class:`pyvainglory.identity.IdentityMap`.
+    hooks : Optional[list]
+        Objects notified of every HTTP request, through their `before_request` and `after_request` methods,
+        which are passed a :class:`pyvainglory.metrics.RequestEvent`.
+    metrics : Optional[:class:`pyvainglory.metrics.MetricsRegistry` or bool]
+        A registry recording request latency, sizes, errors, rate limit headroom and match hydration time,
+        `True` to use a new :class:`pyvainglory.metrics.MetricsRegistry`.
     """
-    def __init__(self, key, session: requests.Session=None):
+    def __init__(self, key, session: requests.Session=None, telemetry_cache=None, cache=None, rate_limiter=None,
+                 retry_policy=None, json_loads=None, identity_map=None, hooks=None,
+                 metrics=None):
         self.session = session or requests.Session()
+        self.telemetry_cache = telemetry_cache
+        self.cache = cache
+        self.rate_limiter = RateLimiter.for_key(key) if rate_limiter is True else rate_limiter
+        self.retry_policy = RetryPolicy() if retry_policy is True else retry_policy
+        self.json_loads = json_loads or decoder.loads
+        self.identity_map = IdentityMap() if identity_map is True else identity_map
+        self.metrics = MetricsRegistry() if metrics is True else metrics
+        self.hooks = list(hooks or ())
+        if self.metrics is not None:
+            self.hooks.append(self.metrics)
         self.base_url = "https://api.dc01.gamelockerapp.com/shards/{}/"
         self.status_url = "https://api.dc01.gamelockerapp.com/status"
         self.headers = {
@@ -29,24 +71,88 @@ class Client(ClientBase):
             'Accept': 'application/json'
         }
 
-    def gen_req(self, url, params=None, session=None):
+    def gen_req(self, url, params=None, session=None, raw: bool=False):
+        """
+        Request an API URL and decode the response.
+
+        Parameters
+        ----------
+        url : str
+        params : Optional[dict]
+            Query parameters.
+        session : Optional[requests.Session_]
+            Session to send the request with instead of the client's.
+        raw : Optional[bool]
+            Return the response body as undecoded `bytes`, these are not cached.
+
+        Returns
+        -------
+        `dict` or `bytes`
+        """
+        if self.cache is not None and not raw:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                return cached
+
         sess = session or self.session
-        with sess.get(url, headers=self.headers,
-                      params=params) as req:
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                resp = req.json()
-            except (requests.Timeout, requests.ConnectionError):
-                raise VGRequestException(req, {})
-
+                return self._request(url, params, sess, attempt, raw)
+            except Exception as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+                if delay:
+                    time.sleep(delay)
+
+    def _request(self, url, params, sess, attempt=1, raw=False):
+        delay = self._reserve(attempt)
+        if delay:
+            time.sleep(delay)
+        event = self._before_request(url, params)
+        try:
+            with sess.get(url, headers=self.headers,
+                          params=params) as req:
+                if event is not None:
+                    event._response(req.status_code, req.headers, len(req.content))
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(req.headers, req.status_code)
+                resp = self._handle_response(req, url, params, raw)
+        except Exception as exc:
+            if event is not None:
+                self._after_request(event, exc)
+            raise
+        if event is not None:
+            self._after_request(event)
+        return resp
+
+    def _handle_response(self, req, url, params, raw=False):
+        if raw and 300 > req.status_code >= 200:
+            return req.content
+
+        try:
+            resp = self.json_loads(req.content)
+        except (requests.Timeout, requests.ConnectionError, ValueError):
+            # Error pages, ex: from a proxy in front of the API, aren't always json
+            resp = {}
             if 300 > req.status_code >= 200:
-                return resp
-            elif req.status_code == 404:
-                raise NotFoundException(req, resp)
-            elif req.status_code > 500:
-                raise VGServerException(req, resp)
-            else:
                 raise VGRequestException(req, resp)
 
+        if 300 > req.status_code >= 200:
+            if self.cache is not None:
+                self.cache.set(url, params, resp, len(req.content))
+            return resp
+        elif req.status_code == 404:
+            raise NotFoundException(req, resp)
+        elif req.status_code == 429:
+            raise RateLimitException(req, resp)
+        elif req.status_code >= 500:
+            raise VGServerException(req, resp)
+        else:
+            raise VGRequestException(req, resp)
+
     def get_status(self):
         """
         Check if the API is up and running
@@ -58,7 +164,7 @@ class Client(ClientBase):
         data = self.gen_req(self.status_url)
         return data['data']['attributes']['releasedAt'], data['data']['attributes']['version']
 
-    def match_by_id(self, match_id, region: str=None):
+    def match_by_id(self, match_id, region: str=None, lazy: bool=False):
         """
         Get a Match by its ID.
 
@@ -67,6 +173,8 @@ class Client(ClientBase):
         match_id : str
         region : str
             The region to look for this match in.
+        lazy : Optional[bool]
+            Only build the match's rosters and spectators when they are first accessed.
 
         Returns
         -------
@@ -75,10 +183,10 @@ class Client(ClientBase):
         """
         self._region_check(region)
         data = self.gen_req("{0}matches/{1}".format(self.base_url.format(region), match_id))
-        return Match(data, self.session)
+        return _shared_match(Match, data, self.session, lazy=lazy, client=self)
 
     def get_matches(self, offset: int=None, limit: int=None, after=None, before=None, playerids: list=None,
-                          playernames: list=None, gamemodes: list=None, region: str=None):
+                          playernames: list=None, gamemodes: list=None, region: str=None, lazy: bool=False):
         """
         Access the /matches endpoint and grab a list of matches
 
@@ -102,6 +210,9 @@ class Client(ClientBase):
             Filter to to return only matches that match with the gamemodes in the provided list.
         region : str
             The region to look for matches in.
+        lazy : Optional[bool]
+            Only build each match's rosters and spectators when they are first accessed, for when most matches
+            on a page are only checked by their `id`, `created_at` or `game_mode`.
 
         Returns
         -------
@@ -114,10 +225,153 @@ class Client(ClientBase):
         params = self.prepare_match_params(offset, limit, after, before, playerids, playernames, gamemodes)
 
         data = self.gen_req("{}matches".format(self.base_url.format(region)), params=params)
+        included = _index_included(data['included'])
         matches = []
         for match in data['data']:
-            matches.append(Match(match, self.session, data['included']))
-        return MatchPaginator(matches, data['links'], self)
+            matches.append(_shared_match(Match, match, self.session, included, lazy, self))
+        return MatchPaginator(matches, data['links'], self, lazy)
+
+    def iter_matches(self, offset: int=None, limit: int=None, after=None, before=None, playerids: list=None,
+                     playernames: list=None, gamemodes: list=None, region: str=None, lazy: bool=False,
+                     prefetch: int=1):
+        """
+        Iterate over every match a /matches request returns, across all of its pages.
+        A worker thread requests and builds the next page while the current one is being iterated over.
+
+        Parameters
+        ----------
+        prefetch : Optional[int]
+            The most pages to have ready ahead of the one being iterated over.
+
+        The other parameters are the same as :meth:`get_matches`.
+
+        Yields
+        ------
+        :class:`pyvainglory.models.Match`
+        """
+        paginator = self.get_matches(offset, limit, after, before, playerids, playernames, gamemodes, region, lazy)
+        yield from paginator.iter_all(prefetch)
+
+    def _crawl_window(self, start, end, region, playerids, playernames, gamemodes, limit, min_window, lazy):
+        try:
+            paginator = self.get_matches(limit=limit, after=start, before=end, playerids=playerids,
+                                         playernames=playernames, gamemodes=gamemodes, region=region, lazy=lazy)
+        except NotFoundException:
+            # No matches in this window
+            return [], []
+        splits = self._crawl_splits(start, end, paginator.matches, min_window) if paginator.next_url else None
+        if splits is not None:
+            # The window holds more than a page, keep this one and split the rest instead of going deeper into it
+            return paginator.matches, splits
+        # Windows that are short enough, or too short to split on whole seconds, are paged through instead
+        return list(paginator.iter_all()), []
+
+    def crawl_matches(self, after, before, region: str, playerids: list=None, playernames: list=None,
+                      gamemodes: list=None, windows: int=8, workers: int=8, limit: int=50,
+                      min_window: datetime.timedelta=datetime.timedelta(minutes=1), lazy: bool=False):
+        """
+        Get every match in a time range, by splitting it into windows that are requested in parallel.
+
+        A window with more than one page of matches keeps its first page and has the rest of it, after the page's
+        last match, split in half again, until it is as short as `min_window`, after which its pages are
+        gone through one by one.
+
+        Parameters
+        ----------
+        after : str or datetime.datetime_
+            Start of the time range, if an str is provided it should follow the **iso8601** format.
+        before : str or datetime.datetime_
+            End of the time range, if an str is provided it should follow the **iso8601** format.
+        region : str
+            The region to look for matches in.
+        playerids : list(str)
+            Filter to only return matches with provided players in them by looking for their player IDs.
+        playernames : list(str)
+            Filter to only return matches with provided players in them by looking for their playernames.
+        gamemodes : list(str)
+            Filter to to return only matches that match with the gamemodes in the provided list.
+        windows : Optional[int]
+            Number of windows to split the time range into to begin with.
+        workers : Optional[int]
+            Number of requests to make at once.
+        limit : Optional[int]
+            Number of matches to request per page.
+        min_window : Optional[datetime.timedelta]
+            The shortest a window is split down to.
+        lazy : Optional[bool]
+            Only build each match's rosters and spectators when they are first accessed.
+
+        Returns
+        -------
+        list
+            A list of :class:`pyvainglory.models.Match`, without duplicates, sorted by `created_at`.
+        """
+        self._region_check(region)
+        start, end = self._crawl_range(after, before, playerids, playernames, gamemodes)
+        found = {}
+        args = region, playerids, playernames, gamemodes, limit, min_window, lazy
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            pending = {pool.submit(self._crawl_window, a, b, *args)
+                       for a, b in self._split_window(start, end, windows)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    matches, splits = future.result()
+                    self._merge_crawl(found, matches)
+                    pending.update(pool.submit(self._crawl_window, a, b, *args) for a, b in splits)
+        return sorted(found.values(), key=lambda match: match.created_at)
+
+    def sync_matches(self, store, region: str, playerids: list=None, playernames: list=None,
+                     gamemodes: list=None, since=None, key: str=None, limit: int=50, lazy: bool=False):
+        """
+        Get only the matches created since the last time the same query was synced.
+
+        The newest `created_at` seen, and the IDs of the matches created at that time, are kept in `store`
+        for each query, so only newer matches are requested and a sync costs as much as the new activity.
+
+        Parameters
+        ----------
+        store : :class:`pyvainglory.watermark.WatermarkStore`
+            Where watermarks are kept, ex: a :class:`pyvainglory.watermark.FileWatermarkStore`.
+        region : str
+            The region to look for matches in.
+        playerids : list(str)
+            Filter to only return matches with provided players in them by looking for their player IDs.
+        playernames : list(str)
+            Filter to only return matches with provided players in them by looking for their playernames.
+        gamemodes : list(str)
+            Filter to to return only matches that match with the gamemodes in the provided list.
+        since : Optional[str or datetime.datetime_]
+            Where to start from the first time a query is synced, defaults to the API's own default.
+        key : Optional[str]
+            Name to store this query's watermark under, defaults to one built from the filters.
+        limit : Optional[int]
+            Number of matches to request per page.
+        lazy : Optional[bool]
+            Only build each match's rosters and spectators when they are first accessed.
+
+        Returns
+        -------
+        list
+            A list of :class:`pyvainglory.models.Match` that weren't returned by a previous sync.
+        """
+        self._region_check(region)
+        key = key or self._sync_key(region, playerids, playernames, gamemodes)
+        mark = store.get(key)
+        after = mark['created_at'] if mark else since
+        seen = set(mark['seen']) if mark else set()
+        matches = []
+        try:
+            for match in self.iter_matches(limit=limit, after=after, playerids=playerids, playernames=playernames,
+                                           gamemodes=gamemodes, region=region, lazy=lazy):
+                if match.id not in seen:
+                    matches.append(match)
+        except NotFoundException:
+            # Nothing new
+            pass
+        if matches:
+            store.set(key, self._advance_watermark(mark, matches))
+        return matches
 
     def player_by_id(self, player_id: int, region: str):
         """
@@ -136,21 +390,19 @@ class Client(ClientBase):
         """
         self._region_check(region)
         data = self.gen_req("{0}players/{1}".format(self.base_url.format(region), player_id))
-        return Player(data['data'])
+        return _shared_player(data['data'], self.identity_map)
 
     def _players(self, playerids, usernames, region, single=False):
         self._region_check(region)
         params = self.prepare_players_params(playerids, usernames)
 
-        print("{0}players".format(self.base_url.format(region)))
-        print(params)
         data = self.gen_req("{0}players".format(self.base_url.format(region)), params=params)
         if len(data['data']) == 0:
             raise EmptyResponseException("No Players with the specified criteria were found.")
         if single:
-            return Player(data['data'][0])
+            return _shared_player(data['data'][0], self.identity_map)
         else:
-            return [Player(player) for player in data['data']]
+            return [_shared_player(player, self.identity_map) for player in data['data']]
 
     def get_players(self, region: str, playerids: list=None, usernames: list=None):
         """
@@ -176,6 +428,40 @@ class Client(ClientBase):
         """
         return self._players(playerids, usernames, region)
 
+    def _players_batch(self, playerids, usernames, region):
+        try:
+            return self._players(playerids, usernames, region)
+        except (EmptyResponseException, NotFoundException):
+            return []
+
+    def get_players_bulk(self, region: str, playerids: list=None, usernames: list=None, workers: int=4):
+        """
+        Get any number of players' info, split into as many requests as needed.
+
+        Parameters
+        ----------
+        region : str
+            The region to look for players in.
+        playerids : list(str)
+            A list of playerids, either a `list` of strs or a `list` of ints.
+        usernames : list(str)
+            A list of usernames, a `list` of strings.
+        workers : Optional[int]
+            Number of requests to make at once.
+
+        Returns
+        -------
+        tuple(players: list, missing: list)
+            A list of :class:`pyvainglory.models.Player` and a list of the requested IDs and names
+            that weren't found.
+        """
+        self._region_check(region)
+        batches = [(ids, None) for ids in self._chunks(playerids)]
+        batches += [(None, names) for names in self._chunks(usernames)]
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results = list(pool.map(lambda batch: self._players_batch(batch[0], batch[1], region), batches))
+        return self._merge_players(results, playerids, usernames)
+
     def player_by_name(self, username: str, region: str):
         """
         Get a player's info by their ingame name.
@@ -1,11 +1,61 @@
 import datetime
 
 from .errors import VGFilterException
+from .errors import RateLimitException
+from .metrics import RequestEvent
 from .const import regions, game_modes
 
 
 class ClientBase:
 
+    def _before_request(self, url, params):
+        """
+        Start a :class:`pyvainglory.metrics.RequestEvent` and pass it to the hooks, if there are any.
+        """
+        if not self.hooks:
+            return None
+        event = RequestEvent(url, params)
+        for hook in self.hooks:
+            if hasattr(hook, 'before_request'):
+                hook.before_request(event)
+        return event
+
+    def _after_request(self, event, exception=None):
+        event._finish(exception)
+        for hook in self.hooks:
+            if hasattr(hook, 'after_request'):
+                hook.after_request(event)
+
+    def _reserve(self, attempt):
+        """
+        Take a rate limiter token for the `attempt`'th send of a request, returns the seconds to wait before it.
+        """
+        if self.rate_limiter is None:
+            return 0.0
+        delay = self.rate_limiter.reserve()
+        if attempt > 1 and self.retry_policy is not None:
+            # Waiting for the limiter before a resend is time spent between attempts too
+            self.retry_policy.record(slept=delay)
+        return delay
+
+    def _retry_delay(self, exc, attempt):
+        """
+        Decide if a request that failed with `exc` on its `attempt`'th send is sent again,
+        returns the seconds to wait first, or `None` if it isn't.
+
+        Every resend goes through here, so a request is sent at most `max(retry_policy.max_attempts,
+        rate_limiter.retries + 1)` times and all of them are counted in the retry policy's `retries` and `slept`.
+        """
+        policy, limiter = self.retry_policy, self.rate_limiter
+        if policy is not None and policy.should_retry(exc, attempt):
+            return policy.delay(exc, attempt)
+        if limiter is not None and isinstance(exc, RateLimitException) and attempt <= limiter.retries:
+            if policy is not None:
+                policy.record(retries=1)
+            # The limiter learned when its window resets from the 429, the next token waits for that
+            return 0.0
+        return None
+
     @staticmethod
     def _gamemodecheck(mode):
         if str(mode).title() not in game_modes.keys():
@@ -110,3 +160,97 @@ class ClientBase:
 
         return params
 
+
+    @staticmethod
+    def _chunks(items, size=6):
+        """
+        Split a list of player IDs or names into groups small enough for a single /players request.
+        """
+        items = list(items or ())
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    @staticmethod
+    def _merge_players(batches, playerids, usernames):
+        """
+        Merge the results of several /players requests, and work out which of the requested IDs and names
+        weren't found.
+        """
+        players = {}
+        for batch in batches:
+            for player in batch:
+                players.setdefault(player.id, player)
+        found_names = {player.name.lower() for player in players.values() if hasattr(player, 'name')}
+        missing = [str(_id) for _id in playerids or () if str(_id) not in players]
+        missing += [name for name in usernames or () if name.lower() not in found_names]
+        return list(players.values()), missing
+
+    def _crawl_range(self, after, before, playerids, playernames, gamemodes):
+        """
+        Validate a crawl's filters with :meth:`prepare_match_params`, and return its time range as datetimes.
+        """
+        if not all((after, before)):
+            raise VGFilterException("Both 'after' and 'before' are required to crawl a time range")
+        params = self.prepare_match_params(None, None, after, before, playerids, playernames, gamemodes)
+        return (datetime.datetime.strptime(params['filter[createdAt-start]'], "%Y-%m-%dT%H:%M:%SZ"),
+                datetime.datetime.strptime(params['filter[createdAt-end]'], "%Y-%m-%dT%H:%M:%SZ"))
+
+    @staticmethod
+    def _split_window(start, end, parts=2):
+        """
+        Split a time range into `parts` back to back windows, on whole seconds.
+        """
+        seconds = int((end - start).total_seconds())
+        parts = max(1, min(parts, seconds))
+        bounds = [start + datetime.timedelta(seconds=seconds * i // parts) for i in range(parts)] + [end]
+        return list(zip(bounds, bounds[1:]))
+
+    @classmethod
+    def _crawl_splits(cls, start, end, matches, min_window):
+        """
+        The windows left to crawl after the first page of a window with more pages, or `None` if the window
+        is short enough, or too short to split on whole seconds, to have its pages gone through instead.
+
+        Matches come sorted by `createdAt`, so the page covers the window up to its last match and only the rest
+        is split, from that match's second on since others may have been created in the same second.
+        """
+        if end - start <= min_window:
+            return None
+        last = max(match.created_at for match in matches)
+        if last == end:
+            # Only matches from the window's last second are left
+            return None
+        if last > start:
+            return cls._split_window(last, end)
+        splits = cls._split_window(start, end)
+        return splits if len(splits) > 1 else None
+
+    @staticmethod
+    def _merge_crawl(found, matches):
+        for match in matches:
+            found.setdefault(match.id, match)
+
+    @staticmethod
+    def _sync_key(region, playerids, playernames, gamemodes):
+        """
+        A stable key identifying an incremental sync's query.
+        """
+        parts = [region]
+        for name, values in (('playerids', playerids), ('playernames', playernames), ('gamemodes', gamemodes)):
+            if values:
+                parts.append('{}={}'.format(name, ','.join(sorted(str(value) for value in values))))
+        return '|'.join(parts)
+
+    @staticmethod
+    def _advance_watermark(mark, matches):
+        """
+        Move a watermark past a batch of newly synced matches.
+        """
+        newest = datetime.datetime.strptime(mark['created_at'], "%Y-%m-%dT%H:%M:%SZ") if mark else None
+        seen = set(mark['seen']) if mark else set()
+        for match in matches:
+            if newest is None or match.created_at > newest:
+                newest = match.created_at
+                seen = {match.id}
+            elif match.created_at == newest:
+                seen.add(match.id)
+        return {'created_at': newest.strftime("%Y-%m-%dT%H:%M:%SZ"), 'seen': sorted(seen)}
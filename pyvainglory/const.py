@@ -21,10 +21,13 @@ game_modes = {
     'private_party_aral_match': 'Private Battle Royale'
 }
 
-skindir = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'data', 'skins.json')
-with open(skindir) as skinjson:
-    skins = json.load(skinjson)
+_datadir = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'data')
 
-itemdir = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'data', 'items.json')
-with open(itemdir) as itemjson:
-    items = json.load(itemjson)
\ No newline at end of file
+
+def __getattr__(name):
+    # skins and items are only read from disk the first time they are used, then kept as module globals
+    if name in ('skins', 'items'):
+        with open(os.path.join(_datadir, '{}.json'.format(name))) as fp:
+            value = globals()[name] = json.load(fp)
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
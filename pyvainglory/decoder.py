@@ -0,0 +1,50 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _get_loads(name=None):
+    """
+    Internal function to pick a decoder, the fastest one installed unless `name` asks for a specific one.
+    """
+    if name in (None, 'orjson') and orjson is not None:
+        return 'orjson', orjson.loads
+    if name in (None, 'ujson') and ujson is not None:
+        return 'ujson', ujson.loads
+    if name in (None, 'json'):
+        return 'json', json.loads
+    raise ValueError("JSON decoder {} is not installed".format(name))
+
+
+# The decoder clients use unless they are given their own `json_loads`
+name, loads = _get_loads()
+
+
+def get_loads(name: str=None):
+    """
+    Get a decoder's `loads` function, to pass to a client as `json_loads`.
+
+    Parameters
+    ----------
+    name : Optional[str]
+        'orjson', 'ujson' or 'json', the fastest one installed if not provided.
+
+    Returns
+    -------
+    callable
+        A function decoding `bytes` or `str` into Python objects, raising `ValueError` on invalid JSON.
+
+    Raises
+    ------
+    ValueError
+        The requested decoder is not installed.
+    """
+    return _get_loads(name)[1]
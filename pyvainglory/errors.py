@@ -1,3 +1,26 @@
+import email.utils
+import datetime
+
+
+def _retry_after(value):
+    """
+    Internal function to turn a 'Retry-After' header, either in seconds or an HTTP date, into seconds.
+    """
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return max((date - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
+
+
 class VGRequestException(Exception):
     """
     General purpose exception, base class for other request related exceptions.
@@ -9,6 +32,11 @@ class VGRequestException(Exception):
     response : aiohttp.ClientResponse_
     data : dict
         The json response from the API
+
+    Attributes
+    ----------
+    retry_after : float or None
+        Seconds the server asked to wait before retrying, from the 'Retry-After' header.
     """
     def __init__(self, response, data):
         self.reason = response.reason
@@ -16,6 +44,7 @@ class VGRequestException(Exception):
             self.status = response.status
         except AttributeError:
             self.status = response.status_code
+        self.retry_after = _retry_after(response.headers.get('Retry-After'))
         self.error = data.get("errors")
         if self.error is not None:
             self.error = self.error[0]['title']
@@ -29,6 +58,13 @@ class NotFoundException(VGRequestException):
     pass
 
 
+class RateLimitException(VGRequestException):
+    """
+    For the 429s, when the API key's rate limit has been used up.
+    """
+    pass
+
+
 class VGServerException(VGRequestException):
     """
     Exception that signifies that the server failed to respond with valid data.
@@ -0,0 +1,194 @@
+import os
+import csv
+import json
+import array
+import calendar
+
+
+class ColumnTable:
+    """
+    A table stored column by column, numeric columns in `array.array` and every other column in a `list`.
+
+    :meth:`to_pydict` gives a `dict` of `list` s, which can be handed straight to `pyarrow.Table.from_pydict`
+    or `pandas.DataFrame`, and :meth:`to_numpy` gives numpy arrays, sharing memory with the numeric columns.
+
+    Attributes
+    ----------
+    name : str
+    columns : dict
+        Column name -> column.
+    """
+    __slots__ = ['name', 'columns', '_appenders']
+
+    def __init__(self, name, schema):
+        self.name = name
+        self.columns = {column: array.array(typecode) if typecode else [] for column, typecode in schema}
+        self._appenders = [self.columns[column].append for column, _ in schema]
+
+    def __len__(self):
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __repr__(self):
+        return "<ColumnTable: name={0.name} rows={1}>".format(self, len(self))
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def _append(self, row):
+        for append, value in zip(self._appenders, row):
+            append(value)
+
+    def rows(self):
+        """
+        Iterate over the table row by row, as `dict` s.
+        """
+        names = list(self.columns)
+        for row in zip(*self.columns.values()):
+            yield dict(zip(names, row))
+
+    def to_pydict(self):
+        """
+        Returns
+        -------
+        `dict`
+            Column name -> `list` of values.
+        """
+        return {name: column.tolist() if isinstance(column, array.array) else list(column)
+                for name, column in self.columns.items()}
+
+    def to_numpy(self):
+        """
+        Convert the table to numpy arrays, numpy has to be installed.
+
+        Returns
+        -------
+        `dict`
+            Column name -> `numpy.ndarray`, numeric columns share memory with this table.
+        """
+        import numpy
+
+        return {name: numpy.frombuffer(column, dtype=column.typecode) if isinstance(column, array.array)
+                else numpy.array(column, dtype=object)
+                for name, column in self.columns.items()}
+
+    def to_csv(self, file):
+        """
+        Write the table to a CSV file, with a header row, `list` values are written as JSON.
+
+        Parameters
+        ----------
+        file : str or file object
+            A path, or a file opened in text mode with ``newline=''``.
+        """
+        if isinstance(file, str):
+            with open(file, 'w', newline='') as fp:
+                return self.to_csv(fp)
+        writer = csv.writer(file)
+        writer.writerow(self.columns)
+        for row in zip(*self.columns.values()):
+            writer.writerow([json.dumps(value) if isinstance(value, list) else value for value in row])
+
+
+match_schema = [
+    ('id', None), ('created_at', 'q'), ('duration', 'q'), ('game_mode', None), ('patch', None), ('region', None),
+    ('game_end_reason', None), ('telemetry_url', None)
+]
+
+roster_schema = [
+    ('match_id', None), ('id', None), ('side', None), ('won', 'b'), ('aces', 'q'), ('gold', 'd'),
+    ('hero_kills', 'q'), ('krakens_captured', 'q'), ('turret_kills', 'q'), ('turrets_remaining', 'q')
+]
+
+participant_schema = [
+    ('match_id', None), ('roster_id', None), ('id', None), ('player_id', None), ('actor', None), ('skin', None),
+    ('won', 'b'), ('created_at', 'q'), ('game_mode', None), ('patch', None), ('region', None), ('kills', 'q'),
+    ('deaths', 'q'), ('assists', 'q'), ('gold', 'd'), ('farm', 'd'), ('minion_kills', 'q'), ('jungle_kills', 'q'),
+    ('crystal_mines_captured', 'q'), ('gold_mines_captured', 'q'), ('krakens_captured', 'q'),
+    ('turrets_captured', 'q'), ('first_time_afk', 'b'), ('final_build', None)
+]
+
+
+class MatchExporter:
+    """
+    Turns matches into three :class:`ColumnTable` s, one row per match, per roster and per participant.
+
+    Matches can be added as they arrive, ex: straight from :meth:`pyvainglory.client.Client.iter_matches`,
+    so a whole crawl never has to be kept around as model objects.
+    Every participant row also carries its match's `created_at`, `game_mode`, `patch` and `region`
+    and whether its roster won, so it can be grouped on those without a join. Spectators are left out.
+
+    Parameters
+    ----------
+    matches : Optional[iterable(:class:`pyvainglory.models.MatchBase`)]
+        Matches to add right away.
+
+    Attributes
+    ----------
+    matches : :class:`ColumnTable`
+    rosters : :class:`ColumnTable`
+    participants : :class:`ColumnTable`
+    """
+    __slots__ = ['matches', 'rosters', 'participants']
+
+    def __init__(self, matches=None):
+        self.matches = ColumnTable('matches', match_schema)
+        self.rosters = ColumnTable('rosters', roster_schema)
+        self.participants = ColumnTable('participants', participant_schema)
+        if matches is not None:
+            self.extend(matches)
+
+    def __repr__(self):
+        return "<MatchExporter: matches={0} rosters={1} participants={2}>".format(
+            len(self.matches), len(self.rosters), len(self.participants))
+
+    def add(self, match):
+        """
+        Add a single match's rows.
+        """
+        created_at = calendar.timegm(match.created_at.utctimetuple())
+        game_mode, region = match.game_mode[0], match.region[0]
+        self.matches._append((match.id, created_at, match.duration, game_mode, match.patch, region,
+                              match.game_end_reason, match.telemetry_url))
+        add_roster = self.rosters._append
+        add_participant = self.participants._append
+        for roster in match.rosters:
+            won = roster.won
+            add_roster((match.id, roster.id, roster.side, won, roster.aces, roster.gold, roster.hero_kills,
+                        roster.krakens_captured, roster.turret_kills, roster.turrets_remaining))
+            for p in roster.participants:
+                add_participant((match.id, roster.id, p.id, p.player.id if p.player else None, p.actor, p.skin, won,
+                                 created_at, game_mode, match.patch, region, p.kills, p.deaths, p.assists, p.gold,
+                                 p.farm, p.minion_kills, p.jungle_kills, p.crystal_mines_captured,
+                                 p.gold_mines_captured, p.krakens_captured, p.turrets_captured, p.first_time_afk,
+                                 p.final_build))
+
+    def extend(self, matches):
+        """
+        Add every match from an iterable.
+        """
+        for match in matches:
+            self.add(match)
+
+    def to_csv(self, directory):
+        """
+        Write 'matches.csv', 'rosters.csv' and 'participants.csv' into `directory`.
+        """
+        for table in (self.matches, self.rosters, self.participants):
+            table.to_csv(os.path.join(directory, '{}.csv'.format(table.name)))
+
+
+def export_matches(matches):
+    """
+    Turn matches into columnar tables.
+
+    Parameters
+    ----------
+    matches : iterable(:class:`pyvainglory.models.MatchBase`)
+
+    Returns
+    -------
+    :class:`MatchExporter`
+    """
+    return MatchExporter(matches)
@@ -0,0 +1,71 @@
+import weakref
+import threading
+
+from collections import OrderedDict
+
+
+class IdentityMap:
+    """
+    Maps (class, ID) to the one object standing for that entity, so a player showing up in many matches,
+    or a match showing up on overlapping pages, is built once and shared instead of once per appearance.
+
+    By default objects are held through weak references, and drop out of the map as soon as nothing else
+    uses them. With `max_size`, the most recently used objects are held strongly instead, so entities
+    are still shared, and seen again cheaply, after the caller has let go of them.
+
+    Parameters
+    ----------
+    max_size : Optional[int]
+        The most objects to keep alive, objects are only weakly referenced if not provided.
+    """
+    def __init__(self, max_size: int=None):
+        self.max_size = max_size
+        self._objects = weakref.WeakValueDictionary() if max_size is None else OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "<IdentityMap: objects={0} max_size={1.max_size}>".format(len(self), self)
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __contains__(self, key):
+        return key in self._objects
+
+    def get(self, cls, _id):
+        """
+        Get the object of class `cls` with ID `_id`, or `None` if there is none.
+        """
+        with self._lock:
+            obj = self._objects.get((cls, _id))
+            if obj is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if self.max_size is not None:
+                    self._objects.move_to_end((cls, _id))
+            return obj
+
+    def add(self, obj):
+        """
+        Add an object, keyed by its class and `id`.
+
+        Returns
+        -------
+        The object now mapped to that key, `obj` unless another thread added one first.
+        """
+        key = type(obj), obj.id
+        with self._lock:
+            existing = self._objects.get(key)
+            if existing is not None:
+                return existing
+            self._objects[key] = obj
+            if self.max_size is not None and len(self._objects) > self.max_size:
+                self._objects.popitem(last=False)
+            return obj
+
+    def clear(self):
+        with self._lock:
+            self._objects.clear()
@@ -0,0 +1,292 @@
+import re
+import time
+import threading
+
+_endpoints = [
+    (re.compile(r'/status$'), 'status'),
+    (re.compile(r'/matches/[^/]+$'), 'match'),
+    (re.compile(r'/matches$'), 'matches'),
+    (re.compile(r'/players/[^/]+$'), 'player'),
+    (re.compile(r'/players$'), 'players'),
+    (re.compile(r'/samples$'), 'samples')
+]
+
+latency_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+hydration_buckets = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+def endpoint(url):
+    """
+    The API endpoint a URL belongs to, ex: 'matches' or 'match', 'other' for anything else, like telemetry files.
+    """
+    path = url.split('?', 1)[0].rstrip('/')
+    for pattern, name in _endpoints:
+        if pattern.search(path):
+            return name
+    return 'other'
+
+
+class RequestEvent:
+    """
+    What is known about one HTTP request sent by a client, passed to its hooks.
+
+    Attributes
+    ----------
+    url : str
+    params : dict or None
+    endpoint : str
+        See :func:`endpoint`.
+    started : float
+        `time.perf_counter` when the request was sent.
+    elapsed : float or None
+        Seconds until the whole response was received, `None` if none was.
+    duration : float or None
+        Seconds until the response was also decoded and checked, set before the after-request hooks run.
+    status : int or None
+    headers : Mapping or None
+        The response's headers.
+    size : int or None
+        The response body's size in bytes.
+    exception : Exception or None
+        What the request raised, ex: a :class:`pyvainglory.errors.NotFoundException`
+        or a connection error from the HTTP library.
+    """
+    __slots__ = ['url', 'params', 'endpoint', 'started', 'elapsed', 'duration', 'status', 'headers', 'size',
+                 'exception']
+
+    def __init__(self, url, params):
+        self.url = url
+        self.params = params
+        self.endpoint = endpoint(url)
+        self.started = time.perf_counter()
+        self.elapsed = self.duration = self.status = self.headers = self.size = self.exception = None
+
+    def __repr__(self):
+        return "<RequestEvent: endpoint={0.endpoint} status={0.status} elapsed={0.elapsed}>".format(self)
+
+    def _response(self, status, headers, size):
+        self.elapsed = time.perf_counter() - self.started
+        self.status, self.headers, self.size = status, headers, size
+
+    def _finish(self, exception=None):
+        self.duration = time.perf_counter() - self.started
+        self.exception = exception
+
+
+class Histogram:
+    """
+    Counts of observed values per bucket, along with their sum, like a Prometheus histogram.
+
+    Attributes
+    ----------
+    buckets : tuple(float)
+        Upper bounds of the buckets, an implicit last bucket holds everything above them.
+    counts : list(int)
+        Values observed per bucket, not cumulative.
+    sum : float
+    count : int
+    """
+    __slots__ = ['buckets', 'counts', 'sum', 'count']
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def __repr__(self):
+        return "<Histogram: count={0.count} sum={0.sum}>".format(self)
+
+    def observe(self, value):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            index = len(self.buckets)
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float):
+        """
+        Estimate a quantile, ex: 0.99, as the upper bound of the bucket it falls in.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"')
+                                                .replace('\n', '\\n')) for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """
+    Counters, gauges and histograms about a client's requests and the matches built from them,
+    exportable in the Prometheus text format with :meth:`to_prometheus`.
+
+    Passed to a client as `metrics`, it is added to the client's request hooks and records:
+
+    - `pyvainglory_request_seconds`, time from sending a request to receiving its whole response, per endpoint.
+    - `pyvainglory_decode_seconds`, time spent decoding and checking responses after that, per endpoint.
+    - `pyvainglory_requests_total`, per endpoint and status code.
+    - `pyvainglory_response_bytes_total`, per endpoint.
+    - `pyvainglory_errors_total`, per exception class.
+    - `pyvainglory_ratelimit_remaining` and `pyvainglory_ratelimit_limit`, from the last response's headers.
+    - `pyvainglory_hydration_seconds`, time spent building each match's objects.
+
+    Other metrics can be added with :meth:`declare`.
+
+    Parameters
+    ----------
+    latency_buckets : Optional[tuple(float)]
+        Bucket upper bounds, in seconds, for the request and decode histograms.
+    hydration_buckets : Optional[tuple(float)]
+        Bucket upper bounds, in seconds, for the hydration histogram.
+    """
+    def __init__(self, latency_buckets=latency_buckets, hydration_buckets=hydration_buckets):
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self.declare('pyvainglory_request_seconds', 'histogram',
+                     'Time from sending a request to receiving its whole response.', ('endpoint',), latency_buckets)
+        self.declare('pyvainglory_decode_seconds', 'histogram',
+                     'Time spent decoding and checking a response once received.', ('endpoint',), latency_buckets)
+        self.declare('pyvainglory_requests_total', 'counter', 'Responses received.', ('endpoint', 'status'))
+        self.declare('pyvainglory_response_bytes_total', 'counter', 'Response body bytes received.', ('endpoint',))
+        self.declare('pyvainglory_errors_total', 'counter', 'Requests that raised, by exception class.',
+                     ('exception',))
+        self.declare('pyvainglory_ratelimit_remaining', 'gauge', 'Requests left in the current rate limit window.')
+        self.declare('pyvainglory_ratelimit_limit', 'gauge', 'Requests allowed per rate limit window.')
+        self.declare('pyvainglory_hydration_seconds', 'histogram', 'Time spent building a match and its objects.',
+                     buckets=hydration_buckets)
+
+    def __repr__(self):
+        return "<MetricsRegistry: metrics={}>".format(len(self._metrics))
+
+    def declare(self, name: str, kind: str, help: str, labels: tuple=(), buckets: tuple=latency_buckets):
+        """
+        Add a metric.
+
+        Parameters
+        ----------
+        name : str
+        kind : str
+            'counter', 'gauge' or 'histogram'.
+        help : str
+        labels : Optional[tuple(str)]
+            Names of the labels every sample of the metric has.
+        buckets : Optional[tuple(float)]
+            Bucket upper bounds, for histograms.
+        """
+        if kind not in ('counter', 'gauge', 'histogram'):
+            raise ValueError("'{}' is not a metric kind".format(kind))
+        with self._lock:
+            self._metrics[name] = (kind, help, tuple(labels), tuple(buckets), {})
+
+    def _sample(self, name, labels, default):
+        _, _, names, _, samples = self._metrics[name]
+        key = tuple(labels.get(label, '') for label in names)
+        sample = samples.get(key)
+        if sample is None:
+            sample = samples[key] = default()
+        return samples, key, sample
+
+    def inc(self, name: str, amount=1, **labels):
+        """
+        Add to a counter.
+        """
+        with self._lock:
+            samples, key, value = self._sample(name, labels, int)
+            samples[key] = value + amount
+
+    def set(self, name: str, value, **labels):
+        """
+        Set a gauge.
+        """
+        with self._lock:
+            samples, key, _ = self._sample(name, labels, int)
+            samples[key] = value
+
+    def observe(self, name: str, value, **labels):
+        """
+        Add a value to a histogram.
+        """
+        with self._lock:
+            _, _, histogram = self._sample(name, labels, lambda: Histogram(self._metrics[name][3]))
+            histogram.observe(value)
+
+    def get(self, name: str, **labels):
+        """
+        A sample's current value, a :class:`Histogram` for histograms, `None` if nothing was recorded for it.
+        """
+        _, _, names, _, samples = self._metrics[name]
+        return samples.get(tuple(labels.get(label, '') for label in names))
+
+    def before_request(self, event):
+        pass
+
+    def after_request(self, event):
+        """
+        Record a finished request, this is the hook clients call.
+        """
+        if event.status is not None:
+            self.observe('pyvainglory_request_seconds', event.elapsed, endpoint=event.endpoint)
+            self.observe('pyvainglory_decode_seconds', event.duration - event.elapsed, endpoint=event.endpoint)
+            self.inc('pyvainglory_requests_total', endpoint=event.endpoint, status=event.status)
+            self.inc('pyvainglory_response_bytes_total', event.size or 0, endpoint=event.endpoint)
+            for header, name in (('X-RateLimit-Remaining', 'pyvainglory_ratelimit_remaining'),
+                                 ('X-RateLimit-Limit', 'pyvainglory_ratelimit_limit')):
+                value = event.headers.get(header)
+                if value is not None:
+                    try:
+                        self.set(name, float(value))
+                    except ValueError:
+                        pass
+        if event.exception is not None:
+            self.inc('pyvainglory_errors_total', exception=type(event.exception).__name__)
+
+    def to_prometheus(self):
+        """
+        Every metric in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+        """
+        lines = []
+        with self._lock:
+            for name, (kind, help, labels, buckets, samples) in self._metrics.items():
+                lines.append('# HELP {} {}'.format(name, help))
+                lines.append('# TYPE {} {}'.format(name, kind))
+                for key, sample in samples.items():
+                    if kind != 'histogram':
+                        lines.append('{}{} {}'.format(name, _format_labels(labels, key), _format_value(sample)))
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(sample.buckets + (float('inf'),), sample.counts):
+                        cumulative += count
+                        lines.append('{}_bucket{} {}'.format(name, _format_labels(labels, key,
+                                                                                  ('le', _format_value(bound))),
+                                                             cumulative))
+                    lines.append('{}_sum{} {}'.format(name, _format_labels(labels, key), _format_value(sample.sum)))
+                    lines.append('{}_count{} {}'.format(name, _format_labels(labels, key), sample.count))
+        return '\n'.join(lines) + '\n'
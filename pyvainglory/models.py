@@ -1,21 +1,67 @@
+import sys
+import time
+import queue
 import datetime
+import threading
 
 from collections import namedtuple
 from urllib.parse import urlparse
 from urllib.parse import parse_qs
+from . import const
+from . import decoder
 from .errors import VGPaginationError
-from .const import skins, regions, game_modes, items
+from .telemetry import TelemetryParser
+from .const import regions, game_modes
 
 
-def _get_object(lst, _id):
+def _index_included(lst):
     """
-    Internal function to grab data referenced inside response['included']
+    Internal function to build an id -> object index of response['included'], so each referenced
+    object can be looked up once per response instead of scanning the list for every reference.
     """
+    index = {}
     for item in lst:
+        index.setdefault(item['id'], item)
+    return index
+
+
+def _get_object(included, _id):
+    """
+    Internal function to grab data referenced inside response['included']
+    """
+    if isinstance(included, dict):
+        return included.get(_id)
+    for item in included:
         if item['id'] == _id:
             return item
 
 
+# Every model from the same region or game mode shares one (code, name) tuple instead of building its own,
+# and strings repeated across models, like actors and item names, go through sys.intern so they're stored once
+_region_tuples = {sys.intern(code): (sys.intern(code), name) for code, name in regions.items()}
+_game_mode_tuples = {sys.intern(code): (sys.intern(code), name) for code, name in game_modes.items()}
+
+
+class _ItemNames(dict):
+    """
+    Internal item key -> name `dict`, ex: '*1000_Item_HalcyonPotion*' -> 'Halcyon Potion',
+    filled in as keys are first seen.
+    """
+    def __missing__(self, key):
+        name = self[key] = const.items[key.strip('*')]
+        return name
+
+
+_item_names = _ItemNames()
+
+
+def _compact(counts):
+    """
+    Internal function to turn a raw item key -> count `dict` into a tuple(item names, counts).
+    """
+    return tuple(map(_item_names.__getitem__, counts)), tuple(counts.values())
+
+
 class BaseVGObject:
     """
     A base object for most data classes
@@ -25,7 +71,7 @@ class BaseVGObject:
     id : str
         A general unique ID for each type of data.
     """
-    __slots__ = ['id']
+    __slots__ = ['id', '__weakref__']
 
     def __init__(self, data):
         self.id = data['id']
@@ -82,7 +128,7 @@ class Player(BaseVGObject):
         super().__init__(data)
         if data.get('attributes'):
             self.name = data['attributes']['name']
-            self.region = data['attributes']['shardId'], regions[data['attributes']['shardId']]
+            self.region = _region_tuples[data['attributes']['shardId']]
             stats = data['attributes']['stats']
             self.elo_history = {season: stats['elo_earned_season_{}'.format(season)] for season in range(4, 10)}
             if stats['karmaLevel'] == 2:
@@ -121,6 +167,21 @@ class Player(BaseVGObject):
         return "<Player: id={}>".format(self.id)
 
 
+def _shared_player(data, identity=None):
+    """
+    Internal function to build a :class:`Player`, or reuse the one already in an identity map,
+    updating it in place if `data` comes with the player's full info.
+    """
+    if identity is None:
+        return Player(data)
+    player = identity.get(Player, data['id'])
+    if player is None:
+        return identity.add(Player(data))
+    if data.get('attributes'):
+        player.__init__(data)
+    return player
+
+
 class Participant(BaseVGObject):
     """
     A class that holds data about a participant in a match.
@@ -149,42 +210,59 @@ class Participant(BaseVGObject):
     skin : str
     turrets_captured : int
     player : :class:`Player`
+
+    Item counts are kept as compact tuples of item names and counts, `items_bought`, `items_sold` and `items_used`
+    build a new `dict` out of them every time they are accessed.
     """
     __slots__ = ['actor', 'region', 'assists', 'crystal_mines_captured', 'deaths', 'farm', 'first_time_afk', 'gold',
-                 'gold_mines_captured', 'items_bought', 'items_sold', 'items_used', 'final_build', 'jungle_kills',
-                 'kills', 'krakens_captured', 'minion_kills', 'skin', 'turrets_captured','went_afk', 'winner', 'player']
+                 'gold_mines_captured', '_items', 'final_build', 'jungle_kills', 'kills', 'krakens_captured',
+                 'minion_kills', 'skin', 'turrets_captured', 'went_afk', 'winner', 'player']
+
+    def __init__(self, participant, included, lazy=False, identity=None):
+        self._load(self._snapshot(participant, included), identity)
 
-    def __init__(self, participant, included):
-        super().__init__(participant)
+    @staticmethod
+    def _snapshot(participant, included):
+        """
+        Internal method to pull everything a participant is built from out of a raw response, as a `tuple`.
+        """
         data = _get_object(included, participant['id'])
-        self.actor = data['attributes']['actor']
-        self.region = data['attributes']['shardId'], regions[data['attributes']['shardId']]
-        stats = data['attributes']['stats']
-        self.assists = stats['assists']
-        self.crystal_mines_captured = stats['crystalMineCaptures']
-        self.deaths = stats['deaths']
-        self.farm = stats['farm']
-        self.first_time_afk = True if stats['firstAfkTime'] == 1 else False
-        self.gold = stats['gold']
-        self.gold_mines_captured = stats['goldMineCaptures']
-
-        self.items_bought = {items[name.strip('*')]: quant for name, quant in stats['itemGrants'].items()}
-        self.items_sold = {items[name.strip('*')]: quant for name, quant in stats['itemSells'].items()}
-        self.items_used = {items[name.strip('*')]: quant for name, quant in stats['itemUses'].items()}
-
-        self.final_build = stats['items']
-        self.jungle_kills = stats['jungleKills']
-        self.kills = stats['kills']
-        self.krakens_captured = stats['krakenCaptures']
-        self.minion_kills = stats['minionKills']
-
-        if stats['skinKey'] in skins:
-            self.skin = skins[stats['skinKey']]
-        else:
-            self.skin = stats['skinKey']
+        attributes = data['attributes']
+        stats = attributes['stats']
+        skin = const.skins.get(stats['skinKey']) or sys.intern(stats['skinKey'])
+        return (data['id'], sys.intern(attributes['actor']), _region_tuples[attributes['shardId']], stats['assists'],
+                stats['crystalMineCaptures'], stats['deaths'], stats['farm'], stats['firstAfkTime'] == 1,
+                stats['gold'], stats['goldMineCaptures'],
+                (_compact(stats['itemGrants']), _compact(stats['itemSells']), _compact(stats['itemUses'])),
+                list(map(sys.intern, stats['items'])), stats['jungleKills'], stats['kills'], stats['krakenCaptures'],
+                stats['minionKills'], skin, stats['turretCaptures'], data['relationships']['player']['data']['id'])
+
+    @classmethod
+    def _from_snapshot(cls, snapshot, identity=None):
+        """
+        Internal method to build a participant from :meth:`_snapshot`.
+        """
+        participant = cls.__new__(cls)
+        participant._load(snapshot, identity)
+        return participant
+
+    def _load(self, snapshot, identity):
+        (self.id, self.actor, self.region, self.assists, self.crystal_mines_captured, self.deaths, self.farm,
+         self.first_time_afk, self.gold, self.gold_mines_captured, self._items, self.final_build, self.jungle_kills,
+         self.kills, self.krakens_captured, self.minion_kills, self.skin, self.turrets_captured, player) = snapshot
+        self.player = _shared_player({'id': player}, identity) if player is not None else None
+
+    @property
+    def items_bought(self):
+        return dict(zip(*self._items[0]))
+
+    @property
+    def items_sold(self):
+        return dict(zip(*self._items[1]))
 
-        self.turrets_captured = stats['turretCaptures']
-        self.player = Player(data['relationships']['player']['data'])
+    @property
+    def items_used(self):
+        return dict(zip(*self._items[2]))
 
     def __repr__(self):
         return "<Participant: id={0.id} region={0.region} actor={0.actor} bot={1}>".format(self, True if not
@@ -217,23 +295,37 @@ class Roster(BaseVGObject):
     __slots__ = ['region', 'aces', 'won', 'gold', 'hero_kills', 'krakens_captured', 'side', 'turret_kills',
                  'turrets_remaining', 'participants']
 
-    def __init__(self, roster, included):
-        super().__init__(roster)
+    def __init__(self, roster, included, lazy=False, identity=None):
+        self._load(self._snapshot(roster, included), identity)
+
+    @staticmethod
+    def _snapshot(roster, included):
+        """
+        Internal method to pull everything a roster and its participants are built from out of a raw response,
+        as a `tuple`.
+        """
         data = _get_object(included, roster['id'])
-        self.region = data['attributes']['shardId'], regions[data['attributes']['shardId']]
-        stats = data['attributes']['stats']
-        self.aces = stats['acesEarned']
-        self.gold = stats['gold']
-        self.hero_kills = stats['heroKills']
-        self.krakens_captured = stats['krakenCaptures']
-        self.side = stats['side']
-        self.turret_kills = stats['turretKills']
-        self.turrets_remaining = stats['turretsRemaining']
-        self.won = True if data['attributes']['won'] == 'true' else False
-
-        self.participants = []
-        for participant in data['relationships']['participants']['data']:
-            self.participants.append(Participant(participant, included))
+        attributes = data['attributes']
+        stats = attributes['stats']
+        participants = tuple(Participant._snapshot(participant, included)
+                             for participant in data['relationships']['participants']['data'])
+        return (data['id'], _region_tuples[attributes['shardId']], stats['acesEarned'], stats['gold'],
+                stats['heroKills'], stats['krakenCaptures'], sys.intern(stats['side']), stats['turretKills'],
+                stats['turretsRemaining'], attributes['won'] == 'true', participants)
+
+    @classmethod
+    def _from_snapshot(cls, snapshot, identity=None):
+        """
+        Internal method to build a roster and its participants from :meth:`_snapshot`.
+        """
+        roster = cls.__new__(cls)
+        roster._load(snapshot, identity)
+        return roster
+
+    def _load(self, snapshot, identity):
+        (self.id, self.region, self.aces, self.gold, self.hero_kills, self.krakens_captured, self.side,
+         self.turret_kills, self.turrets_remaining, self.won, participants) = snapshot
+        self.participants = [Participant._from_snapshot(participant, identity) for participant in participants]
 
     def __repr__(self):
         return "<Roster: id={0.id} region={0.region} won={0.won}>".format(self)
@@ -271,37 +363,201 @@ class MatchBase(BaseVGObject):
         URL for the telemetry file for this match
     session : aiohttp.ClientSession_ or requests.Session_
         Depends on which class extends MatchBase, AsyncClient or normal Client, respectively.
+    client : :class:`pyvainglory.client.Client` or :class:`pyvainglory.asyncclient.AsyncClient`
+        The client this match was requested through, if any.
+
+    If created with ``lazy=True``, only the values `rosters` and `spectators` are built from are pulled out of the
+    response, into tuples, and their objects are built the first time either of them is accessed.
+    Nothing of the response itself is kept, so a lazy match retains no more memory than an eager one.
     """
     __slots__ = ['created_at', 'duration', 'game_mode', 'patch', 'region', 'game_end_reason', 'telemetry_url',
-                 'rosters', 'spectators', 'session']
-
-    def __init__(self, data, session, included=None):
-        included = included or data['included']
-        data = data if included else data['data']
+                 '_rosters', '_spectators', '_snapshot', 'session', 'client']
+
+    def __init__(self, data, session, included=None, lazy=False, client=None):
+        if included is None:
+            # A single match response, ex: from /matches/{id}
+            included = data['included']
+            data = data['data']
+        if not isinstance(included, dict):
+            included = _index_included(included)
         super().__init__(data)
         self.created_at = datetime.datetime.strptime(data['attributes']['createdAt'], "%Y-%m-%dT%H:%M:%SZ")
         self.duration = data['attributes']['duration']
-        self.game_mode = data['attributes']['gameMode'], game_modes[data['attributes']['gameMode']]
-        self.patch = data['attributes']['patchVersion']
-        self.region = data['attributes']['shardId'], regions[data['attributes']['shardId']]
-        self.game_end_reason = data['attributes']['stats']['endGameReason']
-        self.rosters = []
-        for roster in data['relationships']['rosters']['data']:
-            self.rosters.append(Roster(roster, included))
-        self.spectators = []
-        for participant in data['relationships']['spectators']['data']:
-            self.spectators.append(Participant(participant, included))
+        self.game_mode = _game_mode_tuples[data['attributes']['gameMode']]
+        self.patch = sys.intern(data['attributes']['patchVersion'])
+        self.region = _region_tuples[data['attributes']['shardId']]
+        self.game_end_reason = sys.intern(data['attributes']['stats']['endGameReason'])
         self.telemetry_url = _get_object(included,
                                          data['relationships']['assets']['data'][0]['id'])['attributes']['URL']
         self.session = session
+        self.client = client
+        self._rosters = self._spectators = None
+        relationships = data['relationships']
+        self._snapshot = (tuple(Roster._snapshot(roster, included) for roster in relationships['rosters']['data']),
+                          tuple(Participant._snapshot(participant, included)
+                                for participant in relationships['spectators']['data']))
+        if not lazy:
+            self._hydrate()
+
+    @classmethod
+    def _from_snapshot(cls, attributes, snapshot, session=None, client=None, lazy=False):
+        """
+        Internal method to build a match from its attributes, as a tuple(id, created_at, duration, game_mode, patch,
+        region, game_end_reason, telemetry_url), and the roster and spectator snapshots its rosters and spectators
+        are built from, ex: from a :class:`pyvainglory.store.MatchStore`.
+        """
+        match = cls.__new__(cls)
+        (match.id, match.created_at, match.duration, match.game_mode, match.patch, match.region,
+         match.game_end_reason, match.telemetry_url) = attributes
+        match.session = session
+        match.client = client
+        match._rosters = match._spectators = None
+        match._snapshot = snapshot
+        if not lazy:
+            match._hydrate()
+        return match
+
+    def _hydrate(self):
+        rosters, spectators = self._snapshot
+        identity = self.client.identity_map if self.client is not None else None
+        self._rosters = [Roster._from_snapshot(roster, identity) for roster in rosters]
+        self._spectators = [Participant._from_snapshot(participant, identity) for participant in spectators]
+        # The snapshot isn't needed anymore once everything has been built
+        self._snapshot = None
+
+    def _hydrate_lazily(self):
+        metrics = self.client.metrics if self.client is not None else None
+        if metrics is None:
+            return self._hydrate()
+        started = time.perf_counter()
+        self._hydrate()
+        metrics.observe('pyvainglory_hydration_seconds', time.perf_counter() - started)
+
+    @property
+    def rosters(self):
+        if self._rosters is None:
+            self._hydrate_lazily()
+        return self._rosters
+
+    @property
+    def spectators(self):
+        if self._spectators is None:
+            self._hydrate_lazily()
+        return self._spectators
+
+    @property
+    def _telemetry_cache(self):
+        return self.client.telemetry_cache if self.client is not None else None
+
+    @property
+    def _json_loads(self):
+        return self.client.json_loads if self.client is not None else decoder.loads
+
+
+def _shared_match(cls, data, session, included=None, lazy=False, client=None):
+    """
+    Internal function to build a match, or reuse the one already in the client's identity map.
+    """
+    identity = client.identity_map if client is not None else None
+    if identity is not None:
+        match = identity.get(cls, data['id'] if included is not None else data['data']['id'])
+        if match is not None:
+            return match
+    metrics = client.metrics if client is not None and not lazy else None
+    started = time.perf_counter() if metrics is not None else None
+    match = cls(data, session, included, lazy, client)
+    if metrics is not None:
+        metrics.observe('pyvainglory_hydration_seconds', time.perf_counter() - started)
+    return identity.add(match) if identity is not None else match
+
+
+class _TelemetryStream:
+    """
+    Internal class parsing a match's telemetry chunk by chunk, from its cached file or a download,
+    for both :meth:`AsyncMatch.iter_telemetry` and :meth:`Match.iter_telemetry`.
+
+    If the cached file turns out to be corrupt part way through, it is dropped and the telemetry downloaded
+    instead, skipping the events already returned from the cached file. None of these methods do any network I/O,
+    the ones touching the cache are called in an executor by :class:`AsyncMatch`.
+    """
+    __slots__ = ['cache', 'url', 'parser', 'skip', 'writer', 'finished']
+
+    def __init__(self, cache, url):
+        self.cache = cache
+        self.url = url
+        self.parser = TelemetryParser()
+        # Events already returned from a cached file that turned out to be corrupt
+        self.skip = 0
+        self.writer = None
+        self.finished = False
+
+    def open_cached(self):
+        return self.cache.open(self.url) if self.cache is not None else None
+
+    def read_cached(self, fp, chunk_size):
+        """
+        Parse the next chunk of a cached file and return its events, `finished` is set once the file is done.
+        `None` is returned if the file is corrupt, it is dropped and the telemetry has to be downloaded.
+        """
+        try:
+            chunk = fp.read(chunk_size)
+            events = self.parser.feed(chunk) if chunk else self.parser.close()
+        except self.cache.read_errors + (ValueError,):
+            fp.close()
+            self.cache.corrupt(self.url)
+            self.parser = TelemetryParser()
+            return None
+        self.skip += len(events)
+        self.finished = not chunk
+        return events
+
+    def start_download(self, status):
+        if self.cache is not None and status == 200:
+            self.writer = self.cache.writer(self.url)
+
+    def _skipped(self, events):
+        if not self.skip:
+            return events
+        skipped = min(self.skip, len(events))
+        self.skip -= skipped
+        return events[skipped:]
+
+    def feed(self, chunk):
+        """
+        Parse and cache the next chunk of the download, returns the events it completed.
+        """
+        if self.writer is not None:
+            self.writer.write(chunk)
+        return self._skipped(self.parser.feed(chunk))
+
+    def close(self):
+        return self._skipped(self.parser.close())
+
+    def commit(self):
+        if self.writer is not None:
+            self.writer.commit()
+
+    def discard(self):
+        if self.writer is not None:
+            self.writer.discard()
+
+
+async def _run_blocking(func, *args):
+    """
+    Internal function to run blocking disk I/O, ex: reading or writing the telemetry cache, in the event loop's
+    default executor.
+    """
+    # Imported here so that the synchronous client doesn't pay for importing asyncio
+    import asyncio
+    return await asyncio.get_event_loop().run_in_executor(None, func, *args)
 
 
 class AsyncMatch(MatchBase):
     """
     Extends :class:`MatchBase` to add async :meth:`get_telemetry`.
     """
-    def __init__(self, data, session, included=None):
-        super().__init__(data, session, included)
+    def __init__(self, data, session, included=None, lazy=False, client=None):
+        super().__init__(data, session, included, lazy, client)
 
     def __repr__(self):
         return "<AsyncMatch: id={0.id} region={0.region}>".format(self)
@@ -322,21 +578,81 @@ class AsyncMatch(MatchBase):
         `dict`
             Match telemetry data
         """
+        cache = self._telemetry_cache
+        if cache is not None:
+            raw = await _run_blocking(cache.get, self.telemetry_url)
+            if raw is not None:
+                return self._json_loads(raw)
+
         sess = session or self.session
         async with sess.get(self.telemetry_url, headers={'Accept': 'application/json'}) as resp:
-            data = await resp.json()
+            raw = await resp.read()
+            if cache is not None and resp.status == 200:
+                await _run_blocking(cache.set, self.telemetry_url, raw)
+        data = self._json_loads(raw)
 
         # After understanding the telemetry structure, to provide it as usable data is going to be a tough ordeal,
         # but one that can be looked into later
         return data
 
+    async def iter_telemetry(self, session=None, chunk_size: int=65536):
+        """
+        Iterate over a match's telemetry events as they are downloaded, without loading the whole file first.
+
+        .. _aiohttp.ClientSession: https://aiohttp.readthedocs.io/en/stable/client_reference.html#client-session
+
+        Parameters
+        ----------
+        session : Optional[aiohttp.ClientSession_]
+            Optional session to use to request telemetry data.
+        chunk_size : Optional[int]
+            Number of bytes to read from the response at a time.
+
+        Yields
+        ------
+        `dict`
+            A single telemetry event
+        """
+        stream = _TelemetryStream(self._telemetry_cache, self.telemetry_url)
+        # Reading and writing the cache is done in an executor, so it doesn't block the event loop
+        fp = await _run_blocking(stream.open_cached) if stream.cache is not None else None
+        if fp is not None:
+            with fp:
+                while not stream.finished:
+                    events = await _run_blocking(stream.read_cached, fp, chunk_size)
+                    if events is None:
+                        break
+                    for event in events:
+                        yield event
+            if stream.finished:
+                return
+
+        sess = session or self.session
+        async with sess.get(self.telemetry_url, headers={'Accept': 'application/json'}) as resp:
+            if stream.cache is not None:
+                await _run_blocking(stream.start_download, resp.status)
+            try:
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    events = stream.feed(chunk) if stream.writer is None else \
+                        await _run_blocking(stream.feed, chunk)
+                    for event in events:
+                        yield event
+                events = stream.close()
+            except BaseException:
+                stream.discard()
+                raise
+        if stream.writer is not None:
+            await _run_blocking(stream.commit)
+        for event in events:
+            yield event
+
 
 class Match(MatchBase):
     """
     Extends :class:`MatchBase` to add :meth:`get_telemetry`
     """
-    def __init__(self, data, session, included=None):
-        super().__init__(data, session, included)
+    def __init__(self, data, session, included=None, lazy=False, client=None):
+        super().__init__(data, session, included, lazy, client)
 
     def __repr__(self):
         return "<Match: id={0.id} region={0.region}>".format(self)
@@ -357,22 +673,74 @@ class Match(MatchBase):
         `dict`
             Match telemetry data
         """
+        cache = self._telemetry_cache
+        if cache is not None:
+            raw = cache.get(self.telemetry_url)
+            if raw is not None:
+                return self._json_loads(raw)
+
         sess = session or self.session
         with sess.get(self.telemetry_url, headers={'Accept': 'application/json'}) as resp:
-            data = resp.json()
+            raw = resp.content
+            if cache is not None and resp.status_code == 200:
+                cache.set(self.telemetry_url, raw)
+        data = self._json_loads(raw)
 
         # After understanding the telemetry structure, to provide it as usable data is going to be a tough ordeal,
         # but one that can be looked into later
         return data
 
+    def iter_telemetry(self, session=None, chunk_size: int=65536):
+        """
+        Iterate over a match's telemetry events as they are downloaded, without loading the whole file first.
+
+        .. _requests.Session: http://docs.python-requests.org/en/master/api/#request-sessions
+
+        Parameters
+        ----------
+        session : Optional[requests.Session_]
+            Optional session to use to request telemetry data.
+        chunk_size : Optional[int]
+            Number of bytes to read from the response at a time.
+
+        Yields
+        ------
+        `dict`
+            A single telemetry event
+        """
+        stream = _TelemetryStream(self._telemetry_cache, self.telemetry_url)
+        fp = stream.open_cached()
+        if fp is not None:
+            with fp:
+                while not stream.finished:
+                    events = stream.read_cached(fp, chunk_size)
+                    if events is None:
+                        break
+                    yield from events
+            if stream.finished:
+                return
+
+        sess = session or self.session
+        with sess.get(self.telemetry_url, headers={'Accept': 'application/json'}, stream=True) as resp:
+            stream.start_download(resp.status_code)
+            try:
+                for chunk in resp.iter_content(chunk_size):
+                    yield from stream.feed(chunk)
+                events = stream.close()
+            except BaseException:
+                stream.discard()
+                raise
+        stream.commit()
+        yield from events
+
 
 class Paginator:
     """
     Returned only by pyvainglory's client classes.
     """
-    __slots__ = ['matches', 'next_url', 'first_url', 'client', 'prev_url', 'offset']
+    __slots__ = ['matches', 'next_url', 'first_url', 'client', 'prev_url', 'offset', 'lazy']
 
-    def __init__(self, matches, data, client):
+    def __init__(self, matches, data, client, lazy=False):
         self.matches = matches
         self.next_url = data.get('next')
         self.first_url = data.get('first')
@@ -382,6 +750,7 @@ class Paginator:
             self.offset = self.offset[0]
         self.prev_url = data.get('prev')
         self.client = client
+        self.lazy = lazy
 
     def __getitem__(self, item):
         return self.matches[item]
@@ -399,22 +768,99 @@ class AsyncMatchPaginator(Paginator):
     matches : list(:class:`AsyncMatch`)
         A list of matches.
     """
-    def __init__(self, matches, data, client):
-        super().__init__(matches, data, client)
+    def __init__(self, matches, data, client, lazy=False):
+        super().__init__(matches, data, client, lazy)
 
     def __repr__(self):
         return "<AsyncMatchPaginator: offset={} next={} prev={}>".format(self.offset, bool(self.next_url),
                                                                          bool(self.prev_url))
 
-    async def _matchmaker(self, url, sess=None):
-        data = await self.client.gen_req("{}matches".format(url), session=sess)
+    def __aiter__(self):
+        return self.iter_all()
+
+    async def _fetch_page(self, url, sess=None):
+        # Pagination links are complete URLs, query included
+        data = await self.client.gen_req(url, session=sess)
+        included = _index_included(data['included'])
         matches = []
         for match in data['data']:
-            matches.append(AsyncMatch(match, self.client.session, data['included']))
-        print(matches)
-        self.__init__(matches, data['links'], self.client)
+            matches.append(_shared_match(AsyncMatch, match, self.client.session, included, self.lazy, self.client))
+        return matches, data['links']
+
+    async def _matchmaker(self, url, sess=None):
+        matches, links = await self._fetch_page(url, sess)
+        self.__init__(matches, links, self.client, self.lazy)
         return matches
 
+    async def iter_all(self, prefetch: int=1, max_buffered: int=None, session=None):
+        """
+        Iterate over every match from the current page to the last one, while the following pages are
+        requested in the background. This is also what ``async for match in paginator`` does.
+
+        The paginator itself stays on its current page.
+
+        .. _aiohttp.ClientSession: https://aiohttp.readthedocs.io/en/stable/client_reference.html#client-session
+
+        Parameters
+        ----------
+        prefetch : Optional[int]
+            The most pages to have requested ahead of the one being iterated over.
+        max_buffered : Optional[int]
+            Stop requesting pages ahead while at least this many matches are waiting to be iterated over.
+        session : Optional[aiohttp.ClientSession_]
+            Optional session to use to make the requests.
+
+        Yields
+        ------
+        :class:`AsyncMatch`
+        """
+        # Imported here so that the synchronous client doesn't pay for importing asyncio
+        import asyncio
+
+        pages = asyncio.Queue()
+        space = asyncio.Condition()
+        done = object()
+        buffered = {'pages': 0, 'matches': 0}
+
+        def has_space():
+            return buffered['pages'] < max(1, prefetch) and (max_buffered is None or
+                                                             buffered['matches'] < max_buffered)
+
+        async def producer():
+            url = self.next_url
+            try:
+                while url:
+                    async with space:
+                        await space.wait_for(has_space)
+                    matches, links = await self._fetch_page(url, session)
+                    buffered['pages'] += 1
+                    buffered['matches'] += len(matches)
+                    await pages.put(matches)
+                    url = links.get('next')
+            except Exception as exc:
+                await pages.put(exc)
+            else:
+                await pages.put(done)
+
+        task = asyncio.ensure_future(producer())
+        try:
+            for match in self.matches:
+                yield match
+            while True:
+                matches = await pages.get()
+                if matches is done:
+                    break
+                if isinstance(matches, Exception):
+                    raise matches
+                async with space:
+                    buffered['pages'] -= 1
+                    buffered['matches'] -= len(matches)
+                    space.notify_all()
+                for match in matches:
+                    yield match
+        finally:
+            task.cancel()
+
     async def next(self, session=None):
         """
         Move to the next page of matches.
@@ -502,22 +948,85 @@ class MatchPaginator(Paginator):
     matches : list(:class:`Match`)
         A list of matches.
     """
-    def __init__(self, matches, data, client):
-        super().__init__(matches, data, client)
+    def __init__(self, matches, data, client, lazy=False):
+        super().__init__(matches, data, client, lazy)
 
     def __repr__(self):
         return "<MatchPaginator: offset={} next={} prev={}>".format(self.offset, bool(self.next_url),
                                                                     bool(self.prev_url))
 
-    def _matchmaker(self, url, sess=None):
-        data = self.client.gen_req("{}matches".format(url), session=sess)
+    def _fetch_page(self, url, sess=None):
+        # Pagination links are complete URLs, query included
+        data = self.client.gen_req(url, session=sess)
+        included = _index_included(data['included'])
         matches = []
         for match in data['data']:
-            matches.append(Match(match, self.client.session, data['included']))
-        print(matches)
-        self.__init__(matches, data['links'], self.client)
+            matches.append(_shared_match(Match, match, self.client.session, included, self.lazy, self.client))
+        return matches, data['links']
+
+    def _matchmaker(self, url, sess=None):
+        matches, links = self._fetch_page(url, sess)
+        self.__init__(matches, links, self.client, self.lazy)
         return matches
 
+    def iter_all(self, prefetch: int=1, session=None):
+        """
+        Iterate over every match from the current page to the last one, while a worker thread requests and
+        builds the following pages. Pages are let go of as soon as they have been iterated over.
+
+        The paginator itself stays on its current page.
+
+        .. _requests.Session: http://docs.python-requests.org/en/master/api/#request-sessions
+
+        Parameters
+        ----------
+        prefetch : Optional[int]
+            The most pages to have ready ahead of the one being iterated over.
+        session : Optional[requests.Session_]
+            Optional session to use to make the requests.
+
+        Yields
+        ------
+        :class:`Match`
+        """
+        pages = queue.Queue(maxsize=max(1, prefetch))
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def worker():
+            url = self.next_url
+            try:
+                while url and not stop.is_set():
+                    matches, links = self._fetch_page(url, session)
+                    put(matches)
+                    url = links.get('next')
+            except Exception as exc:
+                put(exc)
+            else:
+                put(done)
+
+        thread = threading.Thread(target=worker, name='pyvainglory-prefetch', daemon=True)
+        thread.start()
+        try:
+            yield from self.matches
+            while True:
+                matches = pages.get()
+                if matches is done:
+                    break
+                if isinstance(matches, Exception):
+                    raise matches
+                yield from matches
+        finally:
+            stop.set()
+
     def next(self, session=None):
         """
         Move to the next page of matches.
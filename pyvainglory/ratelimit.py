@@ -0,0 +1,134 @@
+import time
+import threading
+
+
+def _header_float(headers, name):
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    A token bucket that spaces out requests to stay within the API key's rate limit.
+
+    The bucket starts out with `limit` requests per `period` seconds and then learns the real limit and the
+    number of requests remaining from the 'X-RateLimit-*' headers of every response.
+    Requests that would go over the limit are made to wait for a token instead of failing with a 429.
+
+    The same instance can be passed to any number of :class:`pyvainglory.client.Client` and
+    :class:`pyvainglory.asyncclient.AsyncClient` instances, and is safe to use from several threads,
+    :meth:`for_key` returns one shared instance per API key.
+
+    Parameters
+    ----------
+    limit : Optional[int]
+        Requests allowed per `period` until the headers say otherwise, defaults to 10.
+    period : Optional[float]
+        Length of the rate limit window in seconds, defaults to 60.
+    retries : Optional[int]
+        How many times to wait and resend a request that still got a 429.
+
+    Attributes
+    ----------
+    waited : float
+        Total seconds requests have been made to wait for.
+    """
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, limit: int=10, period: float=60.0, retries: int=3):
+        self.limit = limit
+        self.period = period
+        self.retries = retries
+        self.tokens = float(limit)
+        self.waited = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<RateLimiter: limit={0.limit} period={0.period} tokens={0.tokens:.2f}>".format(self)
+
+    @classmethod
+    def for_key(cls, key, **kwargs):
+        """
+        Get the rate limiter shared by every client using `key`, creating it with `kwargs` if needed.
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None:
+                limiter = cls._shared[key] = cls(**kwargs)
+            return limiter
+
+    @property
+    def rate(self):
+        return self.limit / self.period
+
+    def _refill(self, now):
+        self.tokens = min(float(self.limit), self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self):
+        """
+        Take a token for a request.
+
+        Returns
+        -------
+        float
+            Seconds the caller has to wait before sending the request, 0 if it can be sent right away.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            delay = -self.tokens / self.rate
+            self.waited += delay
+            return delay
+
+    def _reset_delay(self, reset):
+        # Depending on the API version 'X-RateLimit-Reset' is either a UNIX timestamp, in seconds or nanoseconds,
+        # or the time until the reset, in nanoseconds or seconds. Only values within a day of now are taken for
+        # timestamps, values under a million, which would be less than a millisecond away as nanoseconds, are
+        # seconds, ex: 60, and anything else, ex: 2e9 for a reset two seconds away, is nanoseconds
+        now = time.time()
+        if abs(reset / 1e9 - now) < 86400:
+            reset = reset / 1e9 - now
+        elif abs(reset - now) < 86400:
+            reset = reset - now
+        elif reset >= 1e6:
+            reset = reset / 1e9
+        return min(max(reset, 0.0), self.period)
+
+    def update(self, headers, status: int=None):
+        """
+        Learn from a response's rate limit headers.
+
+        Parameters
+        ----------
+        headers : Mapping
+            The response's headers.
+        status : Optional[int]
+            The response's status code, a 429 empties the bucket.
+        """
+        limit = _header_float(headers, 'X-RateLimit-Limit')
+        remaining = _header_float(headers, 'X-RateLimit-Remaining')
+        reset = _header_float(headers, 'X-RateLimit-Reset')
+        retry_after = _header_float(headers, 'Retry-After')
+        with self._lock:
+            self._refill(time.monotonic())
+            if limit:
+                self.limit = int(limit)
+            if remaining is not None:
+                # The server doesn't know about requests still in flight, so only ever lower the count
+                self.tokens = min(self.tokens, remaining)
+            if status == 429 or remaining == 0:
+                if retry_after is not None:
+                    delay = min(retry_after, self.period)
+                elif reset is not None:
+                    delay = self._reset_delay(reset)
+                else:
+                    delay = 1 / self.rate
+                # Make the next token available once the window resets, after any requests already waiting
+                self.tokens = 1 - delay * self.rate + min(self.tokens, 0.0)
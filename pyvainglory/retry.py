@@ -0,0 +1,79 @@
+import random
+import threading
+
+from .errors import VGServerException
+from .errors import RateLimitException
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again, used by both clients' `gen_req`.
+
+    Delays grow exponentially with each attempt, with full jitter so that many clients failing at once don't
+    retry in lockstep, and a server provided 'Retry-After' is honoured when it asks for a longer wait.
+
+    Parameters
+    ----------
+    max_attempts : Optional[int]
+        Total number of times a request is sent, including the first one, defaults to 3.
+    backoff : Optional[float]
+        Delay in seconds before the first retry, doubled for every retry after it.
+    max_backoff : Optional[float]
+        The most a single delay can be, in seconds.
+    jitter : Optional[bool]
+        Pick a random delay between 0 and the exponential delay, instead of the exponential delay itself.
+    retry_on : Optional[tuple(Exception)]
+        Exception classes that can be retried,
+        defaults to :class:`pyvainglory.errors.VGServerException` and :class:`pyvainglory.errors.RateLimitException`.
+    respect_retry_after : Optional[bool]
+        Wait at least as long as the response's 'Retry-After' header asks.
+
+    Attributes
+    ----------
+    retries : int
+        Number of requests that have been retried, including 429s a client's rate limiter resent.
+    slept : float
+        Total seconds spent waiting between attempts, including waits for the rate limiter.
+    """
+    def __init__(self, max_attempts: int=3, backoff: float=0.5, max_backoff: float=30.0, jitter: bool=True,
+                 retry_on: tuple=(VGServerException, RateLimitException), respect_retry_after: bool=True):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+        self.respect_retry_after = respect_retry_after
+        self.retries = 0
+        self.slept = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<RetryPolicy: max_attempts={0.max_attempts} retries={0.retries} slept={0.slept:.2f}>".format(self)
+
+    def should_retry(self, exc, attempt: int):
+        """
+        Check if a request that failed with `exc` on its `attempt`'th try should be sent again.
+        """
+        return attempt < self.max_attempts and isinstance(exc, self.retry_on)
+
+    def delay(self, exc, attempt: int):
+        """
+        Get the seconds to wait before retrying a request that failed with `exc` on its `attempt`'th try,
+        and count the retry.
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        retry_after = getattr(exc, 'retry_after', None)
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, retry_after)
+        self.record(1, delay)
+        return delay
+
+    def record(self, retries: int=0, slept: float=0.0):
+        """
+        Count retries and waits decided outside of this policy, ex: by a client's rate limiter.
+        """
+        with self._lock:
+            self.retries += retries
+            self.slept += slept
@@ -0,0 +1,164 @@
+import array
+import itertools
+
+from .export import ColumnTable, MatchExporter, export_matches
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _participants(data):
+    """
+    Internal function to get a participant :class:`pyvainglory.export.ColumnTable` out of what was passed in.
+    """
+    if isinstance(data, MatchExporter):
+        return data.participants
+    if isinstance(data, ColumnTable):
+        return data
+    return export_matches(data).participants
+
+
+def _factorize(table, by):
+    """
+    Internal function to give every distinct combination of the `by` columns an integer code,
+    in order of first appearance.
+
+    This isn't vectorized with numpy, which can only factorize by sorting, a few times slower than hashing for
+    columns of strings like these. Values are hashed into a `dict` and mapped to their codes instead,
+    which runs without a Python level loop.
+    """
+    if isinstance(by, str):
+        by = (by,)
+    values = table[by[0]] if len(by) == 1 else list(zip(*(table[column] for column in by)))
+    keys = list(dict.fromkeys(values))
+    index = {key: code for code, key in enumerate(keys)}
+    return keys, array.array('q', map(index.__getitem__, values))
+
+
+def _group_sums(codes, groups, column):
+    """
+    Internal function to sum a numeric column per group, with numpy when it is installed.
+    """
+    if numpy is not None and len(codes):
+        weights = numpy.asarray(column, dtype=numpy.float64)
+        return numpy.bincount(numpy.frombuffer(codes, dtype=numpy.int64), weights=weights,
+                              minlength=groups).tolist()
+    sums = [0.0] * groups
+    for code, value in zip(codes, column):
+        sums[code] += value
+    return sums
+
+
+def group_stats(data, by=('actor',)):
+    """
+    Aggregate participant statistics per group, ex: win rate and KDA per hero.
+
+    Parameters
+    ----------
+    data : :class:`pyvainglory.export.MatchExporter`, :class:`pyvainglory.export.ColumnTable` or iterable
+        Exported matches, a participant table or matches to export first.
+    by : Optional[str or tuple(str)]
+        Participant table columns to group on, ex: 'actor', 'game_mode', 'patch', 'region', 'skin'.
+
+    Returns
+    -------
+    `dict`
+        Group -> `dict` with 'games', 'wins', 'win_rate', 'kills', 'deaths', 'assists', 'kda',
+        'avg_kills', 'avg_deaths', 'avg_assists', 'avg_gold' and 'avg_farm'.
+        Groups are a single value when grouping on one column and a `tuple` otherwise.
+    """
+    table = _participants(data)
+    keys, codes = _factorize(table, by)
+    groups = len(keys)
+    games = _group_sums(codes, groups, array.array('d', [1.0]) * len(codes))
+    sums = {column: _group_sums(codes, groups, table[column])
+            for column in ('won', 'kills', 'deaths', 'assists', 'gold', 'farm')}
+    stats = {}
+    for code, key in enumerate(keys):
+        count = games[code]
+        kills, deaths, assists = sums['kills'][code], sums['deaths'][code], sums['assists'][code]
+        stats[key] = {
+            'games': int(count),
+            'wins': int(sums['won'][code]),
+            'win_rate': sums['won'][code] / count,
+            'kills': int(kills),
+            'deaths': int(deaths),
+            'assists': int(assists),
+            'kda': (kills + assists) / max(deaths, 1),
+            'avg_kills': kills / count,
+            'avg_deaths': deaths / count,
+            'avg_assists': assists / count,
+            'avg_gold': sums['gold'][code] / count,
+            'avg_farm': sums['farm'][code] / count
+        }
+    return stats
+
+
+def build_stats(data, by=('actor',)):
+    """
+    How often each item ends up in a final build, and how often those builds win, per group.
+
+    Parameters
+    ----------
+    data : :class:`pyvainglory.export.MatchExporter`, :class:`pyvainglory.export.ColumnTable` or iterable
+        Exported matches, a participant table or matches to export first.
+    by : Optional[str or tuple(str)]
+        Participant table columns to group on, an empty tuple for one overall group.
+
+    Returns
+    -------
+    `dict`
+        Group -> `dict` of item name -> `dict` with 'games', 'wins', 'win_rate' and 'pick_rate',
+        the share of the group's participants that had the item in their final build.
+        Each group's items are ordered from most to least picked.
+    """
+    table = _participants(data)
+    if by:
+        keys, codes = _factorize(table, by)
+    else:
+        keys, codes = [()], array.array('q', [0]) * len(table['id'])
+    groups = len(keys)
+    builds = table['final_build']
+    items = list(dict.fromkeys(itertools.chain.from_iterable(builds)))
+    index = {item: code for code, item in enumerate(items)}
+    if numpy is not None and items:
+        rows = numpy.repeat(numpy.arange(len(builds)), numpy.fromiter(map(len, builds), numpy.int64, len(builds)))
+        cells = rows * len(items) + numpy.fromiter(map(index.__getitem__, itertools.chain.from_iterable(builds)),
+                                                   numpy.int64, len(rows))
+        # The same item bought twice only counts once per participant
+        cells.sort()
+        rows, item_codes = numpy.divmod(cells[numpy.concatenate(([True], cells[1:] != cells[:-1]))], len(items))
+        # Turn every (group, item) pair into one code so a single bincount counts them all
+        pairs = numpy.frombuffer(codes, dtype=numpy.int64)[rows] * len(items) + item_codes
+        won = numpy.asarray(table['won'], dtype=numpy.float64)[rows]
+        pair_games = numpy.bincount(pairs, minlength=groups * len(items))
+        pair_wins = numpy.bincount(pairs, weights=won, minlength=groups * len(items))
+        totals = numpy.bincount(numpy.frombuffer(codes, dtype=numpy.int64), minlength=groups).tolist()
+        picked = numpy.flatnonzero(pair_games)
+        picked = picked[numpy.argsort(-pair_games[picked], kind='stable')]
+        counts = [(divmod(pair, len(items)), games, int(wins)) for pair, games, wins in
+                  zip(picked.tolist(), pair_games[picked].tolist(), pair_wins[picked].tolist())]
+    else:
+        totals = [0] * groups
+        entries = {}
+        for code, won, build in zip(codes, table['won'], builds):
+            totals[code] += 1
+            for item in set(build):
+                entry = entries.get((code, index[item]))
+                if entry is None:
+                    entry = entries[code, index[item]] = [0, 0]
+                entry[0] += 1
+                entry[1] += won
+        counts = sorted(((pair, games, wins) for pair, (games, wins) in entries.items()),
+                        key=lambda entry: -entry[1])
+    stats = {key: {} for key in keys}
+    for (code, item), games, wins in counts:
+        stats[keys[code]][items[item]] = {
+            'games': games,
+            'wins': wins,
+            'win_rate': wins / games,
+            'pick_rate': games / totals[code]
+        }
+    return stats
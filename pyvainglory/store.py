@@ -0,0 +1,346 @@
+import sys
+import json
+import sqlite3
+import datetime
+
+from .models import Player, Match, games_played, current_elo, _region_tuples, _game_mode_tuples
+
+_schema = """
+CREATE TABLE IF NOT EXISTS matches (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    duration INTEGER,
+    game_mode TEXT,
+    patch TEXT,
+    region TEXT,
+    game_end_reason TEXT,
+    telemetry_url TEXT
+);
+CREATE TABLE IF NOT EXISTS rosters (
+    id TEXT PRIMARY KEY,
+    match_id TEXT NOT NULL,
+    position INTEGER,
+    region TEXT,
+    side TEXT,
+    won INTEGER,
+    aces INTEGER,
+    gold REAL,
+    hero_kills INTEGER,
+    krakens_captured INTEGER,
+    turret_kills INTEGER,
+    turrets_remaining INTEGER
+);
+CREATE TABLE IF NOT EXISTS participants (
+    id TEXT PRIMARY KEY,
+    match_id TEXT NOT NULL,
+    roster_id TEXT,
+    position INTEGER,
+    player_id TEXT,
+    actor TEXT,
+    region TEXT,
+    skin TEXT,
+    kills INTEGER,
+    deaths INTEGER,
+    assists INTEGER,
+    gold REAL,
+    farm REAL,
+    minion_kills INTEGER,
+    jungle_kills INTEGER,
+    crystal_mines_captured INTEGER,
+    gold_mines_captured INTEGER,
+    krakens_captured INTEGER,
+    turrets_captured INTEGER,
+    first_time_afk INTEGER,
+    items_bought TEXT,
+    items_sold TEXT,
+    items_used TEXT,
+    final_build TEXT
+);
+CREATE TABLE IF NOT EXISTS players (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    region TEXT,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS matches_created_at ON matches (created_at);
+CREATE INDEX IF NOT EXISTS matches_patch ON matches (patch);
+CREATE INDEX IF NOT EXISTS rosters_match_id ON rosters (match_id);
+CREATE INDEX IF NOT EXISTS participants_match_id ON participants (match_id);
+CREATE INDEX IF NOT EXISTS participants_player_id ON participants (player_id);
+CREATE INDEX IF NOT EXISTS participants_actor ON participants (actor);
+CREATE INDEX IF NOT EXISTS players_name ON players (name);
+"""
+
+_participant_columns = ('kills', 'deaths', 'assists', 'gold', 'farm', 'minion_kills', 'jungle_kills',
+                        'crystal_mines_captured', 'gold_mines_captured', 'krakens_captured', 'turrets_captured')
+
+_player_attributes = ('elo_history', 'karma_level', 'account_level', 'lifetime_gold', 'games_played', 'skill_tier',
+                      'win_streak', 'wins', 'xp', 'guild_tag', 'current_elo')
+
+_time_format = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _chunks(items, size=500):
+    items = list(items)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class MatchStore:
+    """
+    A local SQLite database of matches, their rosters and participants, and players.
+
+    Matches are written in bulk, in WAL mode so readers aren't blocked while a crawl writes,
+    and indexed on player ID, actor, created_at and patch, so lookups like a player's latest matches
+    don't need a request to the API. Matches read back are full :class:`pyvainglory.models.Match` objects.
+
+    .. _aiohttp.ClientSession: https://aiohttp.readthedocs.io/en/stable/client_reference.html#client-session
+    .. _requests.Session: http://docs.python-requests.org/en/master/api/#request-sessions
+
+    Parameters
+    ----------
+    path : str
+        The database file, ':memory:' for a throwaway in-memory database.
+    match_class : Optional[type]
+        The class matches are read back as, ex: :class:`pyvainglory.models.AsyncMatch`.
+    session : Optional[aiohttp.ClientSession_ or requests.Session_]
+        Session the matches read back use to request their telemetry.
+    client : Optional[:class:`pyvainglory.client.Client` or :class:`pyvainglory.asyncclient.AsyncClient`]
+        Client the matches read back are attached to.
+    """
+    def __init__(self, path, match_class=Match, session=None, client=None):
+        self.path = path
+        self.match_class = match_class
+        self.session = session if session is not None or client is None else client.session
+        self.client = client
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_schema)
+
+    def __repr__(self):
+        return "<MatchStore: path={0.path} matches={1}>".format(self, len(self))
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+    def __contains__(self, match_id):
+        return self.connection.execute("SELECT 1 FROM matches WHERE id = ?", (match_id,)).fetchone() is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def add_matches(self, matches):
+        """
+        Write matches, along with their rosters, participants and participants' player IDs,
+        replacing any already stored with the same IDs.
+
+        Parameters
+        ----------
+        matches : iterable(:class:`pyvainglory.models.MatchBase`)
+        """
+        match_rows, roster_rows, participant_rows, player_rows = [], [], [], []
+        for match in matches:
+            match_rows.append((match.id, match.created_at.strftime(_time_format), match.duration, match.game_mode[0],
+                               match.patch, match.region[0], match.game_end_reason, match.telemetry_url))
+            participants = [(None, position, participant)
+                            for position, participant in enumerate(match.spectators)]
+            for position, roster in enumerate(match.rosters):
+                roster_rows.append((roster.id, match.id, position, roster.region[0], roster.side, roster.won,
+                                    roster.aces, roster.gold, roster.hero_kills, roster.krakens_captured,
+                                    roster.turret_kills, roster.turrets_remaining))
+                participants += [(roster.id, index, participant)
+                                 for index, participant in enumerate(roster.participants)]
+            for roster_id, position, p in participants:
+                player_id = p.player.id if p.player else None
+                participant_rows.append(
+                    (p.id, match.id, roster_id, position, player_id, p.actor, p.region[0], p.skin) +
+                    tuple(getattr(p, column) for column in _participant_columns) +
+                    (p.first_time_afk, json.dumps(p.items_bought), json.dumps(p.items_sold), json.dumps(p.items_used),
+                     json.dumps(p.final_build)))
+                if player_id is not None:
+                    player_rows.append((player_id,))
+        with self.connection:
+            # Rosters and participants a match no longer has would be left behind by replacing only the current ones
+            match_ids = [(row[0],) for row in match_rows]
+            self.connection.executemany("DELETE FROM rosters WHERE match_id = ?", match_ids)
+            self.connection.executemany("DELETE FROM participants WHERE match_id = ?", match_ids)
+            self.connection.executemany("INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?)", match_rows)
+            self.connection.executemany("INSERT OR REPLACE INTO rosters VALUES "
+                                        "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", roster_rows)
+            self.connection.executemany("INSERT OR REPLACE INTO participants VALUES ({})".format(
+                ', '.join('?' * 24)), participant_rows)
+            self.connection.executemany("INSERT OR IGNORE INTO players (id) VALUES (?)", player_rows)
+
+    def add_players(self, players):
+        """
+        Write players' full info, ex: from :meth:`pyvainglory.client.Client.get_players`.
+
+        Parameters
+        ----------
+        players : iterable(:class:`pyvainglory.models.Player`)
+        """
+        rows = []
+        for player in players:
+            if not hasattr(player, 'name'):
+                # Players seen through a match only have an ID, which add_matches already stores
+                rows.append((player.id, None, None, None))
+                continue
+            data = {attr: getattr(player, attr) for attr in _player_attributes if hasattr(player, attr)}
+            rows.append((player.id, player.name, player.region[0], json.dumps(data)))
+        with self.connection:
+            self.connection.executemany("INSERT INTO players VALUES (?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+                                        "name = COALESCE(excluded.name, name), "
+                                        "region = COALESCE(excluded.region, region), "
+                                        "data = COALESCE(excluded.data, data)", rows)
+
+    def get_match(self, match_id):
+        """
+        Get a stored match by its ID.
+
+        Returns
+        -------
+        :class:`pyvainglory.models.Match` or None
+        """
+        matches = self._load("SELECT * FROM matches WHERE id = ?", (match_id,))
+        return matches[0] if matches else None
+
+    def matches_for_player(self, player_id, limit: int=100):
+        """
+        Get a player's latest stored matches, newest first.
+
+        Parameters
+        ----------
+        player_id : str
+        limit : Optional[int]
+
+        Returns
+        -------
+        list(:class:`pyvainglory.models.Match`)
+        """
+        return self._load("SELECT m.* FROM matches m WHERE m.id IN "
+                          "(SELECT match_id FROM participants WHERE player_id = ?) "
+                          "ORDER BY m.created_at DESC LIMIT ?", (player_id, limit))
+
+    def find_matches(self, actor: str=None, patch: str=None, after=None, before=None, game_mode: str=None,
+                     region: str=None, limit: int=100):
+        """
+        Get stored matches matching all the provided filters, newest first.
+
+        .. _datetime.datetime: https://docs.python.org/3.6/library/datetime.html#datetime-objects
+
+        Parameters
+        ----------
+        actor : Optional[str]
+            Only matches with a participant playing this actor, ex: '*Ringo*'.
+        patch : Optional[str]
+        after : Optional[str or datetime.datetime_]
+            Only matches created at or after this time, if an str is provided it should follow the **iso8601** format.
+        before : Optional[str or datetime.datetime_]
+            Only matches created before this time, if an str is provided it should follow the **iso8601** format.
+        game_mode : Optional[str]
+            The gamemode code, ex: 'ranked'.
+        region : Optional[str]
+            The region code, ex: 'na'.
+        limit : Optional[int]
+
+        Returns
+        -------
+        list(:class:`pyvainglory.models.Match`)
+        """
+        where, args = [], []
+        if actor is not None:
+            where.append("m.id IN (SELECT match_id FROM participants WHERE actor = ?)")
+            args.append(actor)
+        for column, value in (('patch', patch), ('game_mode', game_mode), ('region', region)):
+            if value is not None:
+                where.append("m.{} = ?".format(column))
+                args.append(value)
+        for op, value in (('>=', after), ('<', before)):
+            if value is not None:
+                if isinstance(value, datetime.datetime):
+                    value = value.strftime(_time_format)
+                where.append("m.created_at {} ?".format(op))
+                args.append(value)
+        query = "SELECT m.* FROM matches m"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        return self._load(query + " ORDER BY m.created_at DESC LIMIT ?", args + [limit])
+
+    def get_player(self, player_id):
+        """
+        Get a stored player by their ID.
+
+        Returns
+        -------
+        :class:`pyvainglory.models.Player` or None
+        """
+        row = self.connection.execute("SELECT * FROM players WHERE id = ?", (player_id,)).fetchone()
+        return self._player(*row) if row else None
+
+    @staticmethod
+    def _player(player_id, name, region, data):
+        player = Player({'id': player_id})
+        if name is not None:
+            player.name = name
+            player.region = _region_tuples[region]
+            for attr, value in json.loads(data).items():
+                setattr(player, attr, value)
+            player.elo_history = {int(season): elo for season, elo in player.elo_history.items()}
+            player.karma_level = tuple(player.karma_level)
+            player.games_played = games_played(*player.games_played)
+            if hasattr(player, 'current_elo'):
+                player.current_elo = current_elo(*player.current_elo)
+        return player
+
+    def _load(self, query, args):
+        """
+        Internal function to rebuild the matches selected by `query`, with two more queries per 500 matches.
+        """
+        match_rows = self.connection.execute(query, args).fetchall()
+        rosters, participants = {}, {}
+        for ids in _chunks(row[0] for row in match_rows):
+            marks = ', '.join('?' * len(ids))
+            for row in self.connection.execute("SELECT * FROM participants WHERE match_id IN ({}) "
+                                               "ORDER BY position".format(marks), ids):
+                participants.setdefault(row[2] or row[1], []).append(self._participant(row))
+            for row in self.connection.execute("SELECT * FROM rosters WHERE match_id IN ({}) "
+                                               "ORDER BY position".format(marks), ids):
+                rosters.setdefault(row[1], []).append(self._roster(row, participants.get(row[0], ())))
+        matches = []
+        for match_id, created_at, duration, game_mode, patch, region, end_reason, telemetry_url in match_rows:
+            attributes = (match_id, datetime.datetime.strptime(created_at, _time_format), duration,
+                          _game_mode_tuples[game_mode], sys.intern(patch), _region_tuples[region],
+                          sys.intern(end_reason), telemetry_url)
+            # Spectators are keyed by their match, since they aren't part of a roster
+            snapshot = tuple(rosters.get(match_id, ())), tuple(participants.get(match_id, ()))
+            matches.append(self.match_class._from_snapshot(attributes, snapshot, self.session, self.client))
+        return matches
+
+    @staticmethod
+    def _roster(row, participants):
+        """
+        Internal function to turn a roster's row into the snapshot :class:`pyvainglory.models.Roster` is built from.
+        """
+        roster_id, _, _, region, side, won, aces, gold, hero_kills, krakens, turret_kills, turrets_remaining = row
+        return (roster_id, _region_tuples[region], aces, gold, hero_kills, krakens, sys.intern(side), turret_kills,
+                turrets_remaining, bool(won), tuple(participants))
+
+    @staticmethod
+    def _participant(row):
+        """
+        Internal function to turn a participant's row into the snapshot :class:`pyvainglory.models.Participant`
+        is built from.
+        """
+        (participant_id, _, _, _, player_id, actor, region, skin, kills, deaths, assists, gold, farm, minion_kills,
+         jungle_kills, crystal_mines, gold_mines, krakens, turrets, first_time_afk) = row[:20]
+        # Item names were already translated when stored, and dicts keep their order through JSON
+        items = tuple((tuple(counts), tuple(counts.values())) for counts in map(json.loads, row[20:23]))
+        return (participant_id, sys.intern(actor), _region_tuples[region], assists, crystal_mines, deaths, farm,
+                bool(first_time_afk), gold, gold_mines, items, list(map(sys.intern, json.loads(row[23]))),
+                jungle_kills, kills, krakens, minion_kills, sys.intern(skin), turrets, player_id)
@@ -0,0 +1,388 @@
+import re
+import json
+import array
+import bisect
+import codecs
+import datetime
+
+_whitespace = re.compile(r'[ \t\n\r]*')
+
+
+class TelemetryParser:
+    """
+    An incremental parser for telemetry files, which are a single JSON array of events.
+
+    Chunks of the file are passed to :meth:`feed` as they arrive, and every event that has been fully
+    received is returned right away, only the incomplete tail of the data is kept around in between.
+    """
+    __slots__ = ['_decoder', '_text_decoder', '_buffer', '_started', '_finished']
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._started = False
+        self._finished = False
+
+    def feed(self, chunk):
+        """
+        Feed the next chunk of the telemetry file to the parser.
+
+        Parameters
+        ----------
+        chunk : bytes or str
+
+        Returns
+        -------
+        `list`
+            A list of `dict` events completed by this chunk, possibly empty.
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        self._buffer += chunk
+        return self._parse(False)
+
+    def close(self):
+        """
+        Signal that the whole file has been fed.
+
+        Returns
+        -------
+        `list`
+            A list of any `dict` events that were still left in the buffer.
+
+        Raises
+        ------
+        ValueError
+            The data fed to the parser wasn't a complete JSON array.
+        """
+        self._buffer += self._text_decoder.decode(b'', final=True)
+        events = self._parse(True)
+        if not self._finished:
+            raise ValueError("Telemetry data ended before the closing ']' of the event list")
+        return events
+
+    def _parse(self, final):
+        buf = self._buffer
+        end = len(buf)
+        pos = 0
+        events = []
+        while True:
+            pos = _whitespace.match(buf, pos).end()
+            if pos >= end:
+                break
+            if self._finished:
+                raise ValueError("Unexpected data after the end of the telemetry event list")
+            char = buf[pos]
+            if not self._started:
+                if char != '[':
+                    raise ValueError("Telemetry data should be a JSON array of events")
+                self._started = True
+                pos += 1
+            elif char == ']':
+                self._finished = True
+                pos += 1
+            elif char == ',':
+                pos += 1
+            else:
+                try:
+                    event, event_end = self._decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A value running right up to the end of the buffer may still be cut short, ex: a number
+                if event_end >= end and not final:
+                    break
+                events.append(event)
+                pos = event_end
+        self._buffer = buf[pos:]
+        return events
+
+
+def _parse_time(text):
+    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%SZ"):
+        try:
+            time = datetime.datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if time.tzinfo is None:
+            time = time.replace(tzinfo=datetime.timezone.utc)
+        return time
+    raise ValueError("'{}' is not a recognised telemetry timestamp".format(text))
+
+
+class EventTable:
+    """
+    All telemetry events of a single type, stored column by column.
+
+    Numeric payload values are stored in `array.array('d')` columns, with `nan` where an event lacks the value,
+    string values such as actors, teams, items and abilities are stored as `array.array('l')` columns of codes
+    into :attr:`Telemetry.strings`, with -1 where an event lacks the value, and `[x, y, z]` lists such as
+    'Position' are split into 'Position.x', 'Position.y' and 'Position.z' numeric columns.
+    Any other value is kept in a plain `list` column.
+    Being `array.array` instances, columns can also be handed to numpy with `numpy.frombuffer` without a copy.
+
+    Attributes
+    ----------
+    type : str
+        The event type, ex: 'KillActor', 'BuyItem'.
+    time : array.array('d')
+        Seconds since the first event of the match, for each event.
+    columns : dict
+        Payload key -> column.
+    """
+    __slots__ = ['type', 'time', 'columns', 'telemetry', '_ordered', '_indexes']
+
+    def __init__(self, type, time, columns, telemetry):
+        self.type = type
+        self.time = time
+        self.columns = columns
+        self.telemetry = telemetry
+        self._ordered = all(a <= b for a, b in zip(time, time[1:]))
+        self._indexes = {}
+
+    def __len__(self):
+        return len(self.time)
+
+    def __repr__(self):
+        return "<EventTable: type={0.type} events={1}>".format(self, len(self))
+
+    def column(self, name, rows=None):
+        """
+        Get the values of a column, with string codes translated back to strings.
+
+        Parameters
+        ----------
+        name : str
+            The payload key, ex: 'Actor', 'Position.x'.
+        rows : Optional[list(int)]
+            Row indices to return values for, ex: from :meth:`select`, defaults to every row.
+
+        Returns
+        -------
+        `list`
+        """
+        col = self.columns[name]
+        if rows is not None:
+            col = [col[row] for row in rows]
+        if _is_codes(self.columns[name]):
+            strings = self.telemetry.strings
+            return [strings[code] if code >= 0 else None for code in col]
+        return list(col)
+
+    def _code_rows(self, name):
+        """
+        Internal method to get a string column's code -> rows index, built the first time the column is filtered on.
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            index = self._indexes[name] = {}
+            for row, code in enumerate(self.columns[name]):
+                rows = index.get(code)
+                if rows is None:
+                    rows = index[code] = array.array('l')
+                rows.append(row)
+        return index
+
+    def select(self, after: float=None, before: float=None, **filters):
+        """
+        Find the events matching the provided filters.
+
+        String columns are indexed by code the first time they're filtered on, so instead of going through every
+        row, the rows holding the rarest of the strings filtered on are looked up, and only those are checked
+        against the time range and the other filters.
+
+        Parameters
+        ----------
+        after : Optional[float]
+            Only match events at or after this many seconds into the match.
+        before : Optional[float]
+            Only match events before this many seconds into the match.
+        filters
+            Payload key -> value the column has to be equal to, ex: ``Actor='*Ringo*'``.
+
+        Returns
+        -------
+        `list`
+            A list of row indices.
+        """
+        indexed, checks = [], []
+        for name, value in filters.items():
+            col = self.columns.get(name)
+            if col is None:
+                return []
+            if _is_codes(col):
+                value = self.telemetry.code(value)
+                if value < 0:
+                    return []
+                indexed.append((self._code_rows(name).get(value, ()), col, value))
+            else:
+                checks.append((col, value))
+
+        time = self.time
+        if self._ordered:
+            start = 0 if after is None else bisect.bisect_left(time, after)
+            stop = len(time) if before is None else bisect.bisect_left(time, before)
+            rows = range(start, stop)
+        else:
+            rows = range(len(time))
+        if indexed:
+            indexed.sort(key=lambda entry: len(entry[0]))
+            rows_of = indexed[0][0]
+            checks += [(col, value) for _, col, value in indexed[1:]]
+            # Rows in the index are in order, so the time range is a slice of them when times are too
+            rows = rows_of[bisect.bisect_left(rows_of, rows.start):bisect.bisect_left(rows_of, rows.stop)]
+        if not self._ordered and (after is not None or before is not None):
+            rows = [row for row in rows
+                    if (after is None or time[row] >= after) and (before is None or time[row] < before)]
+        for col, value in checks:
+            rows = [row for row in rows if col[row] == value]
+        return list(rows)
+
+
+class Telemetry:
+    """
+    A match's telemetry events, grouped by type into :class:`EventTable` column stores.
+
+    Can be built straight from :meth:`Match.iter_telemetry`, without keeping the event dicts around::
+
+        telemetry = Telemetry(match.iter_telemetry())
+        kills = telemetry['KillActor']
+        rows = kills.select(after=600, Actor='*Ringo*')
+
+    Parameters
+    ----------
+    events : iterable(dict)
+        Telemetry events, in the order they appear in the telemetry file.
+
+    Attributes
+    ----------
+    start : datetime.datetime
+        Time of the first event, all event times are relative to this.
+    strings : list(str)
+        Every distinct string value seen in event payloads, indexed by string codes.
+    tables : dict
+        Event type -> :class:`EventTable`.
+    """
+    __slots__ = ['start', 'strings', 'tables', '_codes']
+
+    def __init__(self, events):
+        self.start = None
+        self.strings = []
+        self.tables = {}
+        self._codes = {}
+        times = {}
+        builders = {}
+        for event in events:
+            stamp = event['time']
+            offset = times.get(stamp)
+            if offset is None:
+                time = _parse_time(stamp)
+                if self.start is None:
+                    self.start = time
+                offset = times[stamp] = (time - self.start).total_seconds()
+            builder = builders.get(event['type'])
+            if builder is None:
+                builder = builders[event['type']] = _TableBuilder()
+            builder.add(offset, event.get('payload') or {}, self)
+        for type, builder in builders.items():
+            self.tables[type] = builder.build(type, self)
+
+    def __getitem__(self, type):
+        return self.tables[type]
+
+    def __contains__(self, type):
+        return type in self.tables
+
+    def __iter__(self):
+        return iter(self.tables.values())
+
+    def __repr__(self):
+        return "<Telemetry: start={0.start} types={1}>".format(self, len(self.tables))
+
+    def code(self, string):
+        """
+        Get the code a string is stored as in string columns, -1 if it doesn't appear in this telemetry.
+        """
+        return self._codes.get(string, -1)
+
+    def _intern(self, string):
+        code = self._codes.get(string)
+        if code is None:
+            code = self._codes[string] = len(self.strings)
+            self.strings.append(string)
+        return code
+
+
+class _TableBuilder:
+    """
+    Internal class to collect one event type's columns before they're frozen into an :class:`EventTable`.
+    """
+    __slots__ = ['time', 'columns', 'kinds']
+
+    def __init__(self):
+        self.time = array.array('d')
+        self.columns = {}
+        self.kinds = {}
+
+    def _column(self, name, kind):
+        col = self.columns.get(name)
+        if col is None:
+            # Events before this one didn't have the key, pad them
+            missing = len(self.time) - 1
+            col = self.columns[name] = _new_column(kind, missing)
+            self.kinds[name] = kind
+        return col, self.kinds[name]
+
+    def add(self, offset, payload, telemetry):
+        self.time.append(offset)
+        for key, value in payload.items():
+            if isinstance(value, list) and len(value) == 3 and all(isinstance(v, (int, float)) for v in value):
+                for axis, v in zip('xyz', value):
+                    col, kind = self._column('{}.{}'.format(key, axis), 'num')
+                    _append(col, kind, v, telemetry)
+                continue
+            if isinstance(value, (int, float)):
+                kind = 'num'
+            elif isinstance(value, str):
+                kind = 'str'
+            else:
+                kind = 'obj'
+            col, kind = self._column(key, kind)
+            _append(col, kind, value, telemetry)
+        # Pad columns this event didn't have a value for
+        length = len(self.time)
+        for name, col in self.columns.items():
+            if len(col) < length:
+                col.append(_missing[self.kinds[name]])
+
+    def build(self, type, telemetry):
+        return EventTable(type, self.time, self.columns, telemetry)
+
+
+def _is_codes(col):
+    return isinstance(col, array.array) and col.typecode == 'l'
+
+
+_missing = {'num': float('nan'), 'str': -1, 'obj': None}
+
+
+def _new_column(kind, missing):
+    if kind == 'num':
+        return array.array('d', [_missing['num']]) * missing
+    elif kind == 'str':
+        return array.array('l', [-1]) * missing
+    return [None] * missing
+
+
+def _append(col, kind, value, telemetry):
+    if kind == 'num':
+        try:
+            col.append(float(value))
+        except (TypeError, ValueError):
+            col.append(_missing['num'])
+    elif kind == 'str':
+        col.append(telemetry._intern(value if isinstance(value, str) else str(value)))
+    else:
+        col.append(value)
@@ -0,0 +1,62 @@
+import os
+import json
+import tempfile
+import threading
+
+
+class WatermarkStore:
+    """
+    Keeps the high-water mark of each incremental sync, used by the clients' `sync_matches`.
+
+    A watermark is a `dict` holding the newest 'created_at' seen for a query, as an iso8601 `str`, and 'seen',
+    the IDs of the matches created at exactly that time, so they can be told apart from newer ones on the next sync.
+    This base class keeps them in memory, subclasses can persist them by overriding :meth:`get` and :meth:`set`.
+    """
+    def __init__(self):
+        self._marks = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """
+        Get the watermark for a query, or `None` if it has never been synced.
+        """
+        with self._lock:
+            return self._marks.get(key)
+
+    def set(self, key: str, mark: dict):
+        """
+        Store the watermark for a query.
+        """
+        with self._lock:
+            self._marks[key] = mark
+
+
+class FileWatermarkStore(WatermarkStore):
+    """
+    A :class:`WatermarkStore` kept in a JSON file, rewritten atomically every time a watermark moves.
+
+    Parameters
+    ----------
+    path : str
+        The file to keep watermarks in, it is created on the first sync if it doesn't exist.
+    """
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        try:
+            with open(path) as fp:
+                self._marks = json.load(fp)
+        except FileNotFoundError:
+            pass
+
+    def set(self, key: str, mark: dict):
+        with self._lock:
+            self._marks[key] = mark
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as fp:
+                    json.dump(self._marks, fp)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.remove(tmp)
+                raise
@@ -15,7 +15,7 @@ setup(
         "aiohttp",
         "requests"
     ],
-    python_requires='>=3.5',
+    python_requires='>=3.7',
     package_data={
         '': ['data/*.json', 'data/localization/*.ini']
     }
@@ -0,0 +1,216 @@
+"""
+Fixtures shared by the tests, synthetic API payloads and a local stand-in for the API's /status endpoint.
+"""
+import uuid
+import types
+import random
+import asyncio
+import datetime
+import threading
+
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pyvainglory import const
+
+_actors = ['*Adagio*', '*Ardan*', '*Catherine*', '*Celeste*', '*Glaive*', '*Joule*', '*Koshka*', '*Krul*',
+           '*Petal*', '*Ringo*', '*Skaarf*', '*Taka*']
+
+
+def _uuid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128)))
+
+
+def _item_counts(rng, count):
+    keys = rng.sample(sorted(const.items), count)
+    # Some item keys come wrapped in stars, like actors do
+    return {'*{}*'.format(key) if rng.random() < 0.5 else key: rng.randint(1, 3) for key in keys}
+
+
+def _participant(rng, items, player_id):
+    return {
+        'type': 'participant',
+        'id': _uuid(rng),
+        'attributes': {
+            'actor': rng.choice(_actors),
+            'shardId': 'na',
+            'stats': {
+                'assists': rng.randint(0, 20),
+                'crystalMineCaptures': rng.randint(0, 3),
+                'deaths': rng.randint(0, 12),
+                'farm': rng.random() * 150,
+                'firstAfkTime': -1 if rng.random() < 0.95 else 1,
+                'gold': rng.randint(1000, 20000),
+                'goldMineCaptures': rng.randint(0, 3),
+                'itemGrants': _item_counts(rng, items),
+                'itemSells': _item_counts(rng, max(1, items // 4)),
+                'itemUses': _item_counts(rng, max(1, items // 4)),
+                'items': [const.items[key] for key in rng.sample(sorted(const.items), 6)],
+                'jungleKills': rng.randint(0, 60),
+                'kills': rng.randint(0, 15),
+                'krakenCaptures': rng.randint(0, 2),
+                'minionKills': rng.randint(0, 250),
+                'skinKey': rng.choice(sorted(const.skins)),
+                'turretCaptures': rng.randint(0, 5)
+            }
+        },
+        'relationships': {'player': {'data': {'type': 'player', 'id': player_id or _uuid(rng)}}}
+    }
+
+
+def _match(rng, participants, items, players):
+    """
+    A match and everything it references, as (match, included).
+    """
+    included, rosters = [], []
+    for side, won in (('left/blue', 'true'), ('right/red', 'false')):
+        members = [_participant(rng, items, rng.choice(players) if players else None) for _ in range(participants)]
+        included.extend(members)
+        roster = {
+            'type': 'roster',
+            'id': _uuid(rng),
+            'attributes': {
+                'shardId': 'na',
+                'won': won,
+                'stats': {'acesEarned': rng.randint(0, 3), 'gold': rng.randint(20000, 60000),
+                          'heroKills': rng.randint(0, 40), 'krakenCaptures': rng.randint(0, 2), 'side': side,
+                          'turretKills': rng.randint(0, 5), 'turretsRemaining': rng.randint(0, 5)}
+            },
+            'relationships': {
+                'participants': {'data': [{'type': 'participant', 'id': member['id']} for member in members]}
+            }
+        }
+        included.append(roster)
+        rosters.append({'type': 'roster', 'id': roster['id']})
+    asset = {'type': 'asset', 'id': _uuid(rng), 'attributes': {'name': 'telemetry'}}
+    asset['attributes']['URL'] = 'https://example.com/assets/{}/telemetry.json'.format(asset['id'])
+    included.append(asset)
+    created_at = datetime.datetime(2018, 1, 1) + datetime.timedelta(seconds=rng.randint(0, 86400 * 30))
+    data = {
+        'type': 'match',
+        'id': _uuid(rng),
+        'attributes': {
+            'createdAt': created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            'duration': rng.randint(900, 2400),
+            'gameMode': rng.choice(['ranked', 'casual', 'blitz_pvp_ranked']),
+            'patchVersion': rng.choice(['2.10', '2.11', '2.12']),
+            'shardId': 'na',
+            'stats': {'endGameReason': rng.choice(['victory', 'surrender'])}
+        },
+        'relationships': {
+            'assets': {'data': [{'type': 'asset', 'id': asset['id']}]},
+            'rosters': {'data': rosters},
+            'spectators': {'data': []}
+        }
+    }
+    return data, included
+
+
+def match_response(participants=3, items=8, seed=0):
+    """
+    A /matches/{id} response.
+    """
+    data, included = _match(random.Random(seed), participants, items, None)
+    return {'data': data, 'included': included}
+
+
+def matches_page(matches=50, participants=3, items=8, players=None, seed=0):
+    """
+    A /matches response, participants' players are drawn from a pool of `players` if provided.
+    """
+    rng = random.Random(seed)
+    pool = [_uuid(rng) for _ in range(players)] if players else None
+    data, included = [], []
+    for _ in range(matches):
+        match_data, match_included = _match(rng, participants, items, pool)
+        data.append(match_data)
+        included.extend(match_included)
+    return {'data': data, 'included': included, 'links': {}, 'meta': {}}
+
+
+def telemetry(events=500, seed=0):
+    """
+    A telemetry file's events.
+    """
+    rng = random.Random(seed)
+    start = datetime.datetime(2018, 1, 1)
+    return [{'time': (start + datetime.timedelta(seconds=n)).strftime("%Y-%m-%dT%H:%M:%S+0000"),
+             'type': rng.choice(['BuyItem', 'UseAbility', 'DealDamage', 'KillActor']),
+             'payload': {'Team': rng.choice(['Left', 'Right']), 'Actor': rng.choice(_actors),
+                         'Damage': rng.randint(1, 800)}}
+            for n in range(events)]
+
+
+@pytest.fixture(scope='session')
+def payloads():
+    return types.SimpleNamespace(match_response=match_response, matches_page=matches_page, telemetry=telemetry)
+
+
+class StatusServer:
+    """
+    A local stand-in for the API's /status endpoint, that can be told to fail the next requests.
+
+    Attributes
+    ----------
+    requests : dict
+        Route name -> requests received.
+    """
+    def __init__(self):
+        self.requests = {}
+        self._failures = []
+        self._loop = asyncio.new_event_loop()
+        self._thread = None
+        self._server = None
+
+    def configure(self, client):
+        """
+        Point a client at this server, returns the client.
+        """
+        url = str(self._server.make_url('')).rstrip('/')
+        client.base_url = url + '/shards/{}/'
+        client.status_url = url + '/status'
+        return client
+
+    def fail_next(self, count: int=1, status: int=503):
+        """
+        Answer the next `count` requests with `status`, ex: 429.
+        """
+        self._failures += [status] * count
+
+    async def _status(self, request):
+        self.requests['status'] = self.requests.get('status', 0) + 1
+        if self._failures:
+            return web.json_response({'errors': [{'title': 'Injected error'}]}, status=self._failures.pop(0))
+        return web.json_response({'data': {'type': 'info', 'id': 'gamelocker',
+                                           'attributes': {'releasedAt': '2018-01-01T00:00:00Z',
+                                                          'version': 'mock'}}})
+
+    def start(self):
+        app = web.Application()
+        app.router.add_get('/status', self._status)
+        ready = threading.Event()
+
+        def serve():
+            asyncio.set_event_loop(self._loop)
+            self._server = TestServer(app)
+            self._loop.run_until_complete(self._server.start_server())
+            ready.set()
+            self._loop.run_forever()
+        self._thread = threading.Thread(target=serve, daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._server.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+@pytest.fixture(scope='module')
+def server():
+    server = StatusServer().start()
+    yield server
+    server.stop()
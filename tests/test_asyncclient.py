@@ -0,0 +1,34 @@
+import asyncio
+
+import aiohttp
+
+from pyvainglory.asyncclient import AsyncClient
+
+
+def _gather(server, sessions):
+    async def run():
+        client = server.configure(AsyncClient('key'))
+        opened = [aiohttp.ClientSession() for _ in range(sessions - 1)]
+        try:
+            return await asyncio.gather(*[client.gen_req(client.status_url, session=session)
+                                          for session in [None, None] + opened])
+        finally:
+            for session in opened + [client.session]:
+                await session.close()
+    before = server.requests.get('status', 0)
+    results = asyncio.run(run())
+    return results, server.requests['status'] - before
+
+
+def test_coalesced_callers_get_their_own_copy(server):
+    (first, second), sent = _gather(server, 1)
+    assert sent == 1
+    assert first == second and first is not second
+    first['data']['id'] = 'changed'
+    assert second['data']['id'] == 'gamelocker'
+
+
+def test_requests_are_coalesced_per_session(server):
+    results, sent = _gather(server, 2)
+    assert sent == 2
+    assert results[0] == results[1] == results[2]
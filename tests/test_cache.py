@@ -0,0 +1,182 @@
+import os
+import asyncio
+import json
+import gzip
+import time
+
+import pytest
+
+from pyvainglory.cache import TelemetryCache, ResponseCache, MemoryCache
+from pyvainglory.client import Client
+from pyvainglory.asyncclient import AsyncClient
+from pyvainglory.models import Match, AsyncMatch, _index_included
+
+
+class _Response:
+    def __init__(self, raw):
+        self.raw = raw
+        self.status_code = 200
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def iter_content(self, chunk_size):
+        return (self.raw[start:start + chunk_size] for start in range(0, len(self.raw), chunk_size))
+
+
+class _Session:
+    def __init__(self, raw):
+        self.raw = raw
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        return _Response(self.raw)
+
+
+class _AsyncContent:
+    def __init__(self, raw):
+        self.raw = raw
+
+    async def iter_chunked(self, chunk_size):
+        for start in range(0, len(self.raw), chunk_size):
+            yield self.raw[start:start + chunk_size]
+
+
+class _AsyncResponse:
+    def __init__(self, raw):
+        self.content = _AsyncContent(raw)
+        self.status = 200
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+class _AsyncSession(_Session):
+    def get(self, url, **kwargs):
+        self.requests += 1
+        return _AsyncResponse(self.raw)
+
+
+def _corrupt(cache, url, raw, truncate):
+    packed = gzip.compress(raw)
+    # Cut off part way through, or flip a byte of the compressed data, after some events can be read
+    packed = packed[:len(packed) // 2] if truncate else packed[:-100] + bytes([packed[-100] ^ 0xff]) + packed[-99:]
+    with open(cache._file(url), 'wb') as fp:
+        fp.write(packed)
+
+
+def test_evict_removes_stale_tmp_files(tmp_path):
+    cache = TelemetryCache(str(tmp_path), stale_after=60)
+    stale, live = tmp_path / 'stale.tmp', tmp_path / 'live.tmp'
+    stale.write_bytes(b'x' * 100)
+    live.write_bytes(b'x' * 100)
+    old = time.time() - 120
+    os.utime(str(stale), (old, old))
+    cache.evict()
+    assert not stale.exists()
+    assert live.exists()
+
+
+def test_tmp_files_count_towards_max_size(tmp_path):
+    cache = TelemetryCache(str(tmp_path), max_size=1000)
+    cache.set('https://example.com/a.json', os.urandom(800))
+    (tmp_path / 'live.tmp').write_bytes(b'x' * 500)
+    cache.evict()
+    assert cache.get('https://example.com/a.json') is None
+
+
+def test_commits_only_scan_past_max_size(tmp_path, monkeypatch):
+    scans = []
+    evict = TelemetryCache.evict
+    monkeypatch.setattr(TelemetryCache, 'evict', lambda self: scans.append(1) or evict(self))
+    cache = TelemetryCache(str(tmp_path), max_size=10000, rescan_every=1000)
+    for n in range(5):
+        cache.set('https://example.com/{}.json'.format(n), os.urandom(1000))
+    # Only the first commit scans, to get the size total
+    assert len(scans) == 1
+    for n in range(5, 15):
+        cache.set('https://example.com/{}.json'.format(n), os.urandom(1000))
+    assert 1 < len(scans) < 10
+    assert sum(os.path.getsize(str(file)) for file in tmp_path.iterdir()) <= 10000
+
+
+def test_commits_rescan_every_n_writes(tmp_path, monkeypatch):
+    scans = []
+    evict = TelemetryCache.evict
+    monkeypatch.setattr(TelemetryCache, 'evict', lambda self: scans.append(1) or evict(self))
+    cache = TelemetryCache(str(tmp_path), rescan_every=3)
+    for n in range(7):
+        cache.set('https://example.com/{}.json'.format(n), b'{}')
+    assert len(scans) == 3
+
+
+def test_set_discards_failed_writes(tmp_path):
+    cache = TelemetryCache(str(tmp_path))
+    with pytest.raises(TypeError):
+        cache.set('https://example.com/a.json', 'not bytes')
+    assert os.listdir(str(tmp_path)) == []
+
+
+@pytest.mark.parametrize('truncate', [True, False])
+def test_iter_telemetry_falls_back_on_corrupt_file(tmp_path, payloads, truncate):
+    events = payloads.telemetry(500)
+    raw = json.dumps(events).encode()
+    response = payloads.match_response()
+    cache = TelemetryCache(str(tmp_path))
+    session = _Session(raw)
+    match = Match(response['data'], session, _index_included(response['included']),
+                  client=Client('key', telemetry_cache=cache))
+    _corrupt(cache, match.telemetry_url, raw, truncate)
+
+    assert list(match.iter_telemetry(chunk_size=4096)) == events
+    assert session.requests == 1
+    assert cache.misses == 1 and cache.hits == 0
+    assert cache.get(match.telemetry_url) == raw
+
+
+@pytest.mark.parametrize('truncate', [True, False])
+def test_async_iter_telemetry_falls_back_on_corrupt_file(tmp_path, payloads, truncate):
+    events = payloads.telemetry(500)
+    raw = json.dumps(events).encode()
+    response = payloads.match_response()
+    cache = TelemetryCache(str(tmp_path))
+    session = _AsyncSession(raw)
+
+    async def run():
+        client = AsyncClient('key', session=session, telemetry_cache=cache)
+        match = AsyncMatch(response['data'], session, _index_included(response['included']), client=client)
+        _corrupt(cache, match.telemetry_url, raw, truncate)
+        streamed = [event async for event in match.iter_telemetry(chunk_size=4096)]
+        # Served from the cache the second time
+        cached = [event async for event in match.iter_telemetry(chunk_size=4096)]
+        return streamed, cached
+    streamed, cached = asyncio.run(run())
+    assert streamed == events and cached == events
+    assert session.requests == 1
+    assert cache.misses == 1 and cache.hits == 1
+
+
+def test_response_cache_needs_storage():
+    with pytest.raises(TypeError):
+        ResponseCache()
+
+    class Incomplete(ResponseCache):
+        def load(self, key):
+            return None
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_memory_cache_keeps_match_responses():
+    cache = MemoryCache(max_size=100)
+    url = 'https://api.dc01.gamelockerapp.com/shards/na/matches/abc'
+    cache.set(url, None, {'data': {}}, 10)
+    assert cache.get(url) == {'data': {}}
+    assert cache.get('https://api.dc01.gamelockerapp.com/shards/na/matches') is None
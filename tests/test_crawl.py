@@ -0,0 +1,54 @@
+import types
+import random
+import datetime
+
+from pyvainglory.client import Client
+from pyvainglory.errors import NotFoundException
+
+
+class _Paginator:
+    def __init__(self, selected, limit):
+        self.matches = selected[:limit]
+        self.next_url = 'next' if len(selected) > limit else None
+        self._selected = selected
+
+    def iter_all(self):
+        return iter(self._selected)
+
+
+def _client(monkeypatch, matches):
+    requests = []
+
+    def get_matches(limit=None, after=None, before=None, **kwargs):
+        requests.append((after, before))
+        selected = [match for match in matches if after <= match.created_at <= before]
+        if not selected:
+            raise NotFoundException('Not Found')
+        return _Paginator(selected, limit)
+    client = Client('key')
+    monkeypatch.setattr(client, 'get_matches', get_matches)
+    return client, requests
+
+
+def _matches(count, days, seconds=1):
+    rng = random.Random(0)
+    start = datetime.datetime(2018, 1, 1)
+    created = sorted(start + datetime.timedelta(seconds=rng.randrange(0, 86400 * days, seconds)) for _ in range(count))
+    return [types.SimpleNamespace(id=str(n), created_at=at) for n, at in enumerate(created)]
+
+
+def test_crawl_keeps_the_pages_it_splits(monkeypatch):
+    matches = _matches(2000, 7)
+    client, requests = _client(monkeypatch, matches)
+    found = client.crawl_matches('2018-01-01T00:00:00Z', '2018-01-08T00:00:00Z', 'na', limit=50)
+    assert [match.id for match in found] == [match.id for match in matches]
+    # About one request per page, and not one per page for every level of splitting
+    assert len(requests) < 2000 // 50 * 1.5
+
+
+def test_crawl_pages_through_matches_in_one_second(monkeypatch):
+    matches = [types.SimpleNamespace(id=str(n), created_at=datetime.datetime(2018, 1, 1)) for n in range(30)]
+    client, requests = _client(monkeypatch, matches)
+    found = client.crawl_matches('2017-12-31T23:59:59Z', '2018-01-01T00:00:01Z', 'na', limit=5,
+                                 min_window=datetime.timedelta(0))
+    assert len(found) == 30
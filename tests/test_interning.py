@@ -0,0 +1,71 @@
+import gc
+import json
+import tracemalloc
+
+from pyvainglory import decoder
+from pyvainglory.models import Match, _index_included
+
+
+def _copy(string):
+    # A new, equal string object, like one decoded from a response without interning
+    return (string + '.')[:-1]
+
+
+def _unshare(matches):
+    """
+    Give every model its own copy of the strings and tuples interning makes them share.
+    """
+    for match in matches:
+        match.patch, match.game_end_reason = _copy(match.patch), _copy(match.game_end_reason)
+        match.region, match.game_mode = tuple(map(_copy, match.region)), tuple(map(_copy, match.game_mode))
+        for roster in match.rosters:
+            roster.side, roster.region = _copy(roster.side), tuple(map(_copy, roster.region))
+            for participant in roster.participants:
+                participant.actor, participant.skin = _copy(participant.actor), _copy(participant.skin)
+                participant.region = tuple(map(_copy, participant.region))
+                participant.final_build = list(map(_copy, participant.final_build))
+
+
+def _build(raws):
+    matches = []
+    for raw in raws:
+        data = decoder.loads(raw)
+        matches += [Match(match, None, _index_included(data['included'])) for match in data['data']]
+    return matches
+
+
+def _raws(payloads, count, pages):
+    return [json.dumps(payloads.matches_page(count, participants=3, items=8, players=count, seed=seed)).encode()
+            for seed in range(pages)]
+
+
+def test_interning_reduces_retained_memory(payloads):
+    raws = _raws(payloads, 50, 2)
+    # Build once first, so lazily loaded catalogs aren't counted
+    _build(raws[:1])
+    gc.collect()
+    tracemalloc.start()
+    try:
+        matches = _build(raws)
+        gc.collect()
+        interned = tracemalloc.get_traced_memory()[0]
+        # The baseline, the same matches with every model holding its own copies
+        _unshare(matches)
+        gc.collect()
+        plain = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert interned < plain * 0.9
+
+
+def test_matches_share_interned_strings(payloads):
+    # Every page is decoded separately, so equal strings only end up shared through interning
+    first, second = (_build([raw]) for raw in _raws(payloads, 5, 1) * 2)
+    for match, other in zip(first, second):
+        assert match.patch is other.patch and match.region is other.region and match.game_mode is other.game_mode
+        for roster, other_roster in zip(match.rosters, other.rosters):
+            assert roster.side is other_roster.side
+            for participant, other_participant in zip(roster.participants, other_roster.participants):
+                assert participant.actor is other_participant.actor
+                assert all(item is other for item, other in zip(participant.final_build,
+                                                                other_participant.final_build))
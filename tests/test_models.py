@@ -0,0 +1,57 @@
+import gc
+import json
+import tracemalloc
+
+import pytest
+
+from pyvainglory import decoder
+from pyvainglory.models import Match, _index_included
+
+
+def _retained(raws, lazy, keep=None, hydrate=False):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        matches = []
+        for raw in raws:
+            data = decoder.loads(raw)
+            included = _index_included(data['included'])
+            matches += [Match(match, None, included, lazy) for match in data['data']][:keep]
+        if hydrate:
+            for match in matches:
+                match.rosters
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture(scope='module')
+def raws(payloads):
+    raws = [json.dumps(payloads.matches_page(20, players=20, seed=seed)).encode() for seed in range(3)]
+    # Build one match first, so lazily loaded catalogs aren't counted
+    _retained(raws[:1], False)
+    return raws
+
+
+@pytest.mark.parametrize('keep', [None, 1])
+def test_lazy_retains_no_more_than_eager(raws, keep):
+    assert _retained(raws, True, keep) <= _retained(raws, False, keep)
+
+
+def test_hydrated_lazy_retains_no_more_than_eager(raws):
+    assert _retained(raws, True, hydrate=True) <= _retained(raws, False)
+
+
+def test_lazy_builds_the_same_match(payloads):
+    response = payloads.match_response()
+    eager, lazy = Match(response, None), Match(response, None, lazy=True)
+    assert lazy._rosters is None
+    for roster, lazy_roster in zip(eager.rosters, lazy.rosters):
+        assert (roster.id, roster.side, roster.won) == (lazy_roster.id, lazy_roster.side, lazy_roster.won)
+        for participant, lazy_participant in zip(roster.participants, lazy_roster.participants):
+            assert participant.items_bought == lazy_participant.items_bought
+            assert participant.items_used == lazy_participant.items_used
+            assert participant.final_build == lazy_participant.final_build
+            assert participant.player.id == lazy_participant.player.id
+    assert lazy._snapshot is None
@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from pyvainglory.ratelimit import RateLimiter
+
+
+@pytest.mark.parametrize('seconds', [0.5, 2.0, 9.0, 30.0])
+def test_reset_in_nanoseconds(seconds):
+    limiter = RateLimiter(limit=10, period=60.0)
+    assert limiter._reset_delay(seconds * 1e9) == pytest.approx(seconds)
+
+
+@pytest.mark.parametrize('seconds', [1, 5, 60])
+def test_reset_in_seconds(seconds):
+    limiter = RateLimiter(limit=10, period=60.0)
+    assert limiter._reset_delay(seconds) == pytest.approx(seconds)
+
+
+def test_reset_in_seconds_is_capped_at_the_period():
+    limiter = RateLimiter(limit=10, period=60.0)
+    assert limiter._reset_delay(3600) == 60.0
+
+
+@pytest.mark.parametrize('scale', [1, 1e9])
+def test_reset_as_timestamp(scale):
+    limiter = RateLimiter(limit=10, period=60.0)
+    assert limiter._reset_delay((time.time() + 5) * scale) == pytest.approx(5, abs=0.5)
+
+
+def test_seconds_reset_with_nothing_remaining():
+    limiter = RateLimiter(limit=10, period=60.0)
+    limiter.update({'X-RateLimit-Limit': '10', 'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '5'})
+    assert limiter.reserve() == pytest.approx(5.0, abs=0.1)
+
+
+def test_short_reset_with_nothing_remaining():
+    limiter = RateLimiter(limit=10, period=60.0)
+    limiter.update({'X-RateLimit-Limit': '10', 'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(2e9))})
+    assert limiter.reserve() == pytest.approx(2.0, abs=0.1)
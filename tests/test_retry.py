@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from pyvainglory.client import Client
+from pyvainglory.asyncclient import AsyncClient
+from pyvainglory.errors import RateLimitException
+from pyvainglory.ratelimit import RateLimiter
+from pyvainglory.retry import RetryPolicy
+
+
+def _clients_kwargs(max_attempts, retries):
+    policy = RetryPolicy(max_attempts=max_attempts, backoff=0.001, jitter=False)
+    return policy, {'retry_policy': policy, 'rate_limiter': RateLimiter(limit=6000, period=60.0, retries=retries)}
+
+
+@pytest.mark.parametrize('max_attempts, retries', [(3, 3), (5, 2), (1, 0)])
+def test_sync_resends_are_capped_and_counted(server, max_attempts, retries):
+    policy, kwargs = _clients_kwargs(max_attempts, retries)
+    client = server.configure(Client('key', **kwargs))
+    sends = max(max_attempts, retries + 1)
+    before = server.requests.get('status', 0)
+    server.fail_next(sends, 429)
+    with pytest.raises(RateLimitException):
+        client.get_status()
+    assert server.requests['status'] - before == sends
+    assert policy.retries == sends - 1
+
+
+@pytest.mark.parametrize('max_attempts, retries', [(3, 3), (5, 2), (1, 0)])
+def test_async_resends_are_capped_and_counted(server, max_attempts, retries):
+    policy, kwargs = _clients_kwargs(max_attempts, retries)
+    sends = max(max_attempts, retries + 1)
+
+    async def run():
+        client = server.configure(AsyncClient('key', **kwargs))
+        try:
+            with pytest.raises(RateLimitException):
+                await client.get_status()
+        finally:
+            await client.session.close()
+    before = server.requests.get('status', 0)
+    server.fail_next(sends, 429)
+    asyncio.run(run())
+    assert server.requests['status'] - before == sends
+    assert policy.retries == sends - 1
+
+
+def test_limiter_resend_succeeds(server):
+    policy, kwargs = _clients_kwargs(1, 3)
+    client = server.configure(Client('key', **kwargs))
+    server.fail_next(2, 429)
+    assert client.get_status()[1] == 'mock'
+    assert policy.retries == 2
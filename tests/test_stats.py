@@ -0,0 +1,75 @@
+import pytest
+
+from pyvainglory import stats
+from pyvainglory.export import export_matches
+from pyvainglory.models import Match, _index_included
+
+
+@pytest.fixture(scope='module')
+def table(payloads):
+    page = payloads.matches_page(200, items=8, players=100)
+    included = _index_included(page['included'])
+    return export_matches([Match(data, None, included) for data in page['data']]).participants
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(stats, 'numpy', None)
+    return request.param
+
+
+def _group(row, by):
+    return row[by[0]] if len(by) == 1 else tuple(row[column] for column in by)
+
+
+def _naive_group_stats(table, by):
+    totals = {}
+    for row in table.rows():
+        entry = totals.setdefault(_group(row, by), dict.fromkeys(('games', 'won', 'kills', 'deaths', 'assists',
+                                                                  'gold', 'farm'), 0))
+        entry['games'] += 1
+        for column in ('won', 'kills', 'deaths', 'assists', 'gold', 'farm'):
+            entry[column] += row[column]
+    return totals
+
+
+def _naive_build_stats(table, by):
+    totals, counts = {}, {}
+    for row in table.rows():
+        group = _group(row, by) if by else ()
+        totals[group] = totals.get(group, 0) + 1
+        for item in set(row['final_build']):
+            games, wins = counts.get((group, item), (0, 0))
+            counts[group, item] = games + 1, wins + row['won']
+    return totals, counts
+
+
+@pytest.mark.parametrize('by', [('actor',), ('actor', 'patch')])
+def test_group_stats_matches_naive_loop(table, backend, by):
+    result = stats.group_stats(table, by)
+    expected = _naive_group_stats(table, by)
+    assert set(result) == set(expected)
+    for group, entry in expected.items():
+        assert result[group]['games'] == entry['games']
+        assert result[group]['wins'] == entry['won']
+        assert result[group]['kills'] == entry['kills']
+        assert result[group]['avg_gold'] == pytest.approx(entry['gold'] / entry['games'])
+        assert result[group]['kda'] == pytest.approx((entry['kills'] + entry['assists']) / max(entry['deaths'], 1))
+
+
+@pytest.mark.parametrize('by', [('actor',), ('actor', 'patch'), ()])
+def test_build_stats_matches_naive_loop(table, backend, by):
+    result = stats.build_stats(table, by)
+    totals, counts = _naive_build_stats(table, by)
+    assert set(result) == set(totals)
+    assert sum(len(items) for items in result.values()) == len(counts)
+    for (group, item), (games, wins) in counts.items():
+        entry = result[group][item]
+        assert (entry['games'], entry['wins']) == (games, wins)
+        assert entry['pick_rate'] == pytest.approx(games / totals[group])
+    for items in result.values():
+        games = [entry['games'] for entry in items.values()]
+        assert games == sorted(games, reverse=True)
@@ -0,0 +1,39 @@
+from pyvainglory.models import Match
+from pyvainglory.store import MatchStore
+
+
+def _participants(match):
+    return [participant for roster in match.rosters for participant in roster.participants] + match.spectators
+
+
+def test_matches_read_back_like_they_were_stored(payloads):
+    match = Match(payloads.match_response(), None)
+    with MatchStore(':memory:') as store:
+        store.add_matches([match])
+        stored = store.get_match(match.id)
+    assert (stored.created_at, stored.game_mode, stored.region, stored.patch) == \
+        (match.created_at, match.game_mode, match.region, match.patch)
+    assert stored._snapshot is None
+    for roster, other in zip(match.rosters, stored.rosters):
+        assert (roster.id, roster.side, roster.won, roster.gold) == (other.id, other.side, other.won, other.gold)
+    for participant, other in zip(_participants(match), _participants(stored)):
+        assert (participant.id, participant.actor, participant.kills, participant.first_time_afk) == \
+            (other.id, other.actor, other.kills, other.first_time_afk)
+        assert participant.items_bought == other.items_bought and participant.final_build == other.final_build
+        assert participant.player.id == other.player.id
+
+
+def test_replacing_a_match_removes_its_old_rows(payloads):
+    match = Match(payloads.match_response(participants=3), None)
+    response = payloads.match_response(participants=2, seed=1)
+    response['data']['id'] = match.id
+    replacement = Match(response, None)
+    with MatchStore(':memory:') as store:
+        store.add_matches([match])
+        store.add_matches([replacement])
+        stored = store.get_match(match.id)
+        counts = [store.connection.execute("SELECT COUNT(*) FROM {} WHERE match_id = ?".format(table),
+                                           (match.id,)).fetchone()[0] for table in ('rosters', 'participants')]
+    assert counts == [2, 4]
+    assert [participant.id for participant in _participants(stored)] == \
+        [participant.id for participant in _participants(replacement)]
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from pyvainglory.telemetry import Telemetry
+
+
+def _naive_select(table, events, after=None, before=None, **filters):
+    rows = []
+    for row, (t, event) in enumerate(zip(table.time, events)):
+        if (after is None or t >= after) and (before is None or t < before) and \
+                all(event['payload'].get(name) == value for name, value in filters.items()):
+            rows.append(row)
+    return rows
+
+
+@pytest.fixture(params=['ordered', 'shuffled'])
+def events(request, payloads):
+    events = [event for event in payloads.telemetry(2000) if event['type'] == 'DealDamage']
+    if request.param == 'shuffled':
+        random.Random(0).shuffle(events)
+    return events
+
+
+@pytest.mark.parametrize('after, before, filters', [
+    (None, None, {}),
+    (100, 900, {}),
+    (None, 1500, {'Actor': '*Ringo*'}),
+    (300, None, {'Actor': '*Taka*', 'Team': 'Left'}),
+    (None, None, {'Damage': 400}),
+    (None, None, {'Actor': '*Nobody*'}),
+    (None, None, {'Missing': 1})
+])
+def test_select_matches_naive_loop(events, after, before, filters):
+    table = Telemetry(events)['DealDamage']
+    assert table.select(after, before, **filters) == _naive_select(table, events, after, before, **filters)